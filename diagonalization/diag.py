@@ -1,9 +1,18 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
 
+try:
+    from scipy.linalg import sqrtm as _sqrtm  # type: ignore
+except ImportError:  # SciPy is optional here; Takagi falls back to _sqrtm_via_eig
+    _sqrtm = None
+
 __all__ = ["SVD", "Takagi"]
 
+# Relative gap below which two nonzero singular values count as degenerate in
+# Takagi; the cheap phase correction is only valid for a non-degenerate spectrum.
+_DEGENERACY_RTOL = 1e-8
+
 
 def SVD(M: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
@@ -17,14 +26,27 @@ def SVD(M: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     U, s, Vh = np.linalg.svd(M, full_matrices=True)
     return U, s, Vh.conj().T
 
-def _sqrtm_via_eig(M: np.ndarray) -> np.ndarray:
+def _sqrtm_via_eig(M: np.ndarray, tol: float = 1e-12) -> np.ndarray:
     """
     Matrix square root for *normal* matrices (our use: unitary/symmetric blocks).
     Falls back to eigendecomposition: V diag(sqrt(w)) V^{-1}.
+
+    The diagonal factor is applied as a column scaling of V, and V^{-1} is
+    replaced by V^H when the eigenvectors come back unitary (the normal case),
+    otherwise by a linear solve instead of an explicit inverse.  Hermitian
+    input takes the `eigh` path, which is guaranteed to return unitary V.
     """
+    if np.allclose(M, M.conj().T, atol=1e-10, rtol=0):
+        w, V = np.linalg.eigh(M)
+        return (V * np.sqrt(w.astype(np.complex128))) @ V.conj().T
+
     w, V = np.linalg.eig(M)
-    S = np.diag(np.sqrt(w))  # principal branch
-    return V @ S @ np.linalg.inv(V)
+    VS = V * np.sqrt(w)  # principal branch, columns scaled by sqrt(w)
+    Vh = V.conj().T
+    if np.allclose(Vh @ V, np.eye(V.shape[0]), atol=tol, rtol=0):
+        return VS @ Vh
+    # VS @ V^{-1} == (V^{-T} @ VS^T)^T
+    return np.linalg.solve(V.T, VS.T).T
 
 def Takagi(
     A: np.ndarray,
@@ -32,7 +54,9 @@ def Takagi(
     svd_order: bool = True,
     tol: float = 1e-12,
     symmetrize: bool = False,
-) -> tuple[np.ndarray, np.ndarray]:
+    only_values: bool = False,
+    check_symmetric: bool = True,
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
     r"""
     Autonne–Takagi decomposition of a complex symmetric matrix.
 
@@ -54,13 +78,21 @@ def Takagi(
     symmetrize : bool, default False
         If True, project to the symmetric subspace via (A + A.T)/2 before factoring.
         If False, raise if A is not numerically symmetric.
+    only_values : bool, default False
+        If True, compute only the Takagi values and return ``(r, None)``; this
+        skips the singular vectors (`eigvalsh` / `svd(..., compute_uv=False)`).
+    check_symmetric : bool, default True
+        If False, skip the symmetry check for inputs that are symmetric by
+        construction.  The check itself compares the largest entry of
+        |A - A.T| against ``tol * max(1, max|A|)``.
 
     Returns
     -------
     r : (n,) float ndarray
         Nonnegative Takagi singular values (identical to the singular values of A).
-    U : (n, n) complex ndarray
-        Unitary Takagi factor so that A ≈ U @ diag(r) @ U.T.
+    U : (n, n) complex ndarray or None
+        Unitary Takagi factor so that A ≈ U @ diag(r) @ U.T; None if
+        `only_values` is set.
 
     Notes
     -----
@@ -69,8 +101,12 @@ def Takagi(
           A = U0 Σ V0* ,  Z := (V0* @ conj(U0)).T
           U = U0 sqrtm(Z)   (principal square root)
       so that A = U Σ U^T.
-    - Requires SciPy for the most robust `sqrtm`; otherwise a stable eigen fallback
-      is used (adequate here because Z is normal).
+    - When the nonzero singular values are non-degenerate, Z is diagonal and the
+      square root reduces to column phases (Houde et al., Alg. 1.1):
+          U = U0 diag(sqrt(d / r)),  d = diag(U0* A conj(U0)).
+      The result is kept only if it reconstructs A and stays unitary to `tol`.
+    - Degenerate spectra need the full `sqrtm`; SciPy is used when available,
+      otherwise a stable eigen fallback (adequate here because Z is normal).
     """
     A = np.asarray(A)
     if A.ndim != 2 or A.shape[0] != A.shape[1]:
@@ -81,18 +117,27 @@ def Takagi(
     if symmetrize:
         A = 0.5 * (A + A.T)
 
-    # Enforce symmetry unless explicitly projected
-    if np.linalg.norm(A - A.T) > tol:
+    # Enforce symmetry unless explicitly projected or waived by the caller
+    if check_symmetric and np.max(np.abs(A - A.T)) > tol * max(1.0, np.max(np.abs(A))):
         raise ValueError(
             "Input is not (numerically) symmetric; set symmetrize=True to project."
         )
 
     # Trivial zero case
     if np.allclose(A, 0, atol=tol, rtol=0):
-        return np.zeros(n, dtype=float), np.eye(n, dtype=complex)
+        return np.zeros(n, dtype=float), None if only_values else np.eye(n, dtype=complex)
+
+    is_real = np.max(np.abs(A.imag)) <= tol
+
+    if only_values:
+        if is_real:
+            r = np.sort(np.abs(np.linalg.eigvalsh(A.real)))[::-1]
+        else:
+            r = np.linalg.svd(A, compute_uv=False)  # descending
+        return (r if svd_order else r[::-1]), None
 
     # Fast real path via eigh
-    if np.max(np.abs(A.imag)) <= tol:
+    if is_real:
         A = A.real  # be explicit for eigh
         evals, Q = np.linalg.eigh(A)  # ascending
         r = np.abs(evals)
@@ -101,26 +146,40 @@ def Takagi(
         signs = np.sign(evals)
         signs[signs == 0] = 1.0
         phases = np.sqrt(signs.astype(np.complex128))
-        U = Q @ np.diag(phases)
 
+        # Reorder and apply the phases as a column scaling in one pass
         idx = np.argsort(r)[::-1] if svd_order else np.argsort(r)
-        return r[idx], U[:, idx]
+        return r[idx], Q[:, idx] * phases[idx]
 
     # General complex-symmetric case
     U0, r, Vh = np.linalg.svd(A, full_matrices=True)  # r is descending by default
-    Z = (Vh @ np.conjugate(U0)).T  # equals conj(U0.T @ V0); Z is symmetric & unitary
-
-    # Try SciPy sqrtm; fall back to eig-based sqrt if SciPy is unavailable
-    try:
-        from scipy.linalg import sqrtm  # type: ignore
-        S = sqrtm(Z)
-    except Exception:
-        S = _sqrtm_via_eig(Z)
-
-    U = U0 @ S
+    nonzero = r > tol
+
+    U = None
+    if np.all(-np.diff(r)[nonzero[1:]] > _DEGENERACY_RTOL * r[0]):
+        # Non-degenerate spectrum: Z is diagonal, so only the column phases of U0
+        # need fixing.  d_i = (U0^* A conj(U0))_ii = r_i z_i and U = U0 sqrt(z).
+        d = np.einsum("ji,jk,ki->i", U0.conj(), A, U0.conj())
+        phases = np.ones(n, dtype=np.complex128)
+        phases[nonzero] = np.sqrt(d[nonzero] / r[nonzero])
+        U = U0 * phases
+        # Z's off-diagonal part grows like eps / gap, so a nearly degenerate
+        # pair can pass the gap test yet leave U off by far more than tol;
+        # such cases take the sqrtm path below instead.
+        if np.max(np.abs(np.abs(phases) - 1.0)) > tol or np.max(
+            np.abs((U * r) @ U.T - A)
+        ) > tol * r[0]:
+            U = None
+    if U is None:
+        Z = (Vh @ np.conjugate(U0)).T  # equals conj(U0.T @ V0); Z is symmetric & unitary
+
+        # SciPy sqrtm when available; eig-based sqrt otherwise
+        S = _sqrtm(Z) if _sqrtm is not None else _sqrtm_via_eig(Z)
+
+        U = U0 @ S
 
     if not svd_order:  # return ascending instead of NumPy's default descending
         r = r[::-1]
         U = U[:, ::-1]
 
-    return np.real_if_close(r), U
+    return r, U  # svd already yields real float64 singular values
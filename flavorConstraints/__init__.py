@@ -9,6 +9,7 @@ from .muToEGamma import (
     PREFAC_BR,
     assert_perez_randall_lfv_m_kk_convention,
     check_mu_to_e_gamma,
+    check_mu_to_e_gamma_batch,
     check_mu_to_e_gamma_raw,
     coefficient_from_br_limit,
     default_m_kk_from_lambda_ir,
@@ -18,6 +19,7 @@ from .muToEGamma import (
 __all__ = [
     'check_mu_to_e_gamma',
     'check_mu_to_e_gamma_raw',
+    'check_mu_to_e_gamma_batch',
     'coefficient_from_br_limit',
     'default_m_kk_from_lambda_ir',
     'perez_randall_lfv_m_kk_from_lambda_ir',
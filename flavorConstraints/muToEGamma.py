@@ -116,7 +116,8 @@ def check_mu_to_e_gamma(
     C: float = C_PAPER,
     reference_scale: float = 3000.0,
     M_KK_override: Optional[float] = None,
-) -> Dict[str, Union[float, bool, complex, np.ndarray]]:
+    full_product: bool = True,
+) -> Dict[str, Union[float, bool, complex, np.ndarray, None]]:
     """Check the μ→eγ dipole constraint on the neutrino Yukawa.
 
     Parameters
@@ -131,6 +132,9 @@ def check_mu_to_e_gamma(
         If provided, use this value (GeV) for M_KK instead of the value stored
         in ``yukawa_result.params['M_KK']`` or, as a fallback, the repo's
         internal LFV convention ``M_KK = Lambda_IR``.
+    full_product : bool, optional
+        If False, only the (1,2) element is computed and ``product_matrix``
+        is returned as None.  Use this in scans that never read the matrix.
 
     Returns
     -------
@@ -145,8 +149,9 @@ def check_mu_to_e_gamma(
             lhs / rhs.  Values > 1 violate the bound.
         'off_diagonal_12' : complex
             The raw (1,2) matrix element before taking the absolute value.
-        'product_matrix' : np.ndarray
-            The full 3×3 Hermitian matrix Ȳ_N Ȳ_N†.
+        'product_matrix' : np.ndarray or None
+            The full 3×3 Hermitian matrix Ȳ_N Ȳ_N† (None unless
+            ``full_product``).
     """
     try:
         params = yukawa_result.params
@@ -165,11 +170,15 @@ def check_mu_to_e_gamma(
     # Build the rescaled Yukawa matrix: Ȳ_N = 2k · Y_N_matrix
     Y_N_bar_matrix = 2.0 * k * yukawa_result.Y_N_matrix
 
-    # Compute the Hermitian product Ȳ_N Ȳ_N†
-    product = Y_N_bar_matrix @ Y_N_bar_matrix.conj().T
+    if full_product:
+        # Compute the Hermitian product Ȳ_N Ȳ_N†
+        product = Y_N_bar_matrix @ Y_N_bar_matrix.conj().T
 
-    # Extract the (e, μ) = (1, 2) element  →  0-indexed (0, 1)
-    off_diagonal_12 = product[0, 1]
+        # Extract the (e, μ) = (1, 2) element  →  0-indexed (0, 1)
+        off_diagonal_12 = product[0, 1]
+    else:
+        product = None
+        off_diagonal_12 = np.dot(Y_N_bar_matrix[0], Y_N_bar_matrix[1].conj())
     lhs = float(np.abs(off_diagonal_12))
 
     # Bound: C × (M_KK / 3 TeV)²
@@ -191,7 +200,8 @@ def check_mu_to_e_gamma_raw(
     M_KK: float,
     C: float = C_PAPER,
     reference_scale: float = 3000.0,
-) -> Dict[str, Union[float, bool, complex, np.ndarray]]:
+    full_product: bool = True,
+) -> Dict[str, Union[float, bool, complex, np.ndarray, None]]:
     """Standalone μ→eγ check from raw arrays (no YukawaResult needed).
 
     Parameters
@@ -208,22 +218,31 @@ def check_mu_to_e_gamma_raw(
         Numerical coefficient.  Default 0.02 (Perez–Randall).
     reference_scale : float, optional
         Reference KK scale in GeV.  Default 3000.
+    full_product : bool, optional
+        If False, skip the full 3×3 product and return ``product_matrix=None``.
 
     Returns
     -------
     dict
         Same keys as ``check_mu_to_e_gamma``.
     """
-    Y_N_bar = np.asarray(Y_N_bar, dtype=complex)
-    pmns = np.asarray(pmns, dtype=complex)
-
-    # Ȳ_N_matrix = U · diag(Ȳ_N)
-    Y_N_bar_matrix = pmns @ np.diag(Y_N_bar)
-
-    # Ȳ_N Ȳ_N† = U diag(Ȳ²_N) U†
-    product = Y_N_bar_matrix @ Y_N_bar_matrix.conj().T
-
-    off_diagonal_12 = product[0, 1]
+    # Both calls are no-ops for contiguous arrays of the right dtype.  Ȳ_N may
+    # stay real: it only enters through |Ȳ_N|² or a product with the complex U.
+    Y_N_bar = np.ascontiguousarray(Y_N_bar)
+    pmns = np.ascontiguousarray(pmns, dtype=np.complex128)
+
+    if full_product:
+        # Ȳ_N_matrix = U · diag(Ȳ_N), i.e. column j of U scaled by Ȳ_{N_j}
+        Y_N_bar_matrix = pmns * Y_N_bar
+
+        # Ȳ_N Ȳ_N† = U diag(Ȳ²_N) U†
+        product = Y_N_bar_matrix @ Y_N_bar_matrix.conj().T
+
+        off_diagonal_12 = product[0, 1]
+    else:
+        # (Ȳ_N Ȳ_N†)₁₂ = Σ_k U_1k |Ȳ_{N_k}|² U*_2k
+        product = None
+        off_diagonal_12 = np.dot(pmns[0] * np.abs(Y_N_bar) ** 2, pmns[1].conj())
     lhs = float(np.abs(off_diagonal_12))
     rhs = C * (M_KK / reference_scale) ** 2
 
@@ -235,3 +254,53 @@ def check_mu_to_e_gamma_raw(
         'off_diagonal_12': complex(off_diagonal_12),
         'product_matrix': product,
     }
+
+
+def check_mu_to_e_gamma_batch(
+    Y_N_bar_batch: np.ndarray,
+    pmns: np.ndarray,
+    M_KK_batch: Union[float, np.ndarray],
+    C: float = C_PAPER,
+    reference_scale: float = 3000.0,
+) -> Dict[str, np.ndarray]:
+    """Vectorized ``check_mu_to_e_gamma_raw`` over many points with a fixed PMNS.
+
+    Parameters
+    ----------
+    Y_N_bar_batch : array-like of shape (N, 3)
+        Rescaled neutrino Yukawa eigenvalues, one row per point.
+    pmns : np.ndarray of shape (3, 3)
+        PMNS mixing matrix shared by all points.
+    M_KK_batch : float or array-like of shape (N,)
+        KK scale(s) in GeV, broadcast against the batch.
+    C, reference_scale : float, optional
+        As in ``check_mu_to_e_gamma_raw``.
+
+    Returns
+    -------
+    dict of np.ndarray with shape (N,)
+        Keys 'lhs', 'rhs', 'passes', 'ratio', 'off_diagonal_12'; the full
+        product matrices are not formed.
+    """
+    Y_N_bar_batch = np.asarray(Y_N_bar_batch)
+    if Y_N_bar_batch.ndim != 2 or Y_N_bar_batch.shape[1] != 3:
+        raise ValueError("Y_N_bar_batch must have shape (N, 3)")
+    pmns = np.ascontiguousarray(pmns, dtype=np.complex128)
+
+    yb2 = np.abs(Y_N_bar_batch) ** 2
+    off_diagonal_12 = np.einsum('k,nk,k->n', pmns[0], yb2, pmns[1].conj())
+    lhs = np.abs(off_diagonal_12)
+    rhs = np.broadcast_to(
+        C * (np.asarray(M_KK_batch, dtype=float) / reference_scale) ** 2, lhs.shape
+    )
+
+    with np.errstate(divide='ignore'):
+        ratio = np.where(rhs > 0, lhs / rhs, np.inf)
+
+    return {
+        'lhs': lhs,
+        'rhs': rhs,
+        'passes': lhs <= rhs,
+        'ratio': ratio,
+        'off_diagonal_12': off_diagonal_12,
+    }
@@ -2,22 +2,22 @@
 
 Helpers to find allowed neutrino mass spectra given a sum constraint.
 
-This module uses `compute_masses` from `neutrinoValues.py` to compute
-the three masses and their sum, then provides helpers to sweep the
-lightest mass and return the allowed values under a maximum total
-mass constraint (e.g. 0.082 eV).
+This module evaluates the closed-form spectrum behind `compute_masses`
+in `neutrinoValues.py` over a whole sweep of the lightest mass, and
+returns the allowed values under a maximum total mass constraint
+(e.g. 0.082 eV).
 """
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Dict, Tuple
 
 import numpy as np
 
 try:
-    from .neutrinoValues import compute_masses, sum_mass_constraint
+    from .neutrinoValues import _mass_spectrum, _ordering_index, sum_mass_constraint
 except ImportError:  # fallback for running as a script
-    from neutrinoValues import compute_masses, sum_mass_constraint
+    from neutrinoValues import _mass_spectrum, _ordering_index, sum_mass_constraint
 
 
 def find_allowed_lightest_masses(
@@ -32,8 +32,9 @@ def find_allowed_lightest_masses(
         max_sum: maximum allowed sum of neutrino masses (eV).
         ordering: 'normal' or 'inverted' (case-insensitive).
         step: increment for the lightest mass sweep (eV).
-        max_lightest: upper bound for the sweep (eV). Sweep stops early
-            once the total mass meets or exceeds `max_sum`.
+        max_lightest: upper bound for the sweep (eV). The sweep is also
+            capped at `max_sum`, since the total mass always exceeds the
+            lightest mass.
 
         Returns:
             A tuple `(m1_values, m2_values, m3_values, Mtot_values)`
@@ -45,33 +46,50 @@ def find_allowed_lightest_masses(
     if max_lightest <= 0:
         raise ValueError("max_lightest must be positive")
 
-    m1_values = []
-    m2_values = []
-    m3_values = []
-    Mtot_values = []
-
-    # Use a simple loop to allow early stopping when constraint is hit.
-    m = 0.0
-    while m <= max_lightest:
-        try:
-            m1, m2, m3, Mtot = compute_masses(m, ordering=ordering)
-        except ValueError:
-            # propagate invalid ordering or negative mass errors
-            raise
-
-        if Mtot >= max_sum:
-            break
-
-        m1_values.append(m1)
-        m2_values.append(m2)
-        m3_values.append(m3)
-        Mtot_values.append(Mtot)
-
-        m += step
-
-    return (
-        np.array(m1_values),
-        np.array(m2_values),
-        np.array(m3_values),
-        np.array(Mtot_values),
-    )
+    m = _lightest_mass_grid(step, max_lightest, max_sum)
+    return _allowed_spectrum(m, max_sum, _ordering_index(ordering))
+
+
+def find_allowed_lightest_masses_both(
+    max_sum: float = sum_mass_constraint,
+    step: float = 1e-4,
+    max_lightest: float = 10.0,
+) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Run `find_allowed_lightest_masses` for both orderings on one shared grid.
+
+    Args:
+        max_sum, step, max_lightest: as in `find_allowed_lightest_masses`.
+
+    Returns:
+        Dict with keys 'normal' and 'inverted', each mapping to the
+        `(m1_values, m2_values, m3_values, Mtot_values)` tuple.
+    """
+    if step <= 0:
+        raise ValueError("step must be positive")
+    if max_lightest <= 0:
+        raise ValueError("max_lightest must be positive")
+
+    m = _lightest_mass_grid(step, max_lightest, max_sum)
+    return {
+        "normal": _allowed_spectrum(m, max_sum, 0),
+        "inverted": _allowed_spectrum(m, max_sum, 1),
+    }
+
+
+def _lightest_mass_grid(step: float, max_lightest: float, max_sum: float) -> np.ndarray:
+    # Mtot > m_lightest, so no lightest mass at or above max_sum can pass;
+    # capping there keeps the grid (and the spectrum arrays built from it) at
+    # ~max_sum / step points instead of max_lightest / step.
+    upper = min(max_lightest, max_sum)
+    return np.arange(int(np.floor(upper / step)) + 1) * step
+
+
+def _allowed_spectrum(
+    m: np.ndarray, max_sum: float, ordering_index: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Mtot grows monotonically with the lightest mass, so evaluate the whole
+    # sweep at once and cut it where the constraint is first met.
+    m1, m2, m3 = _mass_spectrum(m, ordering_index)
+    Mtot = m1 + m2 + m3
+    k = int(np.searchsorted(Mtot, max_sum, side="left"))
+    return m1[:k], m2[:k], m3[:k], Mtot[:k]
@@ -12,6 +12,7 @@ Both normal and inverted mass orderings are supported.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
@@ -91,15 +92,52 @@ __all__ = [
    "sin_sq_theta13_inverted",
    "sin_sq_theta13",
    "pmns_matrix",
-   "get_pmns"
+   "get_pmns",
+   "PMNS_NORMAL",
+   "PMNS_INVERTED",
 ]
 
 
+_ORDER_MAP = {"normal": 0, "inverted": 1, "NORMAL": 0, "INVERTED": 1}
+
+def _ordering_index(ordering: str) -> int:
+   """Map an ordering name to 0 (normal) or 1 (inverted), case-insensitively."""
+   key = _ORDER_MAP.get(ordering)
+   if key is None:
+      key = _ORDER_MAP.get(ordering.strip().lower())
+      if key is None:
+         raise ValueError("ordering must be 'normal' or 'inverted'")
+   return key
+
+def _mass_spectrum(lightest_mass, ordering_index: int):
+   """Return (m1, m2, m3) for a scalar or array lightest mass.
+
+   Shared by `compute_masses` and the vectorized sweep in massConstraints;
+   `ordering_index` comes from `_ordering_index` (0 normal, 1 inverted).
+   """
+   if ordering_index == 0:
+      m1 = lightest_mass
+      m1_sq = m1 * m1
+      m2 = np.sqrt(m1_sq + delta_m21_sq)
+      m3 = np.sqrt(m1_sq + delta_m3l_sq_normal)
+   elif ordering_index == 1:
+      m3 = lightest_mass
+      m2_sq = m3 * m3 + abs(delta_m3l_sq_inverted)
+      m2 = np.sqrt(m2_sq)
+      m1 = np.sqrt(m2_sq - delta_m21_sq)
+   else:
+      raise ValueError("ordering must be 'normal' or 'inverted'")
+   return m1, m2, m3
+
 def compute_masses(
    lightest_mass: float, ordering: str = "normal"
 ) -> Tuple[float, float, float, float]:
    """Compute neutrino masses and their sum.
 
+   The inputs are normalized to a Python float and an ordering index before
+   the cached core, so numpy scalars and 0-d arrays work and share cache
+   entries with plain floats; scans revisit the same grid values.
+
    Args:
       lightest_mass: Lightest neutrino mass (in eV). Must be non-negative.
       ordering: 'normal' or 'inverted' (case-insensitive).
@@ -110,24 +148,23 @@ def compute_masses(
    Raises:
       ValueError: if `lightest_mass` is negative or ordering is invalid.
    """
+   lightest_mass = float(lightest_mass)
    if lightest_mass < 0:
       raise ValueError("lightest_mass must be non-negative")
+   return _compute_masses_cached(lightest_mass, _ordering_index(ordering))
 
-   ordering_key = ordering.strip().lower()
-   if ordering_key == "normal":
-      m1 = float(lightest_mass)
-      m2 = float(np.sqrt(m1 * m1 + delta_m21_sq))
-      m3 = float(np.sqrt(m1 * m1 + delta_m3l_sq_normal))
-   elif ordering_key == "inverted":
-      m3 = float(lightest_mass)
-      m2 = float(np.sqrt(m3 * m3 + abs(delta_m3l_sq_inverted)))
-      m1 = float(np.sqrt(m2 * m2 - delta_m21_sq))
-   else:
-      raise ValueError("ordering must be 'normal' or 'inverted'")
+@lru_cache(maxsize=4096)
+def _compute_masses_cached(
+   lightest_mass: float, ordering_index: int
+) -> Tuple[float, float, float, float]:
+   """Cached core of `compute_masses` on a float mass and ordering index."""
+   m1, m2, m3 = _mass_spectrum(lightest_mass, ordering_index)
+   m1, m2, m3 = float(m1), float(m2), float(m3)
 
    M_nu = m1 + m2 + m3
    return m1, m2, m3, M_nu
 
+@lru_cache(maxsize=128)
 def get_pmns(ordering: str = "normal", alpha: float = 0.0, beta: float = 0.0):
    """
    Returns the PMNS matrix using the configured mixing angles and the
@@ -139,7 +176,8 @@ def get_pmns(ordering: str = "normal", alpha: float = 0.0, beta: float = 0.0):
       alpha, beta: Majorana phases (radians).
 
    Returns:
-      3x3 complex numpy array: the PMNS matrix.
+      3x3 complex numpy array: the PMNS matrix. Cached on the arguments and
+      read-only (see `pmns_matrix`).
    """
    ordering_key = ordering.strip().lower()
    if ordering_key == "normal":
@@ -155,6 +193,7 @@ def get_pmns(ordering: str = "normal", alpha: float = 0.0, beta: float = 0.0):
 
    return pmns_matrix(theta12, theta23_local, theta13_local, delta_cp, alpha, beta)
 
+@lru_cache(maxsize=128)
 def pmns_matrix(theta12, theta23, theta13, delta_cp, alpha=0.0, beta=0.0):
     """
     Construct the PMNS matrix (PDG parameterization) with optional Majorana phases.
@@ -165,7 +204,8 @@ def pmns_matrix(theta12, theta23, theta13, delta_cp, alpha=0.0, beta=0.0):
         alpha, beta: Majorana phases (radians); implemented as U * diag(1, e^{i α/2}, e^{i β/2})
 
     Returns:
-        U: 3x3 numpy array (complex)
+        U: 3x3 numpy array (complex). Results are cached on the angle arguments,
+        so the returned array is read-only; copy it before modifying in place.
     """
     s12 = np.sin(theta12)
     c12 = np.cos(theta12)
@@ -204,6 +244,14 @@ def pmns_matrix(theta12, theta23, theta13, delta_cp, alpha=0.0, beta=0.0):
 
     # Apply Majorana phases on the right: diag(1, e^{i α/2}, e^{i β/2})
     # These are often denoted as alpha21 and alpha31
-    maj_phases = np.diag([1.0 + 0j, np.exp(1j * alpha / 2.0), np.exp(1j * beta / 2.0)])
+    # Right-multiplying by a diagonal matrix is a column scaling.
+    U *= np.array([1.0 + 0j, np.exp(1j * alpha / 2.0), np.exp(1j * beta / 2.0)])
+    U.flags.writeable = False
+
+    return U
+
 
-    return np.dot(U, maj_phases)
+# Default PMNS matrices (vanishing Majorana phases) for each ordering. They are
+# the cached get_pmns arrays and therefore read-only; copy before modifying.
+PMNS_NORMAL = get_pmns("normal")
+PMNS_INVERTED = get_pmns("inverted")
@@ -16,11 +16,15 @@ van Ritbergen, Vermaseren, Larin, Phys.Lett. B400 (1997) 379
 PDG 2024, "Quantum Chromodynamics" review.
 """
 
+from typing import Tuple
+
 import numpy as np
 
 # Apery's constant  zeta(3)
 _ZETA3 = 1.2020569031595942
 
+_4PI = 4.0 * np.pi
+
 
 def beta_0(n_f: int) -> float:
     """1-loop beta function coefficient.
@@ -61,6 +65,32 @@ def beta_3(n_f: int) -> float:
 
 _BETA_FUNCS = [beta_0, beta_1, beta_2, beta_3]
 
+# _BETA_TABLE[n_f, i] = beta_i(n_f) for n_f = 0..6, i = 0..3 (read-only).
+_BETA_TABLE = np.array([[f(n_f) for f in _BETA_FUNCS] for n_f in range(7)])
+_BETA_TABLE.flags.writeable = False
+
+
+def _as_int(value, name: str) -> int:
+    """Coerce an integral value (e.g. 5.0, np.int64(5)) to int; reject others."""
+    try:
+        as_int = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+    if as_int != value:
+        raise ValueError(f"{name} must be an integer, got {value!r}")
+    return as_int
+
+
+def _check_orders(n_f: int, n_loops: int) -> Tuple[int, int]:
+    """Validate *n_f* and *n_loops*; return them as ints for table lookups."""
+    n_f = _as_int(n_f, "n_f")
+    n_loops = _as_int(n_loops, "n_loops")
+    if not 0 <= n_f <= 6:
+        raise ValueError(f"n_f must be 0..6, got {n_f}")
+    if not 1 <= n_loops <= 4:
+        raise ValueError(f"n_loops must be 1..4, got {n_loops}")
+    return n_f, n_loops
+
 
 def beta_coefficients(n_f: int, n_loops: int) -> np.ndarray:
     """Return the first *n_loops* beta function coefficients.
@@ -68,25 +98,35 @@ def beta_coefficients(n_f: int, n_loops: int) -> np.ndarray:
     Parameters
     ----------
     n_f : int
-        Number of active quark flavors (0–6).
+        Number of active quark flavors (0–6).  Integral floats such as 5.0
+        are accepted.
     n_loops : int
         Loop order (1–4).
 
     Returns
     -------
     np.ndarray
-        Array [beta_0, beta_1, ...] of length *n_loops*.
+        Array [beta_0, beta_1, ...] of length *n_loops*, a read-only view
+        into the precomputed coefficient table.
 
     Raises
     ------
     ValueError
-        If *n_f* or *n_loops* is out of range.
+        If *n_f* or *n_loops* is out of range or not an integer.
     """
-    if not 0 <= n_f <= 6:
-        raise ValueError(f"n_f must be 0..6, got {n_f}")
-    if not 1 <= n_loops <= 4:
-        raise ValueError(f"n_loops must be 1..4, got {n_loops}")
-    return np.array([_BETA_FUNCS[i](n_f) for i in range(n_loops)])
+    n_f, n_loops = _check_orders(n_f, n_loops)
+    return _BETA_TABLE[n_f, :n_loops]
+
+
+# _BETA_RHS_TABLE[n_f][n_loops - 1] = (beta_0, ..., beta_3), zero-padded beyond
+# n_loops, so beta_rhs can run a fixed straight-line Horner step.
+_BETA_RHS_TABLE = tuple(
+    tuple(
+        tuple(float(row[i]) if i < n_loops else 0.0 for i in range(4))
+        for n_loops in range(1, 5)
+    )
+    for row in _BETA_TABLE
+)
 
 
 def beta_rhs(alpha_s: float, n_f: int, n_loops: int) -> float:
@@ -99,7 +139,7 @@ def beta_rhs(alpha_s: float, n_f: int, n_loops: int) -> float:
     alpha_s : float
         Current value of the strong coupling.
     n_f : int
-        Number of active quark flavors.
+        Number of active quark flavors (integral floats are accepted).
     n_loops : int
         Loop order (1–4).
 
@@ -108,8 +148,10 @@ def beta_rhs(alpha_s: float, n_f: int, n_loops: int) -> float:
     float
         Value of beta(alpha_s).
     """
-    coeffs = beta_coefficients(n_f, n_loops)
-    a_over_4pi = alpha_s / (4.0 * np.pi)
-
-    series = sum(b * a_over_4pi**i for i, b in enumerate(coeffs))
-    return -(alpha_s**2 / (4.0 * np.pi)) * series
+    if type(n_f) is not int or type(n_loops) is not int or not (
+        0 <= n_f <= 6 and 1 <= n_loops <= 4
+    ):
+        n_f, n_loops = _check_orders(n_f, n_loops)
+    b0, b1, b2, b3 = _BETA_RHS_TABLE[n_f][n_loops - 1]
+    a = alpha_s / _4PI
+    return -(alpha_s * a) * (((b3 * a + b2) * a + b1) * a + b0)
@@ -26,7 +26,7 @@ from __future__ import annotations
 from typing import Callable, List, Optional, Tuple
 
 import numpy as np
-from scipy.integrate import solve_ivp
+from scipy.integrate import RK45
 
 from .beta_function import beta_rhs
 from .constants import M_BOTTOM, M_CHARM, M_TOP_MS
@@ -165,7 +165,7 @@ def run_msbar_mass(
     if n_f_ref not in (3, 4, 5, 6):
         raise ValueError("n_f_ref must be in {3,4,5,6}")
 
-    if np.isclose(mu_ref, mu_target, rtol=1e-14):
+    if abs(mu_ref - mu_target) <= 1e-8 + 1e-14 * abs(mu_target):
         return float(m_ref)
 
     # Anchor alpha_s. We integrate alpha_s and the mass jointly on each
@@ -196,7 +196,7 @@ def run_msbar_mass(
     eff_match_loops = min(matching_loops, max(0, n_loops - 1), 3)
 
     for mu_start, mu_end, nf, nf_next in segments:
-        if np.isclose(mu_start, mu_end, rtol=1e-14):
+        if abs(mu_start - mu_end) <= 1e-8 + 1e-14 * abs(mu_end):
             # Pure threshold step (zero-length segment) — just match.
             pass
         else:
@@ -211,21 +211,22 @@ def run_msbar_mass(
                 d_m = -_gamma_m(a_s, _nf, _nl) * m
                 return [d_alpha, d_m]
 
-            sol = solve_ivp(
-                rhs,
-                t_span=(t_start, t_end),
-                y0=[current_alpha, current_m],
-                method="RK45",
-                rtol=rtol,
-                atol=atol,
+            # Step the RK45 solver directly: same integration as
+            # solve_ivp(method="RK45") without its dense-output/result
+            # bookkeeping per segment.
+            solver = RK45(
+                rhs, t_start, [current_alpha, current_m], t_end, rtol=rtol, atol=atol
             )
-            if not sol.success:
+            message = None
+            while solver.status == "running":
+                message = solver.step()
+            if solver.status == "failed":
                 raise RuntimeError(
                     f"mass-running ODE failed in segment "
-                    f"[{mu_start}, {mu_end}] n_f={nf}: {sol.message}"
+                    f"[{mu_start}, {mu_end}] n_f={nf}: {message}"
                 )
-            current_alpha = float(sol.y[0, -1])
-            current_m = float(sol.y[1, -1])
+            current_alpha = float(solver.y[0])
+            current_m = float(solver.y[1])
 
         if nf_next is not None and eff_match_loops > 0:
             # Apply alpha_s and mass matching at mu = m_h (mu_end).
@@ -17,17 +17,188 @@ PDG 2024, "Quantum Chromodynamics" review.
 Chetyrkin, Kuhn, Sturm, Eur.Phys.J. C48 (2006) 107 — threshold matching.
 """
 
-from typing import List, Optional, Tuple
+import math
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
-from scipy.integrate import solve_ivp
 
-from .beta_function import beta_rhs
+from .beta_function import _4PI, _BETA_RHS_TABLE, beta_rhs
 from .constants import ALPHA_S_MZ, M_Z, THRESHOLD_LIST
 from .decoupling import match_alpha_s
 
+# Dormand–Prince 5(4) tableau.  The RHS is autonomous in t, so the nodes c_i
+# are not needed.
+_A21 = 1.0 / 5.0
+_A31, _A32 = 3.0 / 40.0, 9.0 / 40.0
+_A41, _A42, _A43 = 44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0
+_A51, _A52, _A53, _A54 = (
+    19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0,
+)
+_A61, _A62, _A63, _A64, _A65 = (
+    9017.0 / 3168.0, -355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, -5103.0 / 18656.0,
+)
+_B1, _B3, _B4, _B5, _B6 = (
+    35.0 / 384.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0,
+)
+# Error weights: 5th-order minus embedded 4th-order solution.
+_E1, _E3, _E4, _E5, _E6, _E7 = (
+    -71.0 / 57600.0, 71.0 / 16695.0, -71.0 / 1920.0,
+    17253.0 / 339200.0, -22.0 / 525.0, 1.0 / 40.0,
+)
+# Step-size controller constants (same as SciPy's RK45, so results agree with
+# solve_ivp to round-off).
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.0
+_ERROR_EXPONENT = -1.0 / 5.0
+
+# Default flavor thresholds, sorted and frozen once at import.
+_DEFAULT_THRESHOLDS = tuple(sorted((tuple(th) for th in THRESHOLD_LIST), key=lambda x: x[0]))
+
+
+def _rk45_segment(
+    alpha0: float,
+    t0: float,
+    t1: float,
+    n_f: int,
+    n_loops: int,
+    rtol: float,
+    atol: float,
+) -> float:
+    """Integrate d(alpha_s)/dt = beta(alpha_s) from t0 to t1 at fixed n_f.
+
+    Scalar Dormand–Prince RK45 with FSAL, following the step-size control of
+    ``scipy.integrate.solve_ivp(method='RK45')``.  The state is a single
+    float, so no arrays or Python-level RHS wrappers are involved per step.
+
+    Raises
+    ------
+    RuntimeError
+        If the required step size falls below the floating-point resolution
+        of t.
+    """
+    direction = 1.0 if t1 > t0 else -1.0
+    t = t0
+    y = alpha0
+    f = beta_rhs(y, n_f, n_loops)
+
+    # Initial step (Hairer, Nørsett & Wanner, Sec. II.4)
+    interval = abs(t1 - t0)
+    scale = atol + abs(y) * rtol
+    d0 = abs(y) / scale
+    d1 = abs(f) / scale
+    h0 = 1e-6 if (d0 < 1e-5 or d1 < 1e-5) else 0.01 * d0 / d1
+    h0 = min(h0, interval)
+    f1 = beta_rhs(y + h0 * direction * f, n_f, n_loops)
+    d2 = abs(f1 - f) / scale / h0
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1.0 / 5.0)
+    h_abs = min(100.0 * h0, h1, interval)
+
+    while direction * (t - t1) < 0.0:
+        min_step = 10.0 * abs(np.nextafter(t, direction * np.inf) - t)
+        if h_abs < min_step:
+            h_abs = min_step
+
+        step_rejected = False
+        while True:
+            if h_abs < min_step:
+                raise RuntimeError(
+                    f"required step size is less than spacing between numbers "
+                    f"at t={t:.6g}"
+                )
+            t_new = t + h_abs * direction
+            if direction * (t_new - t1) > 0.0:
+                t_new = t1
+            h = t_new - t
+            h_abs = abs(h)
+
+            k1 = f
+            k2 = beta_rhs(y + (_A21 * k1) * h, n_f, n_loops)
+            k3 = beta_rhs(y + (_A31 * k1 + _A32 * k2) * h, n_f, n_loops)
+            k4 = beta_rhs(y + (_A41 * k1 + _A42 * k2 + _A43 * k3) * h, n_f, n_loops)
+            k5 = beta_rhs(
+                y + (_A51 * k1 + _A52 * k2 + _A53 * k3 + _A54 * k4) * h, n_f, n_loops
+            )
+            k6 = beta_rhs(
+                y + (_A61 * k1 + _A62 * k2 + _A63 * k3 + _A64 * k4 + _A65 * k5) * h,
+                n_f, n_loops,
+            )
+            y_new = y + h * (_B1 * k1 + _B3 * k3 + _B4 * k4 + _B5 * k5 + _B6 * k6)
+            k7 = beta_rhs(y_new, n_f, n_loops)
+
+            err = (_E1 * k1 + _E3 * k3 + _E4 * k4 + _E5 * k5 + _E6 * k6 + _E7 * k7) * h
+            error_norm = abs(err) / (atol + max(abs(y), abs(y_new)) * rtol)
+
+            if error_norm < 1.0:
+                if error_norm == 0.0:
+                    factor = _MAX_FACTOR
+                else:
+                    factor = min(_MAX_FACTOR, _SAFETY * error_norm ** _ERROR_EXPONENT)
+                if step_rejected:
+                    factor = min(1.0, factor)
+                h_abs *= factor
+                break
+            h_abs *= max(_MIN_FACTOR, _SAFETY * error_norm ** _ERROR_EXPONENT)
+            step_rejected = True
+
+        t = t_new
+        y = y_new
+        f = k7  # FSAL
+
+    return y
+
 
-def _n_f_at_scale(mu: float, thresholds: List[Tuple[float, int, int]]) -> int:
+def _closed_form_segment(
+    alpha0: float, t0: float, t1: float, n_f: int, n_loops: int
+) -> float:
+    """Exact 1-loop / 2-loop running of alpha_s from t0 to t1 (t = ln mu^2).
+
+    With a = alpha_s/(4 pi), 1-loop gives 1/a = 1/a0 + b0*(t1 - t0).  At
+    2 loops the implicit solution G(a) = G(a0) + (t1 - t0), with
+    G(a) = 1/(b0 a) - (b1/b0^2) ln((b0 + b1 a)/a), is solved by Newton
+    iteration from the 1-loop value.
+    """
+    b0, b1 = _BETA_RHS_TABLE[n_f][n_loops - 1][:2]
+    a0 = alpha0 / _4PI
+    dt = t1 - t0
+    inv_a = 1.0 / a0 + b0 * dt
+    if inv_a <= 0.0:
+        raise RuntimeError("alpha_s hits the Landau pole inside the segment")
+    a = 1.0 / inv_a
+    if n_loops == 1:
+        return a * _4PI
+
+    c = b1 / (b0 * b0)
+    target = 1.0 / (b0 * a0) - c * math.log((b0 + b1 * a0) / a0) + dt
+    for _ in range(50):
+        g = 1.0 / (b0 * a) - c * math.log((b0 + b1 * a) / a)
+        step = (g - target) * a * a * (b0 + b1 * a)
+        a += step
+        if not a > 0.0:
+            raise RuntimeError("alpha_s hits the Landau pole inside the segment")
+        if abs(step) <= 4.0 * np.finfo(float).eps * a:
+            return a * _4PI
+    raise RuntimeError("2-loop closed-form alpha_s did not converge")
+
+
+def _check_method(method: str, n_loops: int) -> bool:
+    """Validate the running *method*; return True for the closed form."""
+    if method == "ode":
+        return False
+    if method == "analytic":
+        if n_loops > 2:
+            raise ValueError(
+                f"method='analytic' requires n_loops <= 2, got {n_loops}"
+            )
+        return True
+    raise ValueError(f"method must be 'ode' or 'analytic', got {method!r}")
+
+
+def _n_f_at_scale(mu: float, thresholds: Sequence[Tuple[float, int, int]]) -> int:
     """Determine the number of active flavors at scale *mu*."""
     if not thresholds:
         return 5  # default when thresholds disabled
@@ -50,6 +221,7 @@ def alpha_s(
     precision: Optional[str] = None,
     rtol: float = 1e-10,
     atol: float = 1e-12,
+    method: str = "ode",
 ) -> float:
     """Compute alpha_s(mu) by integrating the MS-bar beta function.
 
@@ -76,6 +248,18 @@ def alpha_s(
         Default ``None`` (use explicit parameters).
     rtol, atol : float, optional
         ODE integrator tolerances.
+    method : str, optional
+        ``'ode'`` (default) integrates the beta function numerically;
+        ``'analytic'`` uses the exact 1-/2-loop solution on each segment and
+        requires ``n_loops <= 2``.  The two agree to ~1e-11 relative, so the
+        default stays ``'ode'`` to keep frozen artifact values reproducible.
+
+    Notes
+    -----
+    Results are memoized (LRU, 4096 entries) on the exact resolved
+    arguments, so scans that revisit the same scales skip the integration.
+    The thresholds are part of the key, so custom threshold lists are cached
+    separately from the defaults.
 
     Returns
     -------
@@ -97,98 +281,41 @@ def alpha_s(
     >>> alpha_s(3000.0, precision='low')   # 3-loop, continuous matching
     >>> alpha_s(3000.0, precision='high')  # 4-loop, 3-loop decoupling
     """
-    # Apply precision preset (overrides n_loops and matching_loops)
-    if precision is not None:
-        if precision == 'low':
-            n_loops, matching_loops = 3, 0
-        elif precision == 'high':
-            n_loops, matching_loops = 4, 3
-        else:
-            raise ValueError(
-                f"precision must be 'low' or 'high', got {precision!r}"
-            )
-
     if mu <= 0:
         raise ValueError(f"mu must be positive, got {mu}")
-    if alpha_s_ref <= 0:
-        raise ValueError(f"alpha_s_ref must be positive, got {alpha_s_ref}")
-    if not 1 <= n_loops <= 4:
-        raise ValueError(f"n_loops must be 1..4, got {n_loops}")
-
-    if thresholds is None:
-        thresholds = list(THRESHOLD_LIST)
-    thresholds = sorted(thresholds, key=lambda x: x[0])
-    if matching_loops is None:
-        matching_loops = max(0, min(n_loops - 1, 3))
-    if matching_loops < 0 or matching_loops > 3:
-        raise ValueError(f"matching_loops must be 0..3, got {matching_loops}")
-
-    # Trivial case
-    if np.isclose(mu, mu_ref, rtol=1e-12):
-        return alpha_s_ref
-
-    t_ref = np.log(mu_ref**2)
-    t_target = np.log(mu**2)
-    running_up = t_target > t_ref
-
-    # Find thresholds between mu_ref and mu
-    crossings = []
-    for mass, nf_below, nf_above in thresholds:
-        t_thresh = np.log(mass**2)
-        if running_up and t_ref < t_thresh < t_target:
-            crossings.append((t_thresh, nf_below, nf_above))
-        elif not running_up and t_target < t_thresh < t_ref:
-            crossings.append((t_thresh, nf_below, nf_above))
-
-    crossings.sort(key=lambda x: x[0], reverse=(not running_up))
-
-    # Build integration segments: (t_start, t_end, n_f, n_f_next)
-    segments = []
-    current_t = t_ref
-    current_nf = _n_f_at_scale(mu_ref, thresholds)
+    n_loops, thresholds, matching_loops = _resolve_running_options(
+        n_loops, alpha_s_ref, thresholds, matching_loops, precision
+    )
+    analytic = _check_method(method, n_loops)
 
-    for t_thresh, nf_below, nf_above in crossings:
-        next_nf = nf_above if running_up else nf_below
-        segments.append((current_t, t_thresh, current_nf, next_nf))
-        current_t = t_thresh
-        current_nf = next_nf
+    return _alpha_s_cached(
+        float(mu), n_loops, float(alpha_s_ref), float(mu_ref), thresholds,
+        matching_loops, float(rtol), float(atol), analytic,
+    )
 
-    segments.append((current_t, t_target, current_nf, None))
 
-    # Integrate each segment
-    current_alpha = alpha_s_ref
-
-    for t_start, t_end, nf, nf_next in segments:
-        if np.isclose(t_start, t_end, rtol=1e-14):
-            continue
-
-        def rhs(t, y, _nf=nf, _nl=n_loops):
-            return [beta_rhs(y[0], _nf, _nl)]
-
-        sol = solve_ivp(
-            rhs,
-            t_span=(t_start, t_end),
-            y0=[current_alpha],
-            method='RK45',
-            rtol=rtol,
-            atol=atol,
-        )
-
-        if not sol.success:
-            raise RuntimeError(
-                f"ODE integration failed in segment "
-                f"[mu={np.exp(t_start / 2):.2f}, mu={np.exp(t_end / 2):.2f}] "
-                f"with n_f={nf}: {sol.message}"
-            )
-
-        current_alpha = float(sol.y[0, -1])
-        if nf_next is not None and matching_loops > 0:
-            current_alpha = match_alpha_s(
-                current_alpha, n_f_from=nf, n_f_to=nf_next,
-                matching_loops=matching_loops,
-            )
+@lru_cache(maxsize=4096)
+def _alpha_s_cached(
+    mu: float,
+    n_loops: int,
+    alpha_s_ref: float,
+    mu_ref: float,
+    thresholds: Tuple[Tuple[float, int, int], ...],
+    matching_loops: int,
+    rtol: float,
+    atol: float,
+    analytic: bool = False,
+) -> float:
+    """Memoized core of :func:`alpha_s` on validated, hashable arguments."""
+    # Trivial case (np.isclose semantics, atol=1e-8, without the ufunc overhead)
+    if abs(mu - mu_ref) <= 1e-8 + 1e-12 * abs(mu_ref):
+        return alpha_s_ref
 
-    return current_alpha
+    t_ref = 2.0 * math.log(mu_ref)
+    return _evolve(
+        alpha_s_ref, t_ref, _n_f_at_scale(mu_ref, thresholds), [2.0 * math.log(mu)],
+        thresholds, n_loops, matching_loops, rtol, atol, analytic,
+    )[0]
 
 
 def alpha_s_array(
@@ -199,9 +326,16 @@ def alpha_s_array(
     thresholds: Optional[List[Tuple[float, int, int]]] = None,
     matching_loops: Optional[int] = None,
     precision: Optional[str] = None,
+    rtol: float = 1e-10,
+    atol: float = 1e-12,
+    method: str = "ode",
 ) -> np.ndarray:
     """Compute alpha_s at multiple scales.
 
+    The scales are sorted and evolved in at most two passes from *mu_ref*
+    (one upward, one downward), stopping at each requested scale on the way,
+    instead of re-integrating from *mu_ref* for every entry.
+
     Parameters
     ----------
     mu_values : array-like
@@ -218,6 +352,13 @@ def alpha_s_array(
         Decoupling order at thresholds (0–3).
     precision : str or None, optional
         ``'low'`` or ``'high'`` preset.  See :func:`alpha_s`.
+    rtol, atol : float, optional
+        ODE integrator tolerances, as in :func:`alpha_s`.  The batched pass
+        takes different steps than one integration per scale, so with
+        ``method='ode'`` the two agree to about *rtol*, not to round-off;
+        tighten the tolerances (or use ``method='analytic'``) if that matters.
+    method : str, optional
+        ``'ode'`` or ``'analytic'``.  See :func:`alpha_s`.
 
     Returns
     -------
@@ -225,13 +366,153 @@ def alpha_s_array(
         Array of alpha_s values, same shape as *mu_values*.
     """
     mu_arr = np.asarray(mu_values, dtype=float)
-    result = np.empty_like(mu_arr)
-    for i, mu_val in enumerate(mu_arr.flat):
-        result.flat[i] = alpha_s(
-            mu_val, n_loops=n_loops,
-            alpha_s_ref=alpha_s_ref, mu_ref=mu_ref,
-            thresholds=thresholds,
-            matching_loops=matching_loops,
-            precision=precision,
+    mu_flat = mu_arr.ravel()
+    if np.any(mu_flat <= 0):
+        raise ValueError(f"mu must be positive, got {mu_flat[mu_flat <= 0][0]}")
+    n_loops, thresholds, matching_loops = _resolve_running_options(
+        n_loops, alpha_s_ref, thresholds, matching_loops, precision
+    )
+    analytic = _check_method(method, n_loops)
+
+    result = np.full(mu_flat.shape, alpha_s_ref, dtype=float)
+    t_ref = 2.0 * math.log(mu_ref)
+    nf_ref = _n_f_at_scale(mu_ref, thresholds)
+    t_vals = 2.0 * np.log(mu_flat)
+    active = ~np.isclose(mu_flat, mu_ref, rtol=1e-12)
+
+    up = np.flatnonzero(active & (t_vals > t_ref))
+    down = np.flatnonzero(active & (t_vals < t_ref))
+    for idx in (up[np.argsort(t_vals[up])], down[np.argsort(-t_vals[down])]):
+        if idx.size:
+            result[idx] = _evolve(
+                alpha_s_ref, t_ref, nf_ref, t_vals[idx].tolist(),
+                thresholds, n_loops, matching_loops, float(rtol), float(atol), analytic,
+            )
+    return result.reshape(mu_arr.shape)
+
+
+def _resolve_running_options(
+    n_loops: int,
+    alpha_s_ref: float,
+    thresholds: Optional[List[Tuple[float, int, int]]],
+    matching_loops: Optional[int],
+    precision: Optional[str],
+) -> Tuple[int, Tuple[Tuple[float, int, int], ...], int]:
+    """Apply the precision preset and validate the shared running options."""
+    # Apply precision preset (overrides n_loops and matching_loops)
+    if precision is not None:
+        if precision == 'low':
+            n_loops, matching_loops = 3, 0
+        elif precision == 'high':
+            n_loops, matching_loops = 4, 3
+        else:
+            raise ValueError(
+                f"precision must be 'low' or 'high', got {precision!r}"
+            )
+
+    if alpha_s_ref <= 0:
+        raise ValueError(f"alpha_s_ref must be positive, got {alpha_s_ref}")
+    if not 1 <= n_loops <= 4:
+        raise ValueError(f"n_loops must be 1..4, got {n_loops}")
+
+    if thresholds is None:
+        thresholds = _DEFAULT_THRESHOLDS
+    else:
+        thresholds = tuple(sorted((tuple(th) for th in thresholds), key=lambda x: x[0]))
+    if matching_loops is None:
+        matching_loops = max(0, min(n_loops - 1, 3))
+    if matching_loops < 0 or matching_loops > 3:
+        raise ValueError(f"matching_loops must be 0..3, got {matching_loops}")
+    return n_loops, thresholds, matching_loops
+
+
+def _evolve(
+    alpha_ref: float,
+    t_ref: float,
+    nf_ref: int,
+    t_targets: List[float],
+    thresholds: Sequence[Tuple[float, int, int]],
+    n_loops: int,
+    matching_loops: int,
+    rtol: float,
+    atol: float,
+    analytic: bool = False,
+) -> List[float]:
+    """Evolve alpha_s from t_ref through *t_targets*, matching at thresholds.
+
+    *t_targets* must lie on one side of *t_ref* and be ordered away from it.
+    Thresholds strictly between t_ref and a target are crossed (with
+    decoupling) before that target is reached; a target sitting exactly on a
+    threshold is evaluated before the matching.
+    """
+    running_up = t_targets[-1] > t_ref
+    direction = 1.0 if running_up else -1.0
+    t_far = t_targets[-1]
+
+    # Find thresholds between mu_ref and the farthest target
+    crossings = []
+    for mass, nf_below, nf_above in thresholds:
+        t_thresh = 2.0 * math.log(mass)
+        if running_up and t_ref < t_thresh < t_far:
+            crossings.append((t_thresh, nf_below, nf_above))
+        elif not running_up and t_far < t_thresh < t_ref:
+            crossings.append((t_thresh, nf_below, nf_above))
+
+    crossings.sort(key=lambda x: x[0], reverse=(not running_up))
+
+    results = []
+    current_t = t_ref
+    current_nf = nf_ref
+    current_alpha = alpha_ref
+    i_cross = 0
+
+    for t_target in t_targets:
+        while (
+            i_cross < len(crossings)
+            and direction * (crossings[i_cross][0] - t_target) < 0
+        ):
+            t_thresh, nf_below, nf_above = crossings[i_cross]
+            next_nf = nf_above if running_up else nf_below
+            current_alpha = _integrate_segment(
+                current_alpha, current_t, t_thresh, current_nf, n_loops, rtol, atol, analytic
+            )
+            if matching_loops > 0:
+                current_alpha = match_alpha_s(
+                    current_alpha, n_f_from=current_nf, n_f_to=next_nf,
+                    matching_loops=matching_loops,
+                )
+            current_t = t_thresh
+            current_nf = next_nf
+            i_cross += 1
+
+        current_alpha = _integrate_segment(
+            current_alpha, current_t, t_target, current_nf, n_loops, rtol, atol, analytic
         )
-    return result
+        current_t = t_target
+        results.append(current_alpha)
+
+    return results
+
+
+def _integrate_segment(
+    alpha: float,
+    t_start: float,
+    t_end: float,
+    nf: int,
+    n_loops: int,
+    rtol: float,
+    atol: float,
+    analytic: bool = False,
+) -> float:
+    if abs(t_start - t_end) <= 1e-8 + 1e-14 * abs(t_end):
+        return alpha
+    try:
+        if analytic:
+            return _closed_form_segment(alpha, t_start, t_end, nf, n_loops)
+        return float(_rk45_segment(alpha, t_start, t_end, nf, n_loops, rtol, atol))
+    except RuntimeError as exc:
+        raise RuntimeError(
+            f"ODE integration failed in segment "
+            f"[mu={math.exp(t_start / 2):.2f}, mu={math.exp(t_end / 2):.2f}] "
+            f"with n_f={nf}: {exc}"
+        ) from exc
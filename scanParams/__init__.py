@@ -1,7 +1,42 @@
-"""scanParams package — parameter space scanning for the RS lepton model."""
+"""scanParams package — parameter space scanning for the RS lepton model.
 
-from .anarchy import AnarchyConfig
-from .postprocess import ReclassifyConfig, classify_row
-from .scan import ScanConfig, run_scan
+Exports are loaded lazily so CLIs that only need one entry point do not pay
+for importing the full scan stack.
+"""
 
-__all__ = ['AnarchyConfig', 'ReclassifyConfig', 'ScanConfig', 'classify_row', 'run_scan']
+from __future__ import annotations
+
+from importlib import import_module
+
+_EXPORTS = {
+    "AnarchyConfig": (".anarchy", "AnarchyConfig"),
+    "ReclassifyConfig": (".postprocess", "ReclassifyConfig"),
+    "ClassifyColumns": (".postprocess", "ClassifyColumns"),
+    "ScanConfig": (".scan", "ScanConfig"),
+    "classify_columns": (".postprocess", "classify_columns"),
+    "classify_row": (".postprocess", "classify_row"),
+    "classify_rows_batch": (".postprocess", "classify_rows_batch"),
+    "iter_scan": (".scan", "iter_scan"),
+    "perturbativity_prefilter": (".scan", "perturbativity_prefilter"),
+    "run_mcmc_scan": (".mcmc", "run_mcmc_scan"),
+    "run_scan": (".scan", "run_scan"),
+    "screen_grid": (".scan", "screen_grid"),
+    "write_scan_columns": (".scan", "write_scan_columns"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr_name = _EXPORTS[name]
+    except KeyError as exc:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+    module = import_module(module_name, __name__)
+    value = getattr(module, attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -7,6 +7,7 @@ This module supports two workflows:
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
@@ -38,43 +39,196 @@ class AnarchyConfig:
             raise ValueError("yN_overall_min must be positive")
         if self.yN_overall_max <= self.yN_overall_min:
             raise ValueError("yN_overall_max must be greater than yN_overall_min")
+        # Band edges in log space, reused by every penalty evaluation.
+        object.__setattr__(self, "_log_mag_min", math.log(self.magnitude_min))
+        object.__setattr__(self, "_log_mag_max", math.log(self.magnitude_max))
+        object.__setattr__(self, "_log_yN_min", math.log(self.yN_overall_min))
+        object.__setattr__(self, "_log_yN_max", math.log(self.yN_overall_max))
+
+
+@dataclass(frozen=True)
+class AnarchyBatch:
+    """Struct-of-arrays result of :func:`sample_anarchy_batch`.
+
+    Matrix fields have shape ``(N, 3, 3)`` and the per-sample metadata shape
+    ``(N,)``, so filters are single vectorized comparisons
+    (e.g. ``batch.score > threshold``).
+    """
+
+    Ytilde_E: np.ndarray
+    Ytilde_N: np.ndarray
+    yN_overall: np.ndarray
+    band_penalty: np.ndarray
+    band_penalty_entries: np.ndarray
+    band_penalty_overall: np.ndarray
+    condition_penalty: np.ndarray
+    score: np.ndarray
+    w_band: float
+    w_cond: float
+    w_fit: float
+
+    def __len__(self) -> int:
+        return len(self.score)
 
 
 def _log_uniform(
     rng: np.random.Generator, low: float, high: float, size: Tuple[int, ...]
 ) -> np.ndarray:
     """Sample a log-uniform random array over [low, high]."""
-    log_low = np.log(low)
-    log_high = np.log(high)
-    return np.exp(rng.uniform(log_low, log_high, size=size))
+    return _log_uniform_precomp(rng, math.log(low), math.log(high), size)
+
+
+def _log_uniform_precomp(
+    rng: np.random.Generator, log_low: float, log_high: float, size: Tuple[int, ...]
+) -> np.ndarray:
+    """``_log_uniform`` with precomputed log bounds, fused into one buffer.
+
+    Consumes the stream exactly like ``rng.uniform(log_low, log_high, size)``.
+    """
+    out = rng.random(size)
+    out *= log_high - log_low
+    out += log_low
+    return np.exp(out, out=out)
 
 
 def _log_band_penalty(values: np.ndarray, low: float, high: float) -> np.ndarray:
     """Element-wise squared log penalty for values outside [low, high]."""
-    safe = np.clip(np.asarray(values, dtype=float), np.finfo(float).tiny, None)
-    upper = np.maximum(0.0, np.log(safe) - np.log(high))
-    lower = np.maximum(0.0, np.log(low) - np.log(safe))
+    return _log_band_penalty_precomp(values, math.log(low), math.log(high))
+
+
+def _log_band_penalty_precomp(
+    values: np.ndarray, log_low: float, log_high: float
+) -> np.ndarray:
+    """``_log_band_penalty`` with the band edges already in log space."""
+    log_safe = np.log(np.clip(np.asarray(values, dtype=float), np.finfo(float).tiny, None))
+    upper = np.maximum(0.0, log_safe - log_high)
+    lower = np.maximum(0.0, log_low - log_safe)
     return upper * upper + lower * lower
 
 
 def sample_complex_matrix(
     rng: np.random.Generator,
-    shape: Tuple[int, int],
+    shape: Tuple[int, ...],
     magnitude_min: float,
     magnitude_max: float,
     phase_min: float,
     phase_max: float,
 ) -> np.ndarray:
     """Sample a complex matrix with log-uniform magnitudes and uniform phases."""
-    magnitudes = _log_uniform(rng, magnitude_min, magnitude_max, size=shape)
+    return _sample_complex_matrix_precomp(
+        rng, shape, math.log(magnitude_min), math.log(magnitude_max), phase_min, phase_max
+    )
+
+
+def _sample_complex_matrix_precomp(
+    rng: np.random.Generator,
+    shape: Tuple[int, ...],
+    log_mag_min: float,
+    log_mag_max: float,
+    phase_min: float,
+    phase_max: float,
+) -> np.ndarray:
+    """``sample_complex_matrix`` with the magnitude band already in log space."""
+    magnitudes = _log_uniform_precomp(rng, log_mag_min, log_mag_max, shape)
     phases = rng.uniform(phase_min, phase_max, size=shape)
     return magnitudes * np.exp(1j * phases)
 
 
+_TINY = float(np.finfo(float).tiny)
+
+
+def _band_penalty3(matrix: np.ndarray, log_low: float, log_high: float) -> float:
+    """Scalar ``math`` loop for the summed band penalty of a 3x3 matrix."""
+    total = 0.0
+    for row in matrix.tolist():
+        for z in row:
+            log_a = math.log(max(abs(z), _TINY))
+            if log_a > log_high:
+                total += (log_a - log_high) ** 2
+            elif log_a < log_low:
+                total += (log_low - log_a) ** 2
+            elif log_a != log_a:
+                return math.nan
+    return total
+
+
+def _matrix_band_penalty(matrix: np.ndarray, log_low: float, log_high: float) -> float:
+    """Summed band penalty, using the scalar kernel for 3x3 inputs."""
+    matrix = np.asarray(matrix)
+    if matrix.shape == (3, 3):
+        return _band_penalty3(matrix, log_low, log_high)
+    return float(np.sum(_log_band_penalty_precomp(np.abs(matrix), log_low, log_high)))
+
+
 def band_penalty(matrix: np.ndarray, magnitude_min: float, magnitude_max: float) -> float:
     """Penalty for matrix entries outside [magnitude_min, magnitude_max]."""
-    abs_entries = np.abs(np.asarray(matrix, dtype=complex))
-    return float(np.sum(_log_band_penalty(abs_entries, magnitude_min, magnitude_max)))
+    return _matrix_band_penalty(matrix, math.log(magnitude_min), math.log(magnitude_max))
+
+
+def _max_eig_hermitian3(h00, h11, h22, h01, h02, h12) -> float:
+    """Largest eigenvalue of a 3x3 Hermitian matrix (trigonometric cubic root)."""
+    p1 = abs(h01) ** 2 + abs(h02) ** 2 + abs(h12) ** 2
+    q = (h00 + h11 + h22) / 3.0
+    a, b, c = h00 - q, h11 - q, h22 - q
+    p2 = a * a + b * b + c * c + 2.0 * p1
+    if p2 == 0.0:
+        return q
+    p = math.sqrt(p2 / 6.0)
+    det = (
+        a * b * c
+        + 2.0 * (h01 * h12 * h02.conjugate()).real
+        - a * abs(h12) ** 2
+        - b * abs(h02) ** 2
+        - c * abs(h01) ** 2
+    )
+    r = min(1.0, max(-1.0, det / (2.0 * p * p * p)))
+    return q + 2.0 * p * math.cos(math.acos(r) / 3.0)
+
+
+def _gram_max_eig3(rows) -> float:
+    """Largest eigenvalue of M^H M for a 3x3 matrix given as nested rows."""
+    (a0, a1, a2), (b0, b1, b2), (c0, c1, c2) = rows
+    return _max_eig_hermitian3(
+        abs(a0) ** 2 + abs(b0) ** 2 + abs(c0) ** 2,
+        abs(a1) ** 2 + abs(b1) ** 2 + abs(c1) ** 2,
+        abs(a2) ** 2 + abs(b2) ** 2 + abs(c2) ** 2,
+        a0.conjugate() * a1 + b0.conjugate() * b1 + c0.conjugate() * c1,
+        a0.conjugate() * a2 + b0.conjugate() * b2 + c0.conjugate() * c2,
+        a1.conjugate() * a2 + b1.conjugate() * b2 + c1.conjugate() * c2,
+    )
+
+
+def _cond3(matrix: np.ndarray) -> float:
+    """2-norm condition number of a 3x3 matrix without a LAPACK SVD.
+
+    Uses cond(M) = ||M||_2 ||M^{-1}||_2 with M^{-1} = adj(M) / det(M); both
+    norms are the largest eigenvalue of a Gram matrix, which the closed-form
+    cubic resolves accurately even when M is badly conditioned.  M is first
+    scaled by its largest entry (cond is scale-invariant) so the squared
+    entries cannot overflow; non-finite inputs go to ``np.linalg.cond``.
+    """
+    rows = np.asarray(matrix).tolist()
+    magnitudes = [abs(z) for row in rows for z in row]
+    scale = max(magnitudes)
+    if not all(map(math.isfinite, magnitudes)):
+        return float(np.linalg.cond(matrix))
+    if scale == 0.0:
+        return float("inf")
+    rows = [[z / scale for z in row] for row in rows]
+    (a0, a1, a2), (b0, b1, b2), (c0, c1, c2) = rows
+    C00, C01, C02 = b1 * c2 - b2 * c1, b2 * c0 - b0 * c2, b0 * c1 - b1 * c0
+    C10, C11, C12 = a2 * c1 - a1 * c2, a0 * c2 - a2 * c0, a1 * c0 - a0 * c1
+    C20, C21, C22 = a1 * b2 - a2 * b1, a2 * b0 - a0 * b2, a0 * b1 - a1 * b0
+    det = a0 * C00 + a1 * C01 + a2 * C02
+    adjugate = ((C00, C10, C20), (C01, C11, C21), (C02, C12, C22))
+
+    norm_sq = _gram_max_eig3(rows)
+    inv_norm_sq = _gram_max_eig3(adjugate)
+    if math.isnan(norm_sq) or math.isnan(inv_norm_sq):
+        return float("nan")
+    if det == 0 or math.isinf(norm_sq) or math.isinf(inv_norm_sq):
+        return float("inf")
+    return math.sqrt(max(norm_sq, 0.0) * max(inv_norm_sq, 0.0)) / abs(det)
 
 
 def compute_anarchy_score(
@@ -91,7 +245,10 @@ def compute_anarchy_score(
     -------
     (score, condition_penalty)
     """
-    cond_val = float(np.linalg.cond(ytilde_n))
+    if np.shape(ytilde_n) == (3, 3):
+        cond_val = _cond3(ytilde_n)
+    else:
+        cond_val = float(np.linalg.cond(ytilde_n))
     if not np.isfinite(cond_val) or cond_val <= 0:
         cond_penalty = float("inf")
     else:
@@ -102,12 +259,16 @@ def compute_anarchy_score(
 
 def infer_overall_scale(y_n_bar_matrix: np.ndarray) -> float:
     """Infer yN_overall from a solved matrix using geometric-mean magnitude."""
-    abs_entries = np.abs(np.asarray(y_n_bar_matrix, dtype=complex)).reshape(-1)
-    finite = abs_entries[np.isfinite(abs_entries)]
-    if finite.size == 0:
+    log_sum = 0.0
+    n_finite = 0
+    for z in np.asarray(y_n_bar_matrix).ravel().tolist():
+        a = abs(z)
+        if math.isfinite(a):
+            log_sum += math.log(max(a, _TINY))
+            n_finite += 1
+    if n_finite == 0:
         raise ValueError("y_n_bar_matrix must contain at least one finite entry")
-    finite = np.clip(finite, np.finfo(float).tiny, None)
-    return float(np.exp(np.mean(np.log(finite))))
+    return math.exp(log_sum / n_finite)
 
 
 def score_anarchy_from_matrix(
@@ -123,13 +284,11 @@ def score_anarchy_from_matrix(
     yN_overall = infer_overall_scale(y_n_bar_matrix)
     ytilde_n = y_n_bar_matrix / yN_overall
 
-    p_band_entries = band_penalty(ytilde_n, config.magnitude_min, config.magnitude_max)
+    p_band_entries = _matrix_band_penalty(
+        ytilde_n, config._log_mag_min, config._log_mag_max
+    )
     p_band_overall = float(
-        _log_band_penalty(
-            np.array([yN_overall], dtype=float),
-            config.yN_overall_min,
-            config.yN_overall_max,
-        )[0]
+        _log_band_penalty_precomp(yN_overall, config._log_yN_min, config._log_yN_max)
     )
     p_band = p_band_entries + p_band_overall
 
@@ -162,33 +321,21 @@ def sample_anarchy_state(
     chi2_total: float = 0.0,
 ) -> Dict[str, object]:
     """Sample anarchic Yukawa structures and compute score metadata."""
-    ytilde_e = sample_complex_matrix(
-        rng,
-        shape=(3, 3),
-        magnitude_min=config.magnitude_min,
-        magnitude_max=config.magnitude_max,
-        phase_min=config.phase_min,
-        phase_max=config.phase_max,
-    )
-    ytilde_n = sample_complex_matrix(
-        rng,
-        shape=(3, 3),
-        magnitude_min=config.magnitude_min,
-        magnitude_max=config.magnitude_max,
-        phase_min=config.phase_min,
-        phase_max=config.phase_max,
+    ytilde_e = _sample_complex_matrix_precomp(
+        rng, (3, 3), config._log_mag_min, config._log_mag_max, config.phase_min, config.phase_max
+    )
+    ytilde_n = _sample_complex_matrix_precomp(
+        rng, (3, 3), config._log_mag_min, config._log_mag_max, config.phase_min, config.phase_max
     )
     yN_overall = float(
-        _log_uniform(rng, config.yN_overall_min, config.yN_overall_max, size=(1,))[0]
+        _log_uniform_precomp(rng, config._log_yN_min, config._log_yN_max, (1,))[0]
     )
 
-    p_band_entries = band_penalty(ytilde_n, config.magnitude_min, config.magnitude_max)
+    p_band_entries = _matrix_band_penalty(
+        ytilde_n, config._log_mag_min, config._log_mag_max
+    )
     p_band_overall = float(
-        _log_band_penalty(
-            np.array([yN_overall], dtype=float),
-            config.yN_overall_min,
-            config.yN_overall_max,
-        )[0]
+        _log_band_penalty_precomp(yN_overall, config._log_yN_min, config._log_yN_max)
     )
     p_band = p_band_entries + p_band_overall
     score, cond_penalty = compute_anarchy_score(
@@ -213,3 +360,126 @@ def sample_anarchy_state(
         "w_cond": float(config.w_cond),
         "w_fit": float(config.w_fit),
     }
+
+
+def _condition_penalty_batch(ytilde_n: np.ndarray) -> np.ndarray:
+    """``log(cond)**2`` for a stack of matrices; inf for singular/non-finite ones."""
+    cond_penalty = np.full(ytilde_n.shape[0], np.inf)
+    finite = np.all(np.isfinite(ytilde_n), axis=(1, 2))
+    if np.any(finite):
+        s = np.linalg.svd(ytilde_n[finite], compute_uv=False)  # descending
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cond_val = s[:, 0] / s[:, -1]
+            cond_penalty[finite] = np.where(
+                np.isfinite(cond_val) & (cond_val > 0), np.log(cond_val) ** 2, np.inf
+            )
+    return cond_penalty
+
+
+def score_anarchy_from_matrices(
+    y_n_bar_matrices: np.ndarray,
+    config: AnarchyConfig,
+    chi2_total: float = 0.0,
+) -> Dict[str, object]:
+    """Vectorized ``score_anarchy_from_matrix`` over an ``(N, 3, 3)`` stack.
+
+    Returns the same keys with a leading row axis on the per-matrix values.
+    """
+    y_n_bar_matrices = np.asarray(y_n_bar_matrices)
+    if y_n_bar_matrices.ndim != 3 or y_n_bar_matrices.shape[1:] != (3, 3):
+        raise ValueError(
+            f"y_n_bar_matrices must have shape (N, 3, 3), got {y_n_bar_matrices.shape}"
+        )
+
+    abs_entries = np.abs(y_n_bar_matrices).reshape(len(y_n_bar_matrices), 9)
+    finite = np.isfinite(abs_entries)
+    n_finite = np.count_nonzero(finite, axis=1)
+    if np.any(n_finite == 0):
+        raise ValueError("y_n_bar_matrix must contain at least one finite entry")
+    log_abs = np.log(np.clip(np.where(finite, abs_entries, 1.0), _TINY, None))
+    yN_overall = np.exp(np.sum(log_abs, axis=1) / n_finite)
+    ytilde_n = y_n_bar_matrices / yN_overall[:, np.newaxis, np.newaxis]
+
+    p_band_entries = np.sum(
+        _log_band_penalty_precomp(np.abs(ytilde_n), config._log_mag_min, config._log_mag_max),
+        axis=(1, 2),
+    )
+    p_band_overall = _log_band_penalty_precomp(
+        yN_overall, config._log_yN_min, config._log_yN_max
+    )
+    p_band = p_band_entries + p_band_overall
+
+    cond_penalty = _condition_penalty_batch(ytilde_n)
+    score = (
+        -config.w_band * p_band - config.w_cond * cond_penalty
+        - config.w_fit * float(chi2_total)
+    )
+
+    return {
+        "Ytilde_N": ytilde_n,
+        "yN_overall": yN_overall,
+        "band_penalty": p_band,
+        "band_penalty_entries": p_band_entries,
+        "band_penalty_overall": p_band_overall,
+        "condition_penalty": cond_penalty,
+        "score": score,
+        "w_band": float(config.w_band),
+        "w_cond": float(config.w_cond),
+        "w_fit": float(config.w_fit),
+    }
+
+
+def sample_anarchy_batch(
+    rng: np.random.Generator,
+    config: AnarchyConfig,
+    n_samples: int,
+    chi2_total: float = 0.0,
+) -> AnarchyBatch:
+    """Vectorized ``sample_anarchy_state`` for *n_samples* draws at once.
+
+    Returns an :class:`AnarchyBatch` with the ``sample_anarchy_state`` fields
+    stored as parallel arrays.  The RNG stream is consumed in bulk, so
+    individual draws differ from ``n_samples`` sequential
+    ``sample_anarchy_state`` calls.
+    """
+    if n_samples < 0:
+        raise ValueError("n_samples must be non-negative")
+    shape = (n_samples, 3, 3)
+    ytilde_e = _sample_complex_matrix_precomp(
+        rng, shape, config._log_mag_min, config._log_mag_max, config.phase_min, config.phase_max
+    )
+    ytilde_n = _sample_complex_matrix_precomp(
+        rng, shape, config._log_mag_min, config._log_mag_max, config.phase_min, config.phase_max
+    )
+    yN_overall = _log_uniform_precomp(
+        rng, config._log_yN_min, config._log_yN_max, (n_samples,)
+    )
+
+    p_band_entries = np.sum(
+        _log_band_penalty_precomp(np.abs(ytilde_n), config._log_mag_min, config._log_mag_max),
+        axis=(1, 2),
+    )
+    p_band_overall = _log_band_penalty_precomp(
+        yN_overall, config._log_yN_min, config._log_yN_max
+    )
+    p_band = p_band_entries + p_band_overall
+
+    cond_penalty = _condition_penalty_batch(ytilde_n)
+    score = (
+        -config.w_band * p_band - config.w_cond * cond_penalty
+        - config.w_fit * float(chi2_total)
+    )
+
+    return AnarchyBatch(
+        Ytilde_E=ytilde_e,
+        Ytilde_N=ytilde_n,
+        yN_overall=yN_overall,
+        band_penalty=p_band,
+        band_penalty_entries=p_band_entries,
+        band_penalty_overall=p_band_overall,
+        condition_penalty=cond_penalty,
+        score=score,
+        w_band=float(config.w_band),
+        w_cond=float(config.w_cond),
+        w_fit=float(config.w_fit),
+    )
@@ -0,0 +1,203 @@
+"""Metropolis–Hastings alternative to the dense grid scan.
+
+When the accepted region is a small corner of the (c_L, c_N, c_E) box, most
+grid points are spent confirming rejections.  ``run_mcmc_scan`` instead walks
+a random-walk Metropolis chain over the box spanned by the ``ScanConfig``
+grids, evaluating each proposal with the same ``_evaluate_point`` as
+``run_scan``, so the chain concentrates where the filters pass.
+
+Target density (up to a constant):
+- ``-inf`` for non-perturbative points or points the solver rejects,
+- a one-sided Gaussian tail ``-0.5 * ((lfv_ratio - 1) / lfv_sigma)**2`` once
+  the mu-to-e-gamma bound is violated (flat below it),
+- minus ``natural_penalty`` outside the naturalness window.
+
+``Lambda_IR``, ``MN_over_k`` and the lightest neutrino mass are held at the
+first value of their grids.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .scan import (
+    CSV_COLUMNS,
+    ScanConfig,
+    _evaluate_point,
+    _lfv_coefficient,
+    _resolve_git_metadata,
+    _row_template,
+    _sample_seed,
+)
+
+# Chain coordinates, in order.
+MCMC_PARAMETERS = ("c_L", "c_N", "c_E1", "c_E2", "c_E3")
+
+
+def _parameter_bounds(config: ScanConfig) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (lower, upper) box for ``MCMC_PARAMETERS`` from the grids."""
+    axes = [config.c_L_values, config.c_N_values, *config._c_E_axes]
+    lower = np.array([float(np.min(axis)) for axis in axes])
+    upper = np.array([float(np.max(axis)) for axis in axes])
+    return lower, upper
+
+
+def _log_target(row: Dict[str, Any], lfv_sigma: float, natural_penalty: float) -> float:
+    """Unnormalized log-density of one evaluated point."""
+    if not row["perturbative"]:
+        return -math.inf
+    log_p = 0.0
+    excess = row["lfv_ratio"] - 1.0
+    if excess > 0.0:
+        log_p -= 0.5 * (excess / lfv_sigma) ** 2
+    if not row["natural"]:
+        log_p -= natural_penalty
+    return log_p
+
+
+def run_mcmc_scan(
+    config: ScanConfig,
+    n_samples: int,
+    proposal_sigma: Union[float, Sequence[float]] = 0.01,
+    lfv_sigma: float = 0.1,
+    natural_penalty: float = 5.0,
+    start: Optional[Sequence[float]] = None,
+    rng_seed: Optional[int] = None,
+    output_csv: Optional[str] = None,
+    return_rows: bool = True,
+) -> List[Dict[str, Any]]:
+    """Sample the (c_L, c_N, c_E) box with a random-walk Metropolis chain.
+
+    Parameters
+    ----------
+    config : ScanConfig
+        Scan configuration. The c_L, c_N and c_E grids only set the box
+        bounds; axes with a single value stay fixed.
+    n_samples : int
+        Number of chain steps (one ``_evaluate_point`` call each).
+    proposal_sigma : float or sequence of 5 floats
+        Gaussian proposal width per coordinate of ``MCMC_PARAMETERS``.
+    lfv_sigma : float
+        Width of the penalty tail above ``lfv_ratio = 1``.
+    natural_penalty : float
+        Log-density penalty for points outside the naturalness window.
+    start : sequence of 5 floats or None
+        Initial ``(c_L, c_N, c_E1, c_E2, c_E3)``; defaults to the box centre.
+    rng_seed : int or None
+        Seed for the chain; defaults to ``config.rng_seed_global``.
+    output_csv : str or None
+        If given, the chain is also written with the ``run_scan`` CSV schema
+        as it advances, ``config.csv_chunksize`` rows per ``writerows`` call.
+    return_rows : bool
+        Keep the chain in memory and return it. Set to False for long chains
+        that only need the CSV; an empty list is returned then.
+
+    Returns
+    -------
+    list of dict
+        One ``run_scan``-style row per step (the current chain state, so a
+        rejected proposal repeats the previous point). ``sample_index`` is
+        the step number.
+    """
+    if n_samples < 1:
+        raise ValueError("n_samples must be >= 1")
+    if lfv_sigma <= 0:
+        raise ValueError("lfv_sigma must be positive")
+
+    lower, upper = _parameter_bounds(config)
+    free = upper > lower
+    sigma = np.broadcast_to(np.asarray(proposal_sigma, dtype=float), lower.shape) * free
+    if np.any(sigma[free] <= 0):
+        raise ValueError("proposal_sigma must be positive")
+
+    current = 0.5 * (lower + upper) if start is None else np.asarray(start, dtype=float)
+    if current.shape != lower.shape:
+        raise ValueError(f"start must have {len(MCMC_PARAMETERS)} entries")
+    if np.any(current < lower) or np.any(current > upper):
+        raise ValueError("start must lie inside the scan box")
+
+    if rng_seed is None:
+        rng_seed = config.rng_seed_global
+    rng = np.random.default_rng(rng_seed)
+
+    lfv_C = _lfv_coefficient(config.br_limit, config.prefac_br)
+    git_commit, dirty_tree = _resolve_git_metadata(config.record_git_metadata)
+    Lambda_IR = float(config.Lambda_IR_values[0])
+    MN_over_k = float(config.MN_over_k_points[0])
+    lightest_nu_mass = float(config.lightest_nu_mass_values[0])
+    row_template = _row_template(config, lfv_C, git_commit, dirty_tree)
+
+    def evaluate(sample_index: int, theta: np.ndarray) -> Dict[str, Any]:
+        c_L, c_N, c_E1, c_E2, c_E3 = theta.tolist()
+        return _evaluate_point(
+            sample_index=sample_index,
+            Lambda_IR=Lambda_IR,
+            c_L=c_L,
+            c_N=c_N,
+            c_E=config._c_E_point((c_E1, c_E2, c_E3)),
+            MN_over_k=MN_over_k,
+            lightest_nu_mass=lightest_nu_mass,
+            config=config,
+            lfv_C=lfv_C,
+            git_commit=git_commit,
+            dirty_tree=dirty_tree,
+            rng_seed_sample=_sample_seed(config.rng_seed_global, sample_index),
+            extra_filters=[],
+            row_template=row_template,
+        )
+
+    rows: List[Dict[str, Any]] = []
+    with contextlib.ExitStack() as stack:
+        writer = None
+        if output_csv is not None:
+            handle = stack.enter_context(
+                open(output_csv, "w", newline="", encoding="utf-8", buffering=1 << 20)
+            )
+            writer = csv.writer(handle)
+            writer.writerow(CSV_COLUMNS)
+
+        pending: List[List[Any]] = []
+
+        def record(row: Dict[str, Any]) -> None:
+            if writer is not None:
+                pending.append([row[col] for col in CSV_COLUMNS])
+                if len(pending) >= config.csv_chunksize:
+                    writer.writerows(pending)
+                    pending.clear()
+            if return_rows:
+                rows.append(row)
+
+        current_row = evaluate(0, current)
+        current_log_p = _log_target(current_row, lfv_sigma, natural_penalty)
+        record(current_row)
+        n_accepted = 0
+        for step in range(1, n_samples):
+            proposal = current + sigma * rng.standard_normal(current.shape)
+            log_u = math.log(rng.random())
+            if np.any(proposal < lower) or np.any(proposal > upper):
+                # Outside the box the prior vanishes: reject without evaluating.
+                record(dict(current_row, sample_index=step))
+                continue
+            proposal_row = evaluate(step, proposal)
+            proposal_log_p = _log_target(proposal_row, lfv_sigma, natural_penalty)
+            if proposal_log_p > -math.inf and (
+                current_log_p == -math.inf or log_u < proposal_log_p - current_log_p
+            ):
+                current, current_row, current_log_p = proposal, proposal_row, proposal_log_p
+                n_accepted += 1
+                record(current_row)
+            else:
+                record(dict(current_row, sample_index=step))
+        if writer is not None:
+            writer.writerows(pending)
+
+    print(
+        f"MCMC complete: {n_samples} steps, "
+        f"{100 * n_accepted / max(n_samples - 1, 1):.1f}% proposals accepted"
+    )
+    return rows
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import numpy as np
 
 from neutrinos.neutrinoValues import get_pmns
 
-from .anarchy import AnarchyConfig, score_anarchy_from_matrix
+from .anarchy import AnarchyConfig, score_anarchy_from_matrices, score_anarchy_from_matrix
+
+_Y_BAR_COLUMNS = (
+    "Y_E_bar_1",
+    "Y_E_bar_2",
+    "Y_E_bar_3",
+    "Y_N_bar_1",
+    "Y_N_bar_2",
+    "Y_N_bar_3",
+)
 
 
 def _to_float(value: Any, name: str) -> float:
@@ -20,6 +30,37 @@ def _to_float(value: Any, name: str) -> float:
         raise ValueError(f"Could not parse {name}='{value}' as float") from exc
 
 
+def _float_column(values: Any, name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a column into floats plus a mask of empty (``""``/``None``) cells."""
+    if isinstance(values, (list, tuple)) and values and isinstance(values[0], str):
+        # CSV text: build the object array directly rather than round-tripping
+        # through a fixed-width unicode array.
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+    else:
+        arr = np.asarray(values)
+    if arr.dtype.kind in "biuf":
+        return arr.astype(float, copy=False).reshape(-1), np.zeros(arr.size, dtype=bool)
+    arr = arr.astype(object, copy=False).reshape(-1)
+    missing = (arr == "") | (arr == None)  # noqa: E711 - elementwise on object array
+    out = np.full(arr.size, np.nan)
+    present = arr[~missing].tolist()
+    try:
+        out[~missing] = [float(v) for v in present]
+    except (TypeError, ValueError):
+        # Re-parse cell by cell for the error message naming the bad value.
+        out[~missing] = [_to_float(v, name) for v in present]
+    return out, missing
+
+
+def _required_float_column(columns: Mapping[str, Any], name: str) -> np.ndarray:
+    """Parse a column that must be present and non-empty in every row."""
+    out, missing = _float_column(columns[name], name)
+    if np.any(missing):
+        raise ValueError(f"Could not parse {name}='' as float")
+    return out
+
+
 @dataclass(frozen=True)
 class ReclassifyConfig:
     """Configuration for post-hoc row classification."""
@@ -53,26 +94,20 @@ def reconstruct_y_n_bar_matrix(row: Dict[str, Any]) -> np.ndarray:
     ordering = str(row.get("ordering", "normal"))
     alpha = _to_float(row.get("majorana_alpha", 0.0), "majorana_alpha")
     beta = _to_float(row.get("majorana_beta", 0.0), "majorana_beta")
+    # get_pmns is memoized on (ordering, alpha, beta); scaling the columns
+    # directly is pmns @ diag(y_n_bar) without the diagonal or the matmul.
     pmns = get_pmns(ordering=ordering, alpha=alpha, beta=beta)
-    return pmns @ np.diag(y_n_bar.astype(complex))
+    return pmns * y_n_bar
 
 
 def classify_row(row: Dict[str, Any], config: ReclassifyConfig) -> Dict[str, Any]:
     """Classify one row and return reclassification metadata."""
-    y_vals = np.array(
-        [
-            _to_float(row["Y_E_bar_1"], "Y_E_bar_1"),
-            _to_float(row["Y_E_bar_2"], "Y_E_bar_2"),
-            _to_float(row["Y_E_bar_3"], "Y_E_bar_3"),
-            _to_float(row["Y_N_bar_1"], "Y_N_bar_1"),
-            _to_float(row["Y_N_bar_2"], "Y_N_bar_2"),
-            _to_float(row["Y_N_bar_3"], "Y_N_bar_3"),
-        ],
-        dtype=float,
-    )
-    abs_y = np.abs(y_vals)
-    max_y = float(np.max(abs_y))
-    min_y = float(np.min(abs_y))
+    abs_y = tuple(abs(_to_float(row[name], name)) for name in _Y_BAR_COLUMNS)
+    if any(math.isnan(y) for y in abs_y):
+        max_y = min_y = math.nan  # np.max/np.min semantics
+    else:
+        max_y = max(abs_y)
+        min_y = min(abs_y)
 
     reclass_perturbative = bool(max_y < config.max_Y_bar)
     lo, hi = config.naturalness_range
@@ -133,3 +168,173 @@ def classify_row(row: Dict[str, Any], config: ReclassifyConfig) -> Dict[str, Any
         "reclass_passes_all": len(reasons) == 0,
         "reclass_reject_reason": ";".join(reasons),
     }
+
+
+_REASON_NAMES = ("perturbativity", "naturalness", "mu_to_e_gamma", "anarchy_score")
+# _REASON_STRINGS[code] is the ";"-joined reason list for a bitmask over _REASON_NAMES.
+_REASON_STRINGS = np.array(
+    [
+        ";".join(name for bit, name in enumerate(_REASON_NAMES) if code >> bit & 1)
+        for code in range(1 << len(_REASON_NAMES))
+    ],
+    dtype=object,
+)
+
+
+@dataclass(frozen=True)
+class ClassifyColumns:
+    """Struct-of-arrays classifier inputs, parsed once from CSV-style columns.
+
+    ``y_bar`` has shape ``(N, 6)`` in ``Y_E_bar_1..3, Y_N_bar_1..3`` order.
+    The LFV bound is stored as ``lfv_lhs <= lfv_rhs`` for every row (rows
+    with an ``lfv_ratio`` use ``(ratio, 1.0)``), and ``pmns`` holds the
+    ``(N, 3, 3)`` PMNS matrices; both are ``None`` when the config does not
+    need them.
+    """
+
+    y_bar: np.ndarray
+    lfv_lhs: Optional[np.ndarray] = None
+    lfv_rhs: Optional[np.ndarray] = None
+    pmns: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.y_bar)
+
+    @classmethod
+    def from_columns(
+        cls, columns: Mapping[str, Any], config: ReclassifyConfig
+    ) -> "ClassifyColumns":
+        """Parse the columns ``config`` needs from a name -> sequence mapping.
+
+        ``columns`` may be a pandas DataFrame or a dict of lists/arrays;
+        empty (``""``/``None``) LFV cells fall back to ``lfv_lhs``/``lfv_rhs``.
+        """
+        y_bar = np.column_stack([_required_float_column(columns, c) for c in _Y_BAR_COLUMNS])
+        n_rows = len(y_bar)
+
+        lfv_lhs = lfv_rhs = None
+        if config.require_lfv:
+            lfv_lhs = np.full(n_rows, np.nan)
+            lfv_rhs = np.ones(n_rows)
+            use_ratio = np.zeros(n_rows, dtype=bool)
+            if "lfv_ratio" in columns:
+                ratio, ratio_missing = _float_column(columns["lfv_ratio"], "lfv_ratio")
+                use_ratio = ~ratio_missing
+                lfv_lhs[use_ratio] = ratio[use_ratio]
+            fallback = ~use_ratio
+            if np.any(fallback):
+                if "lfv_lhs" not in columns or "lfv_rhs" not in columns:
+                    raise ValueError(
+                        "Row is missing LFV fields (need lfv_ratio or lfv_lhs/lfv_rhs)"
+                    )
+                lhs, lhs_missing = _float_column(columns["lfv_lhs"], "lfv_lhs")
+                rhs, rhs_missing = _float_column(columns["lfv_rhs"], "lfv_rhs")
+                if np.any(fallback & (lhs_missing | rhs_missing)):
+                    raise ValueError(
+                        "Row is missing LFV fields (need lfv_ratio or lfv_lhs/lfv_rhs)"
+                    )
+                lfv_lhs[fallback] = lhs[fallback]
+                lfv_rhs[fallback] = rhs[fallback]
+
+        pmns = None
+        if config.anarchy is not None and n_rows:
+            orderings = (
+                np.asarray(columns["ordering"]).astype(str).reshape(-1)
+                if "ordering" in columns
+                else np.full(n_rows, "normal")
+            )
+            alphas = (
+                _required_float_column(columns, "majorana_alpha")
+                if "majorana_alpha" in columns
+                else np.zeros(n_rows)
+            )
+            betas = (
+                _required_float_column(columns, "majorana_beta")
+                if "majorana_beta" in columns
+                else np.zeros(n_rows)
+            )
+            # Scans usually share one (ordering, alpha, beta); build each
+            # distinct PMNS once and gather it per row.
+            keys = list(zip(orderings.tolist(), alphas.tolist(), betas.tolist()))
+            key_index: Dict[Tuple[str, float, float], int] = {}
+            row_key = np.array([key_index.setdefault(k, len(key_index)) for k in keys])
+            distinct = np.stack([get_pmns(ordering=o, alpha=a, beta=b) for o, a, b in key_index])
+            pmns = distinct[row_key]
+
+        return cls(y_bar=y_bar, lfv_lhs=lfv_lhs, lfv_rhs=lfv_rhs, pmns=pmns)
+
+
+def classify_columns(cols: ClassifyColumns, config: ReclassifyConfig) -> Dict[str, np.ndarray]:
+    """Columnwise ``classify_row`` on already parsed :class:`ClassifyColumns`.
+
+    Returns the ``classify_row`` keys mapped to arrays with one entry per row.
+    """
+    n_rows = len(cols)
+    abs_y = np.abs(cols.y_bar)
+    max_y = abs_y.max(axis=1) if n_rows else np.zeros(0)
+    min_y = abs_y.min(axis=1) if n_rows else np.zeros(0)
+
+    reclass_perturbative = max_y < config.max_Y_bar
+    lo, hi = config.naturalness_range
+    reclass_natural = (min_y >= lo) & (max_y <= hi)
+
+    if config.require_lfv:
+        if cols.lfv_lhs is None or cols.lfv_rhs is None:
+            raise ValueError("ClassifyColumns was parsed without LFV fields")
+        reclass_lfv_passes = cols.lfv_lhs <= cols.lfv_rhs
+    else:
+        reclass_lfv_passes = np.ones(n_rows, dtype=bool)
+
+    anarchy_score = np.full(n_rows, np.nan)
+    anarchy_band_penalty = np.full(n_rows, np.nan)
+    anarchy_condition_penalty = np.full(n_rows, np.nan)
+    anarchy_yN_overall = np.full(n_rows, np.nan)
+    anarchy_rejected = np.zeros(n_rows, dtype=bool)
+    if config.anarchy is not None and n_rows:
+        if cols.pmns is None:
+            raise ValueError("ClassifyColumns was parsed without PMNS matrices")
+        y_n_bar = cols.y_bar[:, 3:]
+        anarchy_state = score_anarchy_from_matrices(
+            cols.pmns * y_n_bar[:, np.newaxis, :], config=config.anarchy
+        )
+        anarchy_score = anarchy_state["score"]
+        anarchy_band_penalty = anarchy_state["band_penalty"]
+        anarchy_condition_penalty = anarchy_state["condition_penalty"]
+        anarchy_yN_overall = anarchy_state["yN_overall"]
+        if config.anarchy_min_score is not None:
+            anarchy_rejected = anarchy_score < config.anarchy_min_score
+
+    # Pack the four failure masks into one small integer per row and look the
+    # joined reason string up in a 16-entry table instead of joining per row.
+    reason_code = (
+        (~reclass_perturbative).astype(np.intp)
+        | ((~reclass_natural).astype(np.intp) << 1)
+        | ((~reclass_lfv_passes).astype(np.intp) << 2)
+        | (anarchy_rejected.astype(np.intp) << 3)
+    )
+
+    return {
+        "reclass_max_Y_bar_observed": max_y,
+        "reclass_min_Y_bar_observed": min_y,
+        "reclass_perturbative": reclass_perturbative,
+        "reclass_natural": reclass_natural,
+        "reclass_lfv_passes": reclass_lfv_passes,
+        "reclass_anarchy_score": anarchy_score,
+        "reclass_anarchy_band_penalty": anarchy_band_penalty,
+        "reclass_anarchy_condition_penalty": anarchy_condition_penalty,
+        "reclass_anarchy_yN_overall": anarchy_yN_overall,
+        "reclass_passes_all": reason_code == 0,
+        "reclass_reject_reason": _REASON_STRINGS[reason_code],
+    }
+
+
+def classify_rows_batch(
+    columns: Mapping[str, Any], config: ReclassifyConfig
+) -> Dict[str, np.ndarray]:
+    """Columnwise ``classify_row`` over many rows at once.
+
+    ``columns`` maps column names to equal-length sequences (a pandas
+    DataFrame or a dict of lists/arrays both work). Returns the
+    ``classify_row`` keys mapped to arrays with one entry per row.
+    """
+    return classify_columns(ClassifyColumns.from_columns(columns, config), config)
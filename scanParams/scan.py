@@ -13,26 +13,36 @@ Conventions implemented here follow ``scanParams/THEORY_PRIORS.md``:
 from __future__ import annotations
 
 import csv
+import io
 import itertools
+import math
+import multiprocessing as mp
+import os
+import queue
 import subprocess
+import threading
 import time
+import warnings
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from flavorConstraints import (
     PREFAC_BR,
     check_mu_to_e_gamma,
+    check_mu_to_e_gamma_batch,
     coefficient_from_br_limit,
     perez_randall_lfv_m_kk_from_lambda_ir,
 )
-from warpConfig.baseParams import MPL
-from warpConfig.wavefuncs import f_IR
-from yukawa import YukawaResult, compute_all_yukawas
+from neutrinos.neutrinoValues import get_pmns
+from warpConfig.baseParams import MPL, get_warp_params_vec
+from warpConfig.wavefuncs import f_IR_from_logeps, f_UV_from_logeps
+from yukawa import YukawaResult, compute_all_yukawas, compute_all_yukawas_batch
 
-from .anarchy import AnarchyConfig, score_anarchy_from_matrix
+from .anarchy import AnarchyConfig, score_anarchy_from_matrices, score_anarchy_from_matrix
 
 # Published MEG II bound (2025): BR(mu -> e gamma) < 1.5e-13 (90% CL).
 BR_LIMIT_MEGII_2025 = 1.5e-13
@@ -100,6 +110,42 @@ CSV_COLUMNS = [
     "anarchy_yN_overall",
 ]
 
+_PASSES_ALL_INDEX = CSV_COLUMNS.index("passes_all")
+# Default ScanConfig.csv_chunksize.
+_CSV_BATCH_ROWS = 1024
+# Batches the writer thread may fall behind before run_scan blocks.
+_CSV_QUEUE_BATCHES = 8
+# Queue item asking the writer thread to flush the file.
+_CSV_FLUSH = object()
+
+# Column dtypes for ``run_scan(..., columnar=True)``. Free-form strings and
+# fields that may be None (git metadata, seeds) are stored as objects.
+_OBJECT_COLUMNS = frozenset(
+    {
+        "git_commit",
+        "dirty_tree",
+        "rng_seed_global",
+        "rng_seed_sample",
+        "lfv_model",
+        "MN_mode",
+        "ordering",
+        "reject_reason",
+    }
+)
+_BOOL_COLUMNS = frozenset(
+    {"perturbative", "natural", "lfv_passes", "passes_all", "anarchy_enabled"}
+)
+
+
+def _column_dtype(column: str) -> Any:
+    if column == "sample_index":
+        return np.int64
+    if column in _OBJECT_COLUMNS:
+        return object
+    if column in _BOOL_COLUMNS:
+        return bool
+    return np.float64
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────
 
@@ -131,13 +177,56 @@ def _run_git(args: List[str], repo_root: Path) -> str:
     return proc.stdout.strip()
 
 
+def _read_git_head(repo_root: Path) -> str:
+    """Return the HEAD commit read from ``.git`` directly (empty string if unsure).
+
+    Handles a detached HEAD and branch refs stored loose or in
+    ``packed-refs``.  Worktrees, submodules (``.git`` is a file) and anything
+    unexpected return "" so the caller falls back to ``git rev-parse``.
+    """
+    git_dir = repo_root / ".git"
+    try:
+        if not git_dir.is_dir():
+            return ""
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref:"):
+            sha = head
+        else:
+            ref = head[len("ref:"):].strip()
+            ref_path = git_dir / ref
+            if ref_path.is_file():
+                sha = ref_path.read_text(encoding="utf-8").strip()
+            else:
+                sha = ""
+                packed = git_dir / "packed-refs"
+                if packed.is_file():
+                    for line in packed.read_text(encoding="utf-8").splitlines():
+                        parts = line.split()
+                        if len(parts) == 2 and parts[1] == ref:
+                            sha = parts[0]
+                            break
+    except OSError:
+        return ""
+    if len(sha) in (40, 64) and all(ch in "0123456789abcdef" for ch in sha):
+        return sha
+    return ""
+
+
+@lru_cache(maxsize=2)
 def _resolve_git_metadata(enabled: bool) -> Tuple[str, Optional[bool]]:
-    """Return (git_commit, dirty_tree) metadata."""
+    """Return (git_commit, dirty_tree) metadata.
+
+    Resolved once per process: drivers that sweep several ``ScanConfig``s
+    would otherwise fork ``git`` twice per scan.  ``dirty_tree`` therefore
+    reflects the working tree at the first scan of the session.  The commit
+    is read from ``.git`` without a subprocess when the layout allows; the
+    dirty check still asks ``git status``, which compares against the index.
+    """
     if not enabled:
         return "disabled", None
 
     repo_root = Path(__file__).resolve().parents[1]
-    git_commit = _run_git(["rev-parse", "HEAD"], repo_root)
+    git_commit = _read_git_head(repo_root) or _run_git(["rev-parse", "HEAD"], repo_root)
     if not git_commit:
         return "unknown", None
 
@@ -146,24 +235,110 @@ def _resolve_git_metadata(enabled: bool) -> Tuple[str, Optional[bool]]:
     return git_commit, dirty_tree
 
 
+@lru_cache(maxsize=16)
+def _lfv_coefficient(br_limit: float, prefac_br: float) -> float:
+    """Memoized ``coefficient_from_br_limit`` for the scan's LFV bound."""
+    return coefficient_from_br_limit(br_limit, prefactor=prefac_br)
+
+
 def _sample_seed(global_seed: Optional[int], sample_index: int) -> Optional[int]:
-    """Derive a deterministic per-sample seed from a global seed."""
+    """Derive a deterministic per-sample seed from a global seed.
+
+    The seed is ``SeedSequence([global_seed, sample_index])``'s first uint64
+    word.  This runs once per scan point, so for a 32-bit ``global_seed`` the
+    same uint32 entropy words are passed packed into one int (cheaper to
+    coerce than a list) and the two uint32 output words are joined by hand.
+    """
     if global_seed is None:
         return None
-    seed_seq = np.random.SeedSequence([int(global_seed), int(sample_index)])
+    global_seed = int(global_seed)
+    sample_index = int(sample_index)
+    if 0 <= global_seed < 1 << 32 and sample_index >= 0:
+        seed_seq = np.random.SeedSequence(global_seed | (sample_index << 32))
+        lo, hi = seed_seq.generate_state(2, dtype=np.uint32).tolist()
+        return lo | (hi << 32)
+    seed_seq = np.random.SeedSequence([global_seed, sample_index])
     return int(seed_seq.generate_state(1, dtype=np.uint64)[0])
 
 
-def _ratio_from_delta(c0: float, delta: float, epsilon: float, mode: str) -> float:
+# numpy.random.SeedSequence hashing constants (bit_generator.pyx, pool size 4).
+# They are numpy internals, so tests/test_scan.py checks the replay below
+# against the public SeedSequence over a wide range of seeds and indices.
+_SS_INIT_A = 0x43B0D7E5
+_SS_MULT_A = 0x931E8875
+_SS_INIT_B = 0x8B51F9DD
+_SS_MULT_B = 0x58F38DED
+_SS_MIX_MULT_L = 0xCA01F9DD
+_SS_MIX_MULT_R = 0x4973F715
+_SS_POOL_SIZE = 4
+
+
+def _sample_seeds(global_seed: Optional[int], start: int, stop: int) -> List[Optional[int]]:
+    """``[_sample_seed(global_seed, i) for i in range(start, stop)]``, vectorized.
+
+    For a 32-bit ``global_seed`` and indices below 2**32 the entropy of every
+    ``SeedSequence([global_seed, i])`` is the two uint32 words
+    ``(global_seed, i)``, so the SeedSequence pool mixing and
+    ``generate_state`` hashing are replayed on uint32 arrays over the whole
+    index range (the hash constants do not depend on the data).  Other seeds
+    fall back to the scalar derivation.
+    """
+    if global_seed is None:
+        return [None] * (stop - start)
+    global_seed = int(global_seed)
+    if not (0 <= global_seed < 1 << 32 and 0 <= start <= stop <= 1 << 32):
+        return [_sample_seed(global_seed, i) for i in range(start, stop)]
+
+    hash_const = _SS_INIT_A
+
+    def hashmix(value: np.ndarray) -> np.ndarray:
+        nonlocal hash_const
+        value = value ^ np.uint32(hash_const)
+        hash_const = (hash_const * _SS_MULT_A) & 0xFFFFFFFF
+        value = value * np.uint32(hash_const)
+        return value ^ (value >> np.uint32(16))
+
+    def mix(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        result = np.uint32(_SS_MIX_MULT_L) * x - np.uint32(_SS_MIX_MULT_R) * y
+        return result ^ (result >> np.uint32(16))
+
+    index = np.arange(start, stop, dtype=np.uint32)
+    entropy = [np.full_like(index, global_seed), index]
+    entropy += [np.zeros_like(index)] * (_SS_POOL_SIZE - len(entropy))
+    pool = [hashmix(word) for word in entropy]
+    for i_src in range(_SS_POOL_SIZE):
+        for i_dst in range(_SS_POOL_SIZE):
+            if i_src != i_dst:
+                pool[i_dst] = mix(pool[i_dst], hashmix(pool[i_src]))
+
+    # generate_state(1, dtype=np.uint64): two uint32 words, low word first.
+    hash_const = _SS_INIT_B
+    words = []
+    for value in pool[:2]:
+        value = value ^ np.uint32(hash_const)
+        hash_const = (hash_const * _SS_MULT_B) & 0xFFFFFFFF
+        value = value * np.uint32(hash_const)
+        words.append((value ^ (value >> np.uint32(16))).astype(np.uint64))
+    return (words[0] | (words[1] << np.uint64(32))).tolist()
+
+
+def _f_IR_scalar(c: float, log_eps: float) -> float:
+    """Plain-float ``f_IR_from_logeps`` for the bisection loops (same formula)."""
+    if c == 0.5:
+        return math.sqrt(1.0 / (-2.0 * log_eps))
+    try:
+        res_sq = (0.5 - c) / -math.expm1((1.0 - 2.0 * c) * log_eps)
+    except OverflowError:
+        res_sq = 0.0
+    return math.sqrt(res_sq)
+
+
+def _ratio_from_delta(c0: float, delta: float, log_eps: float, mode: str) -> float:
     """Return f_IR ratio at a given delta for a selected degeneracy mode."""
     if mode == "symmetric":
-        num = float(f_IR(c0 - delta, epsilon))
-        den = float(f_IR(c0 + delta, epsilon))
-        return num / den
+        return _f_IR_scalar(c0 - delta, log_eps) / _f_IR_scalar(c0 + delta, log_eps)
     if mode == "one_sided":
-        num = float(f_IR(c0 - delta, epsilon))
-        den = float(f_IR(c0, epsilon))
-        return num / den
+        return _f_IR_scalar(c0 - delta, log_eps) / _f_IR_scalar(c0, log_eps)
     raise ValueError(f"Unknown mode: {mode}")
 
 
@@ -174,41 +349,108 @@ def _solve_delta_c_for_ratio(
     mode: str,
 ) -> float:
     """Solve for delta c such that the selected ratio equals max_fL_ratio."""
+    log_eps = math.log(epsilon)
     # Keep search away from c -> 0.5 singular neighborhood.
     hi = min(0.05, max(1e-6, c0 - 0.500001))
     lo = 0.0
 
     # Expand bracket if needed (should be rare in scanner ranges).
-    ratio_hi = _ratio_from_delta(c0, hi, epsilon, mode)
+    ratio_hi = _ratio_from_delta(c0, hi, log_eps, mode)
     if ratio_hi < max_fL_ratio:
         for _ in range(8):
             candidate = hi * 2.0
             if candidate >= 0.2:
                 break
             hi = candidate
-            ratio_hi = _ratio_from_delta(c0, hi, epsilon, mode)
+            ratio_hi = _ratio_from_delta(c0, hi, log_eps, mode)
             if ratio_hi >= max_fL_ratio:
                 break
         if ratio_hi < max_fL_ratio:
             return hi
 
+    # At most 80 halvings; a bracket of <= 0.2 reaches float resolution after
+    # ~55, after which (lo, hi) is a fixed point and the loop can stop early
+    # with the same result.
     for _ in range(80):
         mid = 0.5 * (lo + hi)
-        ratio_mid = _ratio_from_delta(c0, mid, epsilon, mode)
+        ratio_mid = _ratio_from_delta(c0, mid, log_eps, mode)
         if ratio_mid > max_fL_ratio:
+            if hi == mid:
+                break
             hi = mid
         else:
+            if lo == mid:
+                break
             lo = mid
     return lo
 
 
-def _derive_cL_degeneracy_metadata(
+def _solve_cL_degeneracy_deltas(
     c_L0: float, k: float, Lambda_IR: float, max_fL_ratio: float
-) -> Dict[str, float]:
-    """Compute derived delta-c tolerances from a wavefunction-ratio prior."""
+) -> Tuple[float, float]:
     epsilon = float(Lambda_IR / k)
     d_sym = _solve_delta_c_for_ratio(c_L0, epsilon, max_fL_ratio=max_fL_ratio, mode="symmetric")
     d_one = _solve_delta_c_for_ratio(c_L0, epsilon, max_fL_ratio=max_fL_ratio, mode="one_sided")
+    return d_sym, d_one
+
+
+_cached_cL_degeneracy_deltas = lru_cache(maxsize=4096)(_solve_cL_degeneracy_deltas)
+
+
+# (c_L, k, Lambda_IR, max_fL_ratio) -> (delta_symmetric, delta_one_sided), built
+# for a whole grid by _precompute_cL_degeneracy_table and held in the scan's
+# worker state, so it lives exactly as long as that scan.
+_CLDegeneracyTable = Dict[Tuple[float, float, float, float], Tuple[float, float]]
+
+
+def _precompute_cL_degeneracy_table(config: "ScanConfig") -> _CLDegeneracyTable:
+    """Solve the c_L degeneracy deltas for every (c_L, Lambda_IR) of the grid.
+
+    Uses the same scalar bisection as the per-point fallback, so a delta is
+    bit-identical whether it comes from the table or from a fresh solve.
+    """
+    k = float(config.k)
+    max_fL_ratio = float(config.max_fL_ratio)
+    table = {}
+    for Lambda_IR in config.Lambda_IR_values.tolist():
+        for c in config.c_L_values.tolist():
+            key = (c, k, Lambda_IR, max_fL_ratio)
+            table[key] = _solve_cL_degeneracy_deltas(*key)
+    return table
+
+
+def _cL_degeneracy_deltas(
+    c_L0: float,
+    k: float,
+    Lambda_IR: float,
+    max_fL_ratio: float,
+    table: Optional[_CLDegeneracyTable] = None,
+) -> Tuple[float, float]:
+    """Return ``(delta_symmetric, delta_one_sided)`` for one c_L.
+
+    Each solve is ~100 ``f_IR`` evaluations and depends only on c_L and the
+    geometry, while the scan revisits every c_L for all (c_N, c_E, ...) points:
+    grid values come from the scan's precomputed ``table``, anything else
+    (e.g. MCMC proposals, which pass no table) from a bounded scalar cache.
+    """
+    key = (c_L0, k, Lambda_IR, max_fL_ratio)
+    deltas = table.get(key) if table is not None else None
+    if deltas is None:
+        deltas = _cached_cL_degeneracy_deltas(*key)
+    return deltas
+
+
+def _derive_cL_degeneracy_metadata(
+    c_L0: float,
+    k: float,
+    Lambda_IR: float,
+    max_fL_ratio: float,
+    table: Optional[_CLDegeneracyTable] = None,
+) -> Dict[str, float]:
+    """Compute derived delta-c tolerances from a wavefunction-ratio prior."""
+    d_sym, d_one = _cL_degeneracy_deltas(
+        float(c_L0), float(k), float(Lambda_IR), float(max_fL_ratio), table
+    )
     return {
         "delta_cL_max_symmetric": d_sym,
         "delta_cL_max_one_sided": d_one,
@@ -284,8 +526,35 @@ class ScanConfig:
     anarchy: Optional[AnarchyConfig] = None
     anarchy_min_score: Optional[float] = None
 
+    # Worker processes for run_scan / iter_scan (-1: all CPUs); 1 evaluates
+    # inline.  The deprecated ``n_workers`` argument of those functions
+    # overrides it when given.
+    n_jobs: int = 1
+    # Rows buffered before each ``writerows`` batch when writing a scan CSV.
+    csv_chunksize: int = _CSV_BATCH_ROWS
+
+    # Skip LFV, extra filters and anarchy scoring for non-perturbative points.
+    # Their columns stay NaN, so keep this off if the CSV will be reclassified.
+    short_circuit: bool = False
+
+    # Optional vectorized pre-screen ``prefilter_fn(config, grid_block) -> keep``
+    # over ``_materialize_grid`` rows (see ``perturbativity_prefilter``).
+    # Points it drops are not solved and are rejected as "prefilter:...".
+    prefilter_fn: Optional[Callable[["ScanConfig", np.ndarray], np.ndarray]] = None
+
+    # Evaluate run_scan / iter_scan one grid block at a time with the batch
+    # Yukawa, LFV and anarchy kernels instead of point by point (blocks go
+    # to the n_jobs workers; extra_filters still see one YukawaResult per
+    # point).  Values agree with the per-point path to rounding, not bit for bit.
+    vectorized: bool = False
+    # Float type of the array kernels (vectorized scans and screen_grid);
+    # the per-point path always uses float64.  np.float32 halves their
+    # memory traffic for exploratory scans at ~1e-6 relative error; rows
+    # whose overlaps underflow float32 fall back to the per-point evaluation.
+    dtype: Any = np.float64
+
     # Internal caches (built in __post_init__)
-    _c_E_points: List[Tuple[float, float, float]] = field(init=False, repr=False)
+    _c_E_axes: Tuple[List[float], ...] = field(init=False, repr=False)
     _MN_over_k_points: np.ndarray = field(init=False, repr=False)
 
     def __post_init__(self):
@@ -302,6 +571,15 @@ class ScanConfig:
             raise ValueError("prefac_br must be positive")
         if self.max_fL_ratio <= 1.0:
             raise ValueError("max_fL_ratio must be > 1")
+        if self.n_jobs != -1 and self.n_jobs < 1:
+            raise ValueError("n_jobs must be a positive integer or -1")
+        if self.csv_chunksize < 1:
+            raise ValueError("csv_chunksize must be >= 1")
+        self.dtype = np.dtype(self.dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64")
+        if self.prefilter_fn is not None and not callable(self.prefilter_fn):
+            raise ValueError("prefilter_fn must be callable")
 
         self.Lambda_IR_values = _as_1d_float_array("Lambda_IR_values", self.Lambda_IR_values)
         self.c_L_values = _as_1d_float_array("c_L_values", self.c_L_values)
@@ -333,17 +611,16 @@ class ScanConfig:
             if np.any(self._MN_over_k_points <= 0):
                 raise ValueError("MN_over_k_values must be positive")
 
-        # Build charged-lepton c_E points.
+        # Charged-lepton c_E axes; points are generated lazily from them.
         if self.c_E_grid is not None:
             if len(self.c_E_grid) != 3:
                 raise ValueError(
                     f"c_E_grid must contain exactly 3 arrays, got {len(self.c_E_grid)}"
                 )
-            c1 = _as_1d_float_array("c_E_grid[0]", self.c_E_grid[0])
-            c2 = _as_1d_float_array("c_E_grid[1]", self.c_E_grid[1])
-            c3 = _as_1d_float_array("c_E_grid[2]", self.c_E_grid[2])
-            raw_points = itertools.product(c1, c2, c3)
-            points = [tuple(map(float, p)) for p in raw_points]
+            self._c_E_axes = tuple(
+                _as_1d_float_array(f"c_E_grid[{i}]", self.c_E_grid[i]).tolist()
+                for i in range(3)
+            )
         else:
             if self.c_E_fixed is None:
                 raise ValueError("Either c_E_fixed or c_E_grid must be provided")
@@ -351,17 +628,41 @@ class ScanConfig:
                 raise ValueError(
                     f"c_E_fixed must contain exactly 3 values, got {len(self.c_E_fixed)}"
                 )
-            points = [tuple(map(float, self.c_E_fixed))]
+            self._c_E_axes = tuple([float(v)] for v in self.c_E_fixed)
 
+    def _c_E_point(self, c_E: Tuple[float, float, float]) -> Tuple[float, float, float]:
+        """Apply the ``sort_c_E_descending`` convention to one raw grid tuple."""
         if self.sort_c_E_descending:
-            self._c_E_points = [tuple(sorted(p, reverse=True)) for p in points]
-        else:
-            self._c_E_points = points
+            return tuple(sorted(c_E, reverse=True))
+        return tuple(c_E)
+
+    def iter_c_E_points(self) -> Iterator[Tuple[float, float, float]]:
+        """Iterate over the (c_E1, c_E2, c_E3) scan points without materializing them."""
+        for c_E in itertools.product(*self._c_E_axes):
+            yield self._c_E_point(c_E)
 
     @property
     def c_E_points(self) -> List[Tuple[float, float, float]]:
         """Materialized scan points for (c_E1, c_E2, c_E3)."""
-        return self._c_E_points
+        return list(self.iter_c_E_points())
+
+    @property
+    def c_E_matrix(self) -> np.ndarray:
+        """The c_E scan points as one contiguous ``(n_c_E_points, 3)`` array.
+
+        Same rows and order as :attr:`c_E_points`, built with array ops
+        instead of one Python tuple per point.
+        """
+        grids = np.meshgrid(*(np.asarray(axis) for axis in self._c_E_axes), indexing="ij")
+        points = np.stack(grids, axis=-1).reshape(-1, 3)
+        if self.sort_c_E_descending:
+            points = np.sort(points, axis=1)[:, ::-1]
+        return np.ascontiguousarray(points)
+
+    @property
+    def n_c_E_points(self) -> int:
+        """Number of (c_E1, c_E2, c_E3) scan points."""
+        return math.prod(len(axis) for axis in self._c_E_axes)
 
     @property
     def MN_over_k_points(self) -> np.ndarray:
@@ -375,7 +676,7 @@ class ScanConfig:
             len(self.Lambda_IR_values)
             * len(self.c_L_values)
             * len(self.c_N_values)
-            * len(self.c_E_points)
+            * self.n_c_E_points
             * len(self.MN_over_k_points)
             * len(self.lightest_nu_mass_values)
         )
@@ -384,6 +685,119 @@ class ScanConfig:
 # ── Single-point evaluation ──────────────────────────────────────────────
 
 
+def _reduce_yukawas(
+    Y_E_bar: np.ndarray,
+    Y_N_bar: np.ndarray,
+    max_Y_bar: float,
+    lo: float,
+    hi: float,
+) -> Tuple[float, float, bool, bool]:
+    """Return ``(max|Y|, min|Y|, perturbative, natural)`` over the six Ybar.
+
+    Plain-float reduction over the two length-3 eigenvalue arrays; a NaN
+    entry propagates to both bounds and fails both checks, as the NumPy
+    reductions did.
+    """
+    abs_y = [abs(y) for y in Y_E_bar.tolist()] + [abs(y) for y in Y_N_bar.tolist()]
+    if any(math.isnan(y) for y in abs_y):
+        return math.nan, math.nan, False, False
+    max_y = max(abs_y)
+    min_y = min(abs_y)
+    return max_y, min_y, max_y < max_Y_bar, (min_y >= lo) and (max_y <= hi)
+
+
+# Bits for the built-in filters, in the order their names appear in reject_reason.
+_REJECT_PERTURBATIVITY = 1
+_REJECT_NATURALNESS = 2
+_REJECT_LFV = 4
+_REJECT_ANARCHY = 8
+_REJECT_REASON_NAMES = ("perturbativity", "naturalness", "mu_to_e_gamma", "anarchy_score")
+# _REJECT_REASONS[mask] is the ";"-joined reject_reason for a built-in bitmask.
+_REJECT_REASONS = tuple(
+    ";".join(name for bit, name in enumerate(_REJECT_REASON_NAMES) if mask >> bit & 1)
+    for mask in range(1 << len(_REJECT_REASON_NAMES))
+)
+
+# reject_reason of points dropped by ScanConfig.prefilter_fn.
+_PREFILTER_REJECT_REASON = "prefilter:perturbativity"
+
+# Values of the result columns until the point has been solved and filtered.
+_RESULT_DEFAULTS: Dict[str, Any] = {
+    "Y_E_bar_1": np.nan,
+    "Y_E_bar_2": np.nan,
+    "Y_E_bar_3": np.nan,
+    "Y_N_bar_1": np.nan,
+    "Y_N_bar_2": np.nan,
+    "Y_N_bar_3": np.nan,
+    "f_L": np.nan,
+    "f_N": np.nan,
+    "f_N_UV": np.nan,
+    "max_Y_bar": np.nan,
+    "perturbative": False,
+    "natural": False,
+    "lfv_passes": False,
+    "lfv_lhs": np.nan,
+    "lfv_rhs": np.nan,
+    "lfv_ratio": np.nan,
+    "passes_all": False,
+    "reject_reason": "",
+    "anarchy_enabled": False,
+    "anarchy_score": np.nan,
+    "anarchy_band_penalty": np.nan,
+    "anarchy_condition_penalty": np.nan,
+    "anarchy_w_band": np.nan,
+    "anarchy_w_cond": np.nan,
+    "anarchy_w_fit": np.nan,
+    "anarchy_yN_overall": np.nan,
+}
+
+
+def _row_template(
+    config: ScanConfig, lfv_C: float, git_commit: str, dirty_tree: Optional[bool]
+) -> Dict[str, Any]:
+    """Return a row in ``CSV_COLUMNS`` order with every point-independent field set.
+
+    Built once per scan (per worker) so each point only copies it and fills in
+    the coordinates and results.
+    """
+    row: Dict[str, Any] = dict.fromkeys(CSV_COLUMNS)
+    row.update(
+        {
+            "git_commit": git_commit,
+            "dirty_tree": dirty_tree,
+            "rng_seed_global": config.rng_seed_global,
+            "lfv_model": config.lfv_model,
+            "br_limit": config.br_limit,
+            "prefac_br": config.prefac_br,
+            "lfv_C": lfv_C,
+            "lfv_reference_scale": config.lfv_reference_scale,
+            "xi_KK": config.xi_KK,
+            "max_fL_ratio": config.max_fL_ratio,
+            "k": config.k,
+            "MN_mode": config.MN_mode,
+            "ordering": config.ordering,
+            "majorana_alpha": config.majorana_alpha,
+            "majorana_beta": config.majorana_beta,
+        }
+    )
+    row.update(_RESULT_DEFAULTS)
+    row["anarchy_enabled"] = config.anarchy is not None
+    return row
+
+
+def _join_reject_reasons(reject_mask: int, extra_reasons: List[str]) -> str:
+    """``reject_reason`` with failed extra_filter labels before anarchy_score."""
+    return ";".join(
+        r
+        for r in (
+            _REJECT_REASONS[reject_mask & ~_REJECT_ANARCHY],
+            *extra_reasons,
+            _REJECT_REASONS[reject_mask & _REJECT_ANARCHY],
+        )
+        if r
+    )
+
+
 def _evaluate_point(
     sample_index: int,
     Lambda_IR: float,
@@ -398,105 +812,81 @@ def _evaluate_point(
     dirty_tree: Optional[bool],
     rng_seed_sample: Optional[int],
     extra_filters: List[Callable[[YukawaResult], Tuple[bool, str]]],
+    row_template: Optional[Dict[str, Any]] = None,
+    prefiltered: bool = False,
+    M_N: Optional[float] = None,
+    M_KK: Optional[float] = None,
+    cL_table: Optional[_CLDegeneracyTable] = None,
 ) -> Dict[str, Any]:
-    """Evaluate one parameter point and return a row dict."""
-    M_N = float(MN_over_k * config.k)
-    M_KK = perez_randall_lfv_m_kk_from_lambda_ir(
-        Lambda_IR,
-        xi_KK=config.xi_KK,
-    )
+    """Evaluate one parameter point and return a row dict.
+
+    ``row_template`` is the :func:`_row_template` for this scan; it is built
+    on the fly when not given.  ``prefiltered`` points were dropped by
+    ``config.prefilter_fn``: only the grid metadata is filled in.  ``M_N``
+    and ``M_KK`` may be passed precomputed (``_scan_points`` derives them per
+    grid block); they are derived from ``MN_over_k`` and ``Lambda_IR``
+    otherwise.  ``cL_table`` is the scan's ``_precompute_cL_degeneracy_table``;
+    without it the c_L deltas come from the scalar solver.
+    """
+    if M_N is None:
+        M_N = float(MN_over_k * config.k)
+    if M_KK is None:
+        M_KK = perez_randall_lfv_m_kk_from_lambda_ir(
+            Lambda_IR,
+            xi_KK=config.xi_KK,
+        )
     cL_degeneracy = _derive_cL_degeneracy_metadata(
         c_L0=c_L,
         k=config.k,
         Lambda_IR=Lambda_IR,
         max_fL_ratio=config.max_fL_ratio,
+        table=cL_table,
     )
 
-    row: Dict[str, Any] = {
-        "sample_index": sample_index,
-        "git_commit": git_commit,
-        "dirty_tree": dirty_tree,
-        "rng_seed_global": config.rng_seed_global,
-        "rng_seed_sample": rng_seed_sample,
-        "lfv_model": config.lfv_model,
-        "br_limit": config.br_limit,
-        "prefac_br": config.prefac_br,
-        "lfv_C": lfv_C,
-        "lfv_reference_scale": config.lfv_reference_scale,
-        "xi_KK": config.xi_KK,
-        "max_fL_ratio": config.max_fL_ratio,
-        "delta_cL_max_symmetric": cL_degeneracy["delta_cL_max_symmetric"],
-        "delta_cL_max_one_sided": cL_degeneracy["delta_cL_max_one_sided"],
-        "delta_cL_max_symmetric_over_cL_pct": cL_degeneracy["delta_cL_max_symmetric_over_cL_pct"],
-        "delta_cL_max_one_sided_over_cL_pct": cL_degeneracy["delta_cL_max_one_sided_over_cL_pct"],
-        "k": config.k,
-        "MN_mode": config.MN_mode,
-        "MN_over_k": MN_over_k,
-        "M_N": M_N,
-        "Lambda_IR": Lambda_IR,
-        "M_KK": M_KK,
-        "lightest_nu_mass": lightest_nu_mass,
-        "ordering": config.ordering,
-        "majorana_alpha": config.majorana_alpha,
-        "majorana_beta": config.majorana_beta,
-        "c_L": c_L,
-        "c_N": c_N,
-        "c_E1": c_E[0],
-        "c_E2": c_E[1],
-        "c_E3": c_E[2],
-    }
-
-    row.update(
-        {
-            "Y_E_bar_1": np.nan,
-            "Y_E_bar_2": np.nan,
-            "Y_E_bar_3": np.nan,
-            "Y_N_bar_1": np.nan,
-            "Y_N_bar_2": np.nan,
-            "Y_N_bar_3": np.nan,
-            "f_L": np.nan,
-            "f_N": np.nan,
-            "f_N_UV": np.nan,
-            "max_Y_bar": np.nan,
-            "perturbative": False,
-            "natural": False,
-            "lfv_passes": False,
-            "lfv_lhs": np.nan,
-            "lfv_rhs": np.nan,
-            "lfv_ratio": np.nan,
-            "passes_all": False,
-            "reject_reason": "",
-            "anarchy_enabled": config.anarchy is not None,
-            "anarchy_score": np.nan,
-            "anarchy_band_penalty": np.nan,
-            "anarchy_condition_penalty": np.nan,
-            "anarchy_w_band": np.nan,
-            "anarchy_w_cond": np.nan,
-            "anarchy_w_fit": np.nan,
-            "anarchy_yN_overall": np.nan,
-        }
-    )
+    if row_template is None:
+        row_template = _row_template(config, lfv_C, git_commit, dirty_tree)
+    row = row_template.copy()
+    row["sample_index"] = sample_index
+    row["rng_seed_sample"] = rng_seed_sample
+    row["delta_cL_max_symmetric"] = cL_degeneracy["delta_cL_max_symmetric"]
+    row["delta_cL_max_one_sided"] = cL_degeneracy["delta_cL_max_one_sided"]
+    row["delta_cL_max_symmetric_over_cL_pct"] = cL_degeneracy["delta_cL_max_symmetric_over_cL_pct"]
+    row["delta_cL_max_one_sided_over_cL_pct"] = cL_degeneracy["delta_cL_max_one_sided_over_cL_pct"]
+    row["MN_over_k"] = MN_over_k
+    row["M_N"] = M_N
+    row["Lambda_IR"] = Lambda_IR
+    row["M_KK"] = M_KK
+    row["lightest_nu_mass"] = lightest_nu_mass
+    row["c_L"] = c_L
+    row["c_N"] = c_N
+    row["c_E1"], row["c_E2"], row["c_E3"] = c_E
+    if prefiltered:
+        row["reject_reason"] = _PREFILTER_REJECT_REASON
+        return row
 
     try:
+        # Positional in signature order: this is the hot call of the scan, and
+        # keyword binding of ten arguments is measurable at ~10^5 points.
         result = compute_all_yukawas(
-            Lambda_IR=Lambda_IR,
-            c_L=c_L,
-            c_E=c_E,
-            c_N=c_N,
-            M_N=M_N,
-            lightest_nu_mass=lightest_nu_mass,
-            ordering=config.ordering,
-            majorana_alpha=config.majorana_alpha,
-            majorana_beta=config.majorana_beta,
-            k=config.k,
+            Lambda_IR,
+            c_L,
+            c_E,
+            c_N,
+            M_N,
+            lightest_nu_mass,
+            config.ordering,
+            config.majorana_alpha,
+            config.majorana_beta,
+            config.k,
         )
     except Exception as exc:
         row["reject_reason"] = f"exception:{exc}"
         return row
 
-    all_y = np.concatenate([np.abs(result.Y_E_bar), np.abs(result.Y_N_bar)])
-    max_y = float(np.max(all_y))
-    min_y = float(np.min(all_y))
+    lo, hi = config.naturalness_range
+    max_y, min_y, is_perturbative, is_natural = _reduce_yukawas(
+        result.Y_E_bar, result.Y_N_bar, config.max_Y_bar, lo, hi
+    )
 
     row.update(
         {
@@ -513,20 +903,23 @@ def _evaluate_point(
         }
     )
 
-    reasons: List[str] = []
+    # Built-in failures are collected as _REJECT_* bits; labels of failed
+    # extra_filters are listed between mu_to_e_gamma and anarchy_score.
+    reject_mask = 0
 
-    # 1) Perturbativity
-    is_perturbative = result.is_perturbative(config.max_Y_bar)
+    # 1) Perturbativity (same test as YukawaResult.is_perturbative)
     row["perturbative"] = is_perturbative
     if not is_perturbative:
-        reasons.append("perturbativity")
+        reject_mask |= _REJECT_PERTURBATIVITY
 
     # 2) Naturalness
-    lo, hi = config.naturalness_range
-    is_natural = (min_y >= lo) and (max_y <= hi)
     row["natural"] = is_natural
     if not is_natural:
-        reasons.append("naturalness")
+        reject_mask |= _REJECT_NATURALNESS
+
+    if config.short_circuit and not is_perturbative:
+        row["reject_reason"] = _REJECT_REASONS[reject_mask]
+        return row
 
     # 3) mu -> e gamma
     lfv = check_mu_to_e_gamma(
@@ -534,19 +927,17 @@ def _evaluate_point(
         C=lfv_C,
         reference_scale=config.lfv_reference_scale,
         M_KK_override=M_KK,
+        full_product=False,
     )
     row["lfv_passes"] = bool(lfv["passes"])
     row["lfv_lhs"] = float(lfv["lhs"])
     row["lfv_rhs"] = float(lfv["rhs"])
     row["lfv_ratio"] = float(lfv["ratio"])
     if not row["lfv_passes"]:
-        reasons.append("mu_to_e_gamma")
+        reject_mask |= _REJECT_LFV
 
     # 4) User-supplied filters
-    for filt in extra_filters:
-        ok, label = filt(result)
-        if not ok:
-            reasons.append(label)
+    extra_reasons = [label for ok, label in (filt(result) for filt in extra_filters) if not ok]
 
     # 5) Optional anarchic-prior score from the solved Yukawa point.
     if config.anarchy is not None:
@@ -563,22 +954,831 @@ def _evaluate_point(
         row["anarchy_w_fit"] = anarchy_state["w_fit"]
         row["anarchy_yN_overall"] = anarchy_state["yN_overall"]
         if config.anarchy_min_score is not None and row["anarchy_score"] < config.anarchy_min_score:
-            reasons.append("anarchy_score")
-
-    row["reject_reason"] = ";".join(reasons)
-    row["passes_all"] = len(reasons) == 0
+            reject_mask |= _REJECT_ANARCHY
+
+    if extra_reasons:
+        row["reject_reason"] = _join_reject_reasons(reject_mask, extra_reasons)
+        row["passes_all"] = False
+    else:
+        row["reject_reason"] = _REJECT_REASONS[reject_mask]
+        row["passes_all"] = reject_mask == 0
     return row
 
 
 # ── Main scan loop ───────────────────────────────────────────────────────
 
 
+_WORKER_STATE: Optional[Dict[str, Any]] = None
+
+
+def _worker_init(
+    config: ScanConfig,
+    lfv_C: float,
+    git_commit: str,
+    dirty_tree: Optional[bool],
+    extra_filters: List[Callable[[YukawaResult], Tuple[bool, str]]],
+    cL_table: Optional[_CLDegeneracyTable] = None,
+) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = {
+        "row_template": _row_template(config, lfv_C, git_commit, dirty_tree),
+        "config": config,
+        "lfv_C": lfv_C,
+        "git_commit": git_commit,
+        "dirty_tree": dirty_tree,
+        "extra_filters": extra_filters,
+        "overlaps": _OverlapTable.from_config(config) if config.vectorized else None,
+        "cL_table": cL_table,
+    }
+
+
+def _worker_evaluate(point: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Evaluate one point and return its values in ``CSV_COLUMNS`` order.
+
+    A plain tuple is what crosses the process boundary and what the CSV
+    writer consumes; ``run_scan`` only rebuilds a dict when rows are returned.
+    """
+    if _WORKER_STATE is None:
+        raise RuntimeError("worker was not initialized")
+    (
+        sample_index,
+        Lambda_IR,
+        c_L,
+        c_N,
+        c_E,
+        MN_over_k,
+        lightest_nu_mass,
+        prefiltered,
+        rng_seed_sample,
+        M_N,
+        M_KK,
+    ) = point
+    state = _WORKER_STATE
+    # Positional in signature order: keyword binding of fifteen arguments is a
+    # measurable share of a point. _scan_points already yields Python floats.
+    row = _evaluate_point(
+        sample_index,
+        Lambda_IR,
+        c_L,
+        c_N,
+        c_E,
+        MN_over_k,
+        lightest_nu_mass,
+        state["config"],
+        state["lfv_C"],
+        state["git_commit"],
+        state["dirty_tree"],
+        rng_seed_sample,
+        state["extra_filters"],
+        state["row_template"],
+        prefiltered,
+        M_N,
+        M_KK,
+        state["cL_table"],
+    )
+    # The template fixes the key order to CSV_COLUMNS.
+    return tuple(row.values())
+
+
+def _worker_evaluate_block(bounds: Tuple[int, int]) -> List[Tuple[Any, ...]]:
+    """Evaluate grid rows ``start:stop`` with ``_evaluate_block`` in a worker."""
+    if _WORKER_STATE is None:
+        raise RuntimeError("worker was not initialized")
+    state = _WORKER_STATE
+    config = state["config"]
+    start, stop = bounds
+    block = _materialize_grid(config, start, stop)
+    return _evaluate_block(
+        config,
+        block,
+        start,
+        state["lfv_C"],
+        state["row_template"],
+        state["overlaps"],
+        state["extra_filters"],
+        state["cL_table"],
+    )
+
+
+def _csv_writer_loop(handle: Any, batches: queue.Queue, errors: List[BaseException]) -> None:
+    """Write row batches from ``batches`` to ``handle`` until a ``None`` arrives.
+
+    Runs in run_scan's writer thread so disk I/O overlaps the evaluation of
+    the next batch.  After a write error the loop keeps draining the queue
+    (so the producer never blocks on a full queue) and records the error for
+    run_scan to raise.
+    """
+    writer = csv.writer(handle)
+    while True:
+        batch = batches.get()
+        if batch is None:
+            return
+        if errors:
+            continue
+        try:
+            if batch is _CSV_FLUSH:
+                handle.flush()
+            else:
+                writer.writerows(batch)
+        except Exception as exc:
+            errors.append(exc)
+
+
+def _completed_sample_indices(path: Path) -> frozenset:
+    """Return the ``sample_index`` values already written to a scan CSV.
+
+    A trailing partial line (from a killed run) is truncated away so the file
+    can be appended to; the header must match ``CSV_COLUMNS``.
+    """
+    with open(path, "rb+") as raw:
+        data = raw.read()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            raw.truncate(end)
+    text = data[:end].decode("utf-8")
+    if not text:
+        return frozenset()
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = next(reader)
+    if header != CSV_COLUMNS:
+        raise ValueError(f"{path} does not have the run_scan CSV header; cannot resume")
+    return frozenset(int(row[0]) for row in reader if row)
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    """Map the sklearn-style ``n_jobs`` convention (-1 = all CPUs) to a count."""
+    n_jobs = int(n_jobs)
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer or -1")
+    return n_jobs
+
+
+def _scan_workers(config: ScanConfig, n_workers: Optional[int], caller: str) -> int:
+    """Worker count for a scan: ``config.n_jobs`` unless the deprecated
+    ``n_workers`` argument of ``caller`` overrides it."""
+    if n_workers is None:
+        return _resolve_n_jobs(config.n_jobs)
+    warnings.warn(
+        f"{caller}(n_workers=...) is deprecated; set ScanConfig.n_jobs instead "
+        "(an explicit n_workers still takes precedence over it).",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return _resolve_n_jobs(n_workers)
+
+
+def _default_chunksize(total_points: int, n_workers: int) -> int:
+    """Points per pool task: ~16 tasks per worker, clamped to [1, 4096]."""
+    return min(max(total_points // (16 * max(n_workers, 1)), 1), 4096)
+
+
+# Columns of the ``_materialize_grid`` table, in ``itertools.product`` order.
+_GRID_COLUMNS = (
+    "Lambda_IR",
+    "c_L",
+    "c_N",
+    "c_E1",
+    "c_E2",
+    "c_E3",
+    "MN_over_k",
+    "lightest_nu_mass",
+)
+# Rows per ``_materialize_grid`` block when streaming points into run_scan.
+_GRID_BLOCK_ROWS = 1 << 16
+
+
+def _materialize_grid(
+    config: ScanConfig, start: int = 0, stop: Optional[int] = None
+) -> np.ndarray:
+    """Return grid rows ``start:stop`` as a contiguous ``(n, 8)`` float table.
+
+    Columns follow ``_GRID_COLUMNS`` and row ``i`` is the point with
+    ``sample_index == start + i``; the c_E columns already carry the
+    ``sort_c_E_descending`` convention.  Rows are built by unravelling the
+    flat index against the axis lengths, so a slice of a multi-million-point
+    grid costs only its own rows.
+    """
+    axes = (
+        config.Lambda_IR_values,
+        config.c_L_values,
+        config.c_N_values,
+        *(np.asarray(axis, dtype=float) for axis in config._c_E_axes),
+        config.MN_over_k_points,
+        config.lightest_nu_mass_values,
+    )
+    if stop is None:
+        stop = config.total_points
+    flat = np.arange(start, stop)
+    indices = np.unravel_index(flat, tuple(len(axis) for axis in axes))
+    table = np.empty((flat.size, len(axes)), dtype=float)
+    for col, (axis, idx) in enumerate(zip(axes, indices)):
+        table[:, col] = axis[idx]
+    if config.sort_c_E_descending:
+        table[:, 3:6] = np.sort(table[:, 3:6], axis=1)[:, ::-1]
+    return table
+
+
+@dataclass(frozen=True)
+class _OverlapTable:
+    """``f_IR``/``f_UV`` of every grid c value at every grid ``Lambda_IR``.
+
+    Every grid row draws its c_L, c_N and c_E from the same few axis values,
+    so the overlaps are evaluated once on their union, broadcast against the
+    ``Lambda_IR`` axis, and grid blocks gather them by index instead of
+    re-evaluating the exponential for every row.
+    """
+
+    c_values: np.ndarray
+    f_IR: Dict[float, np.ndarray]
+    f_UV: Dict[float, np.ndarray]
+
+    @classmethod
+    def from_config(cls, config: ScanConfig) -> "_OverlapTable":
+        c_values = np.unique(
+            np.concatenate([config.c_L_values, config.c_N_values, *config._c_E_axes])
+        )
+        Lambda_IR = config.Lambda_IR_values
+        log_eps = -get_warp_params_vec(Lambda_IR, config.k).warp_log[:, None]
+        f_ir = f_IR_from_logeps(c_values[None, :], log_eps, config.dtype)
+        f_uv = f_UV_from_logeps(c_values[None, :], log_eps, config.dtype)
+        keys = Lambda_IR.tolist()
+        return cls(c_values, dict(zip(keys, f_ir)), dict(zip(keys, f_uv)))
+
+    def lookup(
+        self, Lambda_IR: float, grid: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """``(f_L, f_E, f_N, f_N_UV)`` for ``_materialize_grid`` rows at ``Lambda_IR``."""
+        idx = np.searchsorted(self.c_values, grid[:, 1:6])
+        f_ir = self.f_IR[Lambda_IR]
+        return f_ir[idx[:, 0]], f_ir[idx[:, 2:5]], f_ir[idx[:, 1]], self.f_UV[Lambda_IR][idx[:, 1]]
+
+
+def _scan_points(config: ScanConfig):
+    """Yield one point tuple per grid point, in ``sample_index`` order.
+
+    Tuples are ``(sample_index, Lambda_IR, c_L, c_N, c_E, MN_over_k,
+    m_lightest, prefiltered, rng_seed_sample, M_N, M_KK)``.  Points are read off
+    ``_materialize_grid`` one block at a time, so they stream straight into
+    the worker pool with bounded memory and without one ``itertools.product``
+    tuple plus per-axis float boxing per point.
+    ``config.prefilter_fn``, the per-sample seeds and the derived mass
+    scales (``M_N = MN_over_k * k``, ``M_KK = xi_KK * Lambda_IR``, the
+    ``perez_randall_lfv_m_kk_from_lambda_ir`` convention; both inputs are
+    validated positive by ``ScanConfig``) are evaluated once per block.
+    """
+    total = config.total_points
+    for start in range(0, total, _GRID_BLOCK_ROWS):
+        stop = min(start + _GRID_BLOCK_ROWS, total)
+        block = _materialize_grid(config, start, stop)
+        seeds = _sample_seeds(config.rng_seed_global, start, stop)
+        if config.prefilter_fn is None:
+            dropped = itertools.repeat(False)
+        else:
+            keep = np.asarray(config.prefilter_fn(config, block), dtype=bool)
+            if keep.shape != (len(block),):
+                raise ValueError("prefilter_fn must return one bool per grid row")
+            dropped = (~keep).tolist()
+        M_N = (block[:, 6] * config.k).tolist()
+        M_KK = (config.xi_KK * block[:, 0]).tolist()
+        points = zip(itertools.count(start), block.tolist(), dropped, seeds, M_N, M_KK)
+        for sample_index, row, prefiltered, seed, M_N_i, M_KK_i in points:
+            Lambda_IR, c_L, c_N, c_E1, c_E2, c_E3, MN_over_k, m_lightest = row
+            c_E = (c_E1, c_E2, c_E3)
+            yield (
+                sample_index,
+                Lambda_IR,
+                c_L,
+                c_N,
+                c_E,
+                MN_over_k,
+                m_lightest,
+                prefiltered,
+                seed,
+                M_N_i,
+                M_KK_i,
+            )
+
+
+def _evaluate_block(
+    config: ScanConfig,
+    block: np.ndarray,
+    start: int,
+    lfv_C: float,
+    row_template: Dict[str, Any],
+    overlaps: _OverlapTable,
+    extra_filters: Sequence[Callable[[YukawaResult], Tuple[bool, str]]] = (),
+    cL_table: Optional[_CLDegeneracyTable] = None,
+) -> List[Tuple[Any, ...]]:
+    """Evaluate ``_materialize_grid`` rows ``start:start + len(block)`` at once.
+
+    Array counterpart of ``_worker_evaluate`` over a grid block: the Yukawas
+    come from one :func:`compute_all_yukawas_batch` call per ``Lambda_IR``
+    with the overlap factors gathered from the scan's ``_OverlapTable``,
+    the filters and reject bitmask from array operations, and the anarchy
+    scores from one :func:`score_anarchy_from_matrices` call.
+    ``extra_filters`` are called per row on ``YukawaResultBatch.result``.
+    Rows dropped
+    by ``config.prefilter_fn`` and rows the batch solver flags invalid go
+    through ``_evaluate_point`` (with ``extra_filters``, since float32
+    underflow rows usually succeed there) so their metadata and
+    ``exception:`` reasons match the per-point path exactly.  Values agree with the per-point path
+    to rounding (~1e-12 relative), not bit for bit.
+    """
+    n = len(block)
+    stop = start + n
+    seeds = _sample_seeds(config.rng_seed_global, start, stop)
+    lo, hi = config.naturalness_range
+    pmns = get_pmns(config.ordering, config.majorana_alpha, config.majorana_beta)
+
+    Lambda_IR = block[:, 0]
+    M_N = block[:, 6] * config.k
+    M_KK = config.xi_KK * Lambda_IR
+    Y_E_bar = np.full((n, 3), np.nan)
+    Y_N_bar = np.full((n, 3), np.nan)
+    Y_N_matrix = np.full((n, 3, 3), np.nan, dtype=complex)
+    f_cols = np.full((n, 3), np.nan)
+    valid = np.zeros(n, dtype=bool)
+    lfv = {key: np.full(n, np.nan) for key in ("lhs", "rhs", "ratio")}
+    lfv_passes = np.zeros(n, dtype=bool)
+    batches = []
+    for value in np.unique(Lambda_IR):
+        rows = np.flatnonzero(Lambda_IR == value)
+        yuk = compute_all_yukawas_batch(
+            Lambda_IR=float(value),
+            c_L=block[rows, 1],
+            c_E=block[rows, 3:6],
+            c_N=block[rows, 2],
+            M_N=M_N[rows],
+            lightest_nu_mass=block[rows, 7],
+            ordering=config.ordering,
+            majorana_alpha=config.majorana_alpha,
+            majorana_beta=config.majorana_beta,
+            k=config.k,
+            overlaps=overlaps.lookup(float(value), block[rows]),
+            dtype=config.dtype,
+        )
+        Y_E_bar[rows] = yuk.Y_E_bar
+        Y_N_bar[rows] = yuk.Y_N_bar
+        Y_N_matrix[rows] = yuk.Y_N_matrix
+        f_cols[rows] = np.stack([yuk.f_L, yuk.f_N, yuk.f_N_UV], axis=1)
+        valid[rows] = yuk.valid
+        batches.append((rows, yuk))
+        block_lfv = check_mu_to_e_gamma_batch(
+            yuk.Y_N_bar,
+            pmns,
+            config.xi_KK * float(value),
+            C=lfv_C,
+            reference_scale=config.lfv_reference_scale,
+        )
+        for key in lfv:
+            lfv[key][rows] = block_lfv[key]
+        lfv_passes[rows] = block_lfv["passes"]
+
+    # NaN rows compare False everywhere, as in _reduce_yukawas.
+    abs_y = np.abs(np.concatenate([Y_E_bar, Y_N_bar], axis=1))
+    max_y = abs_y.max(axis=1)
+    perturbative = max_y < config.max_Y_bar
+    natural = (abs_y.min(axis=1) >= lo) & (max_y <= hi)
+    reject_mask = np.where(perturbative, 0, _REJECT_PERTURBATIVITY) | np.where(
+        natural, 0, _REJECT_NATURALNESS
+    )
+    # Rows past the perturbativity short circuit keep the default LFV/anarchy
+    # columns and collect no further reject bits.
+    filtered = perturbative | (not config.short_circuit)
+    lfv_passes &= filtered
+    reject_mask |= np.where(filtered & ~lfv_passes, _REJECT_LFV, 0)
+    for key in lfv:
+        lfv[key][~filtered] = np.nan
+
+    anarchy = {key: np.full(n, np.nan) for key in ("score", "band_penalty",
+                                                   "condition_penalty", "yN_overall")}
+    anarchy_weights = [math.nan] * 3
+    scored = filtered & valid
+    if config.anarchy is not None and np.any(scored):
+        state = score_anarchy_from_matrices(2.0 * config.k * Y_N_matrix[scored], config.anarchy)
+        for key in anarchy:
+            anarchy[key][scored] = state[key]
+        anarchy_weights = [float(state[key]) for key in ("w_band", "w_cond", "w_fit")]
+        if config.anarchy_min_score is not None:
+            low_score = anarchy["score"] < config.anarchy_min_score
+            reject_mask |= np.where(low_score, _REJECT_ANARCHY, 0)
+
+    reject_reason = [_REJECT_REASONS[mask] for mask in reject_mask.tolist()]
+    passes_all = (reject_mask == 0).tolist()
+    if extra_filters:
+        for rows, yuk in batches:
+            for j, i in enumerate(rows.tolist()):
+                if not scored[i]:
+                    continue
+                result = yuk.result(j)
+                failed = [label for ok, label in (filt(result) for filt in extra_filters) if not ok]
+                if failed:
+                    reject_reason[i] = _join_reject_reasons(int(reject_mask[i]), failed)
+                    passes_all[i] = False
+
+    deltas = np.array(
+        [
+            _cL_degeneracy_deltas(c, float(config.k), L, float(config.max_fL_ratio), cL_table)
+            for c, L in zip(block[:, 1].tolist(), Lambda_IR.tolist())
+        ]
+    ).reshape(n, 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta_pct = np.where(block[:, 1:2] != 0, 100.0 * deltas / block[:, 1:2], np.nan)
+
+    columns: Dict[str, Any] = {
+        col: itertools.repeat(value) for col, value in row_template.items()
+    }
+    columns.update(
+        {
+            "sample_index": range(start, stop),
+            "rng_seed_sample": seeds,
+            "delta_cL_max_symmetric": deltas[:, 0].tolist(),
+            "delta_cL_max_one_sided": deltas[:, 1].tolist(),
+            "delta_cL_max_symmetric_over_cL_pct": delta_pct[:, 0].tolist(),
+            "delta_cL_max_one_sided_over_cL_pct": delta_pct[:, 1].tolist(),
+            "MN_over_k": block[:, 6].tolist(),
+            "M_N": M_N.tolist(),
+            "Lambda_IR": Lambda_IR.tolist(),
+            "M_KK": M_KK.tolist(),
+            "lightest_nu_mass": block[:, 7].tolist(),
+            "c_L": block[:, 1].tolist(),
+            "c_N": block[:, 2].tolist(),
+            "max_Y_bar": max_y.tolist(),
+            "perturbative": perturbative.tolist(),
+            "natural": natural.tolist(),
+            "lfv_passes": lfv_passes.tolist(),
+            "lfv_lhs": lfv["lhs"].tolist(),
+            "lfv_rhs": lfv["rhs"].tolist(),
+            "lfv_ratio": lfv["ratio"].tolist(),
+            "passes_all": passes_all,
+            "reject_reason": reject_reason,
+        }
+    )
+    for i in range(3):
+        columns[f"c_E{i + 1}"] = block[:, 3 + i].tolist()
+        columns[f"Y_E_bar_{i + 1}"] = Y_E_bar[:, i].tolist()
+        columns[f"Y_N_bar_{i + 1}"] = Y_N_bar[:, i].tolist()
+    for i, col in enumerate(("f_L", "f_N", "f_N_UV")):
+        columns[col] = f_cols[:, i].tolist()
+    if config.anarchy is not None:
+        for key in anarchy:
+            columns[f"anarchy_{key}"] = anarchy[key].tolist()
+        for key, weight in zip(("w_band", "w_cond", "w_fit"), anarchy_weights):
+            columns[f"anarchy_{key}"] = [weight if ok else math.nan for ok in scored.tolist()]
+    values = list(zip(*(columns[col] for col in CSV_COLUMNS)))
+
+    if config.prefilter_fn is None:
+        dropped = np.zeros(n, dtype=bool)
+    else:
+        keep = np.asarray(config.prefilter_fn(config, block), dtype=bool)
+        if keep.shape != (n,):
+            raise ValueError("prefilter_fn must return one bool per grid row")
+        dropped = ~keep
+    for i in np.flatnonzero(dropped | ~valid).tolist():
+        Lambda_i, c_L, c_N, c_E1, c_E2, c_E3, MN_over_k, m_lightest = block[i].tolist()
+        row = _evaluate_point(
+            start + i,
+            Lambda_i,
+            c_L,
+            c_N,
+            (c_E1, c_E2, c_E3),
+            MN_over_k,
+            m_lightest,
+            config,
+            lfv_C,
+            row_template["git_commit"],
+            row_template["dirty_tree"],
+            seeds[i],
+            extra_filters,
+            row_template,
+            bool(dropped[i]),
+            float(M_N[i]),
+            float(M_KK[i]),
+            cL_table,
+        )
+        values[i] = tuple(row.values())
+    return values
+
+
+def _iter_block_values(
+    config: ScanConfig,
+    initargs: Tuple[Any, ...],
+    n_workers: int,
+    skip: frozenset = frozenset(),
+) -> Iterator[Tuple[Any, ...]]:
+    """Yield row values for ``config.vectorized`` scans, one grid block at a time.
+
+    Blocks are independent, so with ``n_workers > 1`` they are spread over
+    the same worker pool as the per-point path (in order, via ``imap``); the
+    block size then shrinks so every worker gets a few blocks.
+    """
+    total = config.total_points
+    block_rows = _GRID_BLOCK_ROWS
+    if n_workers > 1:
+        block_rows = min(block_rows, max(-(-total // (4 * n_workers)), 1))
+    bounds = [(start, min(start + block_rows, total)) for start in range(0, total, block_rows)]
+    if skip:
+        bounds = [(a, b) for a, b in bounds if not all(i in skip for i in range(a, b))]
+
+    if n_workers <= 1:
+        _worker_init(*initargs)
+        for values in map(_worker_evaluate_block, bounds):
+            yield from (row for row in values if row[0] not in skip) if skip else values
+        return
+    pool = mp.Pool(n_workers, initializer=_worker_init, initargs=initargs)
+    try:
+        for values in pool.imap(_worker_evaluate_block, bounds):
+            yield from (row for row in values if row[0] not in skip) if skip else values
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def perturbativity_prefilter(
+    config: ScanConfig, grid: np.ndarray, margin: float = 10.0, dtype: Any = np.float32
+) -> np.ndarray:
+    """Keep-mask for ``ScanConfig.prefilter_fn`` based on the Yukawa magnitudes.
+
+    The Yukawas of every row of ``grid`` (``_materialize_grid`` columns) are
+    solved in one :func:`yukawa.compute_all_yukawas_batch` call per
+    ``Lambda_IR`` value, and rows whose ``max|Y_bar|`` exceeds
+    ``margin * config.max_Y_bar`` are dropped.  Rows the batch solver cannot
+    evaluate are kept so the full evaluation records why they fail.  Use
+    ``functools.partial`` to change ``margin`` or ``dtype``.
+
+    The screen runs in ``dtype`` (float32 by default, half the memory
+    traffic of float64).  Keeping a row by mistake only costs its full
+    evaluation, so just the rows a float32 pass would drop within
+    ``_F32_SCREEN_RTOL`` of the bound, or with overlaps small enough for
+    float32 products to lose precision, are re-solved in float64; the mask
+    matches a float64 screen.
+    """
+    keep = np.ones(len(grid), dtype=bool)
+    bound = margin * config.max_Y_bar
+    for Lambda_IR in np.unique(grid[:, 0]):
+        rows = np.flatnonzero(grid[:, 0] == Lambda_IR)
+        max_y, unsure = _screen_max_y_bar(config, float(Lambda_IR), grid[rows], bound, dtype)
+        if np.any(unsure):
+            max_y[unsure] = _screen_max_y_bar(
+                config, float(Lambda_IR), grid[rows[unsure]], bound, np.float64
+            )[0]
+        keep[rows] = ~(max_y > bound)
+    return keep
+
+
+# Relative band above the prefilter bound re-checked in float64 (float32
+# Yukawas carry ~1e-6 relative error), and the overlap size below which
+# float32 products such as f_L * f_E can go subnormal.
+_F32_SCREEN_RTOL = 1.0e-3
+_F32_SCREEN_MIN_OVERLAP = 1.0e-15
+
+
+def _screen_max_y_bar(
+    config: ScanConfig, Lambda_IR: float, rows: np.ndarray, bound: float, dtype: Any
+) -> Tuple[np.ndarray, np.ndarray]:
+    """``max|Y_bar|`` of ``_materialize_grid`` rows, and the rows to re-check in float64."""
+    yuk = compute_all_yukawas_batch(
+        Lambda_IR=Lambda_IR,
+        c_L=rows[:, 1],
+        c_E=rows[:, 3:6],
+        c_N=rows[:, 2],
+        M_N=rows[:, 6] * config.k,
+        lightest_nu_mass=rows[:, 7],
+        ordering=config.ordering,
+        majorana_alpha=config.majorana_alpha,
+        majorana_beta=config.majorana_beta,
+        k=config.k,
+        dtype=dtype,
+    )
+    max_y = np.abs(np.concatenate([yuk.Y_E_bar, yuk.Y_N_bar], axis=1)).max(axis=1)
+    max_y = max_y.astype(float)
+    if np.dtype(dtype) == np.float64:
+        return max_y, np.zeros(len(rows), dtype=bool)
+    smallest = np.minimum.reduce([yuk.f_L, yuk.f_E.min(axis=1), yuk.f_N, yuk.f_N_UV])
+    dropped = max_y > bound
+    unsure = dropped & (
+        (max_y <= bound * (1.0 + _F32_SCREEN_RTOL)) | (smallest < _F32_SCREEN_MIN_OVERLAP)
+    )
+    return max_y, unsure
+
+
+# score_anarchy_from_matrices outputs reported by screen_grid as anarchy_<key>.
+_ANARCHY_SCREEN_KEYS = ("score", "band_penalty", "condition_penalty", "yN_overall")
+
+
+def screen_grid(config: ScanConfig) -> Dict[str, np.ndarray]:
+    """Evaluate the perturbativity, naturalness and LFV filters on the whole grid.
+
+    Vectorized counterpart of the filter stage of :func:`run_scan`: the grid is
+    laid out in the same ``sample_index`` order, the Yukawas are solved with
+    :func:`yukawa.compute_all_yukawas_batch` once per ``Lambda_IR`` block and
+    the checks are reduced with array operations; the overlap factors come
+    from one ``_OverlapTable`` for the whole grid.  With ``config.anarchy``
+    set, the solved Ybar_N matrices are scored in one
+    :func:`score_anarchy_from_matrices` call per block.  The c_L degeneracy
+    metadata and ``extra_filters`` are not evaluated, so this is meant as a
+    fast pre-screen before running the full scan on survivors.
+
+    Returns
+    -------
+    dict of np.ndarray
+        One entry per point for the grid coordinates, ``M_N``, ``M_KK``, the
+        six ``Y_*_bar_i``, ``max_Y_bar``, ``perturbative``, ``natural``, the
+        ``lfv_*`` outputs, the ``anarchy_*`` scores when ``config.anarchy`` is
+        set, and ``passes_screen`` (every check passes, including
+        ``anarchy_min_score``).  Points the scalar solver would reject are NaN
+        and fail every check.
+    """
+    lfv_C = _lfv_coefficient(config.br_limit, config.prefac_br)
+    lo, hi = config.naturalness_range
+    pmns = get_pmns(config.ordering, config.majorana_alpha, config.majorana_beta)
+
+    # Lambda_IR is the outermost axis: every Lambda_IR block repeats the
+    # inner coordinates of the first one.
+    table = _materialize_grid(config)
+    n_block = config.total_points // len(config.Lambda_IR_values)
+    c_L = table[:n_block, 1]
+    c_N = table[:n_block, 2]
+    c_E = table[:n_block, 3:6]
+    MN_over_k = table[:, 6]
+    M_N = MN_over_k * config.k
+    m_light = table[:n_block, 7]
+
+    overlaps = _OverlapTable.from_config(config)
+    blocks = []
+    for Lambda_IR in config.Lambda_IR_values:
+        M_KK = perez_randall_lfv_m_kk_from_lambda_ir(float(Lambda_IR), xi_KK=config.xi_KK)
+        yuk = compute_all_yukawas_batch(
+            Lambda_IR=float(Lambda_IR),
+            c_L=c_L,
+            c_E=c_E,
+            c_N=c_N,
+            M_N=M_N[:n_block],
+            lightest_nu_mass=m_light,
+            ordering=config.ordering,
+            majorana_alpha=config.majorana_alpha,
+            majorana_beta=config.majorana_beta,
+            k=config.k,
+            overlaps=overlaps.lookup(float(Lambda_IR), table[:n_block]),
+            dtype=config.dtype,
+        )
+        abs_y = np.abs(np.concatenate([yuk.Y_E_bar, yuk.Y_N_bar], axis=1))
+        max_y = abs_y.max(axis=1)
+        min_y = abs_y.min(axis=1)
+        # NaN rows compare False everywhere, matching the scalar failure path.
+        perturbative = max_y < config.max_Y_bar
+        natural = (min_y >= lo) & (max_y <= hi)
+        lfv = check_mu_to_e_gamma_batch(
+            yuk.Y_N_bar,
+            pmns,
+            M_KK,
+            C=lfv_C,
+            reference_scale=config.lfv_reference_scale,
+        )
+        lfv_passes = lfv["passes"] & yuk.valid
+        passes_screen = perturbative & natural & lfv_passes
+        anarchy_columns = {}
+        if config.anarchy is not None:
+            valid = yuk.valid
+            for key in _ANARCHY_SCREEN_KEYS:
+                anarchy_columns[f"anarchy_{key}"] = np.full(c_L.shape, np.nan)
+            if np.any(valid):
+                state = score_anarchy_from_matrices(
+                    2.0 * config.k * yuk.Y_N_matrix[valid], config.anarchy
+                )
+                for key in _ANARCHY_SCREEN_KEYS:
+                    anarchy_columns[f"anarchy_{key}"][valid] = state[key]
+            if config.anarchy_min_score is not None:
+                passes_screen &= ~(anarchy_columns["anarchy_score"] < config.anarchy_min_score)
+        blocks.append(
+            {
+                **anarchy_columns,
+                "M_KK": np.full(c_L.shape, M_KK),
+                "Y_E_bar": yuk.Y_E_bar,
+                "Y_N_bar": yuk.Y_N_bar,
+                "max_Y_bar": max_y,
+                "perturbative": perturbative,
+                "natural": natural,
+                "lfv_passes": lfv_passes,
+                "lfv_lhs": lfv["lhs"],
+                "lfv_rhs": np.where(yuk.valid, lfv["rhs"], np.nan),
+                "lfv_ratio": lfv["ratio"],
+                "passes_screen": passes_screen,
+            }
+        )
+
+    def _stack(key: str) -> np.ndarray:
+        return np.concatenate([block[key] for block in blocks])
+
+    out: Dict[str, np.ndarray] = {
+        "sample_index": np.arange(config.total_points),
+        "Lambda_IR": table[:, 0],
+        "M_KK": _stack("M_KK"),
+        "c_L": table[:, 1],
+        "c_N": table[:, 2],
+        "MN_over_k": MN_over_k,
+        "M_N": M_N,
+        "lightest_nu_mass": table[:, 7],
+    }
+    Y_E_bar = _stack("Y_E_bar")
+    Y_N_bar = _stack("Y_N_bar")
+    for i in range(3):
+        out[f"c_E{i + 1}"] = table[:, 3 + i]
+        out[f"Y_E_bar_{i + 1}"] = Y_E_bar[:, i]
+        out[f"Y_N_bar_{i + 1}"] = Y_N_bar[:, i]
+    for key in (
+        "max_Y_bar",
+        "perturbative",
+        "natural",
+        "lfv_passes",
+        "lfv_lhs",
+        "lfv_rhs",
+        "lfv_ratio",
+        *(f"anarchy_{key}" for key in _ANARCHY_SCREEN_KEYS if config.anarchy is not None),
+        "passes_screen",
+    ):
+        out[key] = _stack(key)
+    return out
+
+
+def _iter_scan_values(
+    config: ScanConfig,
+    extra_filters: Optional[List[Callable[[YukawaResult], Tuple[bool, str]]]] = None,
+    n_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    skip: frozenset = frozenset(),
+) -> Iterator[Tuple[Any, ...]]:
+    """Yield each point's values in ``CSV_COLUMNS`` order, in ``sample_index`` order.
+
+    The evaluation engine behind :func:`run_scan` and :func:`iter_scan`:
+    dispatches the points (minus the ``skip`` sample indices) inline or to a
+    ``multiprocessing.Pool`` according to ``n_workers``.  The pool lives as
+    long as the generator;
+    closing it early terminates the workers.
+    """
+    if extra_filters is None:
+        extra_filters = []
+    n_workers = _resolve_n_jobs(config.n_jobs if n_workers is None else n_workers)
+
+    lfv_C = _lfv_coefficient(config.br_limit, config.prefac_br)
+    git_commit, dirty_tree = _resolve_git_metadata(config.record_git_metadata)
+    cL_table = _precompute_cL_degeneracy_table(config)
+    initargs = (config, lfv_C, git_commit, dirty_tree, extra_filters, cL_table)
+    if config.vectorized:
+        yield from _iter_block_values(config, initargs, n_workers, skip)
+        return
+
+    points = _scan_points(config)
+    if skip:
+        points = (point for point in points if point[0] not in skip)
+
+    if chunksize is None:
+        chunksize = _default_chunksize(config.total_points, n_workers)
+    chunksize = max(int(chunksize), 1)
+    if n_workers <= 1:
+        _worker_init(*initargs)
+        yield from map(_worker_evaluate, points)
+        return
+    pool = mp.Pool(n_workers, initializer=_worker_init, initargs=initargs)
+    try:
+        yield from pool.imap(_worker_evaluate, points, chunksize=chunksize)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def iter_scan(
+    config: ScanConfig,
+    extra_filters: Optional[List[Callable[[YukawaResult], Tuple[bool, str]]]] = None,
+    n_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the :func:`run_scan` rows one at a time, in ``sample_index`` order.
+
+    Memory stays constant in the number of points, so consumers can filter
+    as they go, e.g. ``[r for r in iter_scan(config) if r["passes_all"]]``.
+    ``extra_filters``, ``n_workers`` (deprecated) and ``chunksize`` are as in
+    :func:`run_scan`; no CSV is written and no progress is printed.  Closing
+    the iterator early stops the worker pool.
+    """
+    n_workers = _scan_workers(config, n_workers, "iter_scan")
+    for values in _iter_scan_values(config, extra_filters, n_workers, chunksize):
+        yield dict(zip(CSV_COLUMNS, values))
+
+
 def run_scan(
     config: ScanConfig,
     output_csv: Optional[str] = None,
     extra_filters: Optional[List[Callable[[YukawaResult], Tuple[bool, str]]]] = None,
     progress_every: int = 100,
-) -> List[Dict[str, Any]]:
+    n_workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    return_rows: bool = True,
+    columnar: bool = False,
+    resume: bool = False,
+) -> Union[List[Dict[str, Any]], Dict[str, np.ndarray]]:
     """Run a parameter scan over the configured grid.
 
     Parameters
@@ -586,85 +1786,171 @@ def run_scan(
     config : ScanConfig
         Scan configuration.
     output_csv : str or None
-        Path to write CSV results. If None, results are only returned.
+        Path to write CSV results. Rows are streamed to the file as they are
+        evaluated. If None, results are only returned.
     extra_filters : list of callables or None
         Each callable takes ``YukawaResult`` and returns ``(passes, label)``.
+        With more than one worker they must be picklable (module-level
+        functions).
     progress_every : int
         Print progress every N points. Set to 0 to suppress.
+    n_workers : int or None
+        Deprecated; set ``config.n_jobs`` instead. ``None`` (default) uses
+        ``config.n_jobs``; any other value overrides it and emits a
+        ``DeprecationWarning``. The worker count decides how points are
+        evaluated: 1 inline, more (or -1, every CPU) in a
+        ``multiprocessing.Pool`` in chunks of *chunksize*; rows are returned
+        in ``sample_index`` order either way. With ``config.vectorized`` the
+        workers evaluate whole grid blocks instead of single points.
+    chunksize : int or None
+        Points handed to a worker per task with more than one worker (ignored
+        with ``config.vectorized``, which sizes its own blocks). Points are
+        cheap, so per-task pickling dominates unless they are batched; the
+        default ``None`` uses ``total_points // (16 * n_workers)`` (at least
+        1, at most 4096), i.e. ~16 tasks per worker for load balancing.
+    return_rows : bool
+        Keep every row in memory and return them. Set to False for large
+        scans that only need the CSV; an empty list is returned then.
+    columnar : bool
+        Store the results column-wise in preallocated arrays (one per
+        ``CSV_COLUMNS`` entry, indexed by ``sample_index``) instead of a list
+        of row dicts. Numeric columns are float64, flags bool, and strings /
+        nullable metadata object.
+    resume : bool
+        If ``output_csv`` already holds rows from an interrupted run of the
+        same config, skip their ``sample_index`` values and append the
+        remaining points to it (a truncated last line is dropped first).
+        Only the newly evaluated rows are returned; cannot be combined with
+        ``columnar``.
 
     Returns
     -------
-    list of dict
-        One row per scan point.
+    list of dict or dict of np.ndarray
+        One row per scan point (empty if ``return_rows`` is False), or the
+        column arrays when ``columnar`` is True.
     """
-    if extra_filters is None:
-        extra_filters = []
+    # Validated here so a bad worker count fails before output_csv is opened.
+    n_workers = _scan_workers(config, n_workers, "run_scan")
+    if resume and columnar:
+        raise ValueError("resume cannot be combined with columnar=True")
 
-    lfv_C = coefficient_from_br_limit(config.br_limit, prefactor=config.prefac_br)
-    git_commit, dirty_tree = _resolve_git_metadata(config.record_git_metadata)
+    done: frozenset = frozenset()
+    if resume and output_csv is not None and Path(output_csv).exists():
+        done = _completed_sample_indices(Path(output_csv))
 
     total = config.total_points
     results: List[Dict[str, Any]] = []
+    columns: Optional[Dict[str, np.ndarray]] = None
+    if return_rows and columnar:
+        columns = {col: np.empty(total, dtype=_column_dtype(col)) for col in CSV_COLUMNS}
+        column_arrays = list(columns.values())
+    n_done = 0
     n_pass = 0
-    t_start = time.time()
-
-    scan_iter = itertools.product(
-        config.Lambda_IR_values,
-        config.c_L_values,
-        config.c_N_values,
-        config.c_E_points,
-        config.MN_over_k_points,
-        config.lightest_nu_mass_values,
-    )
-
-    for sample_index, (
-        Lambda_IR,
-        c_L,
-        c_N,
-        c_E,
-        MN_over_k,
-        lightest_nu_mass,
-    ) in enumerate(scan_iter):
-        seed = _sample_seed(config.rng_seed_global, sample_index)
+    t_start = time.perf_counter()
 
-        row = _evaluate_point(
-            sample_index=sample_index,
-            Lambda_IR=float(Lambda_IR),
-            c_L=float(c_L),
-            c_N=float(c_N),
-            c_E=c_E,
-            MN_over_k=float(MN_over_k),
-            lightest_nu_mass=float(lightest_nu_mass),
-            config=config,
-            lfv_C=lfv_C,
-            git_commit=git_commit,
-            dirty_tree=dirty_tree,
-            rng_seed_sample=seed,
-            extra_filters=extra_filters,
+    handle = None
+    batches: Optional[queue.Queue] = None
+    writer_thread = None
+    write_errors: List[BaseException] = []
+    pending: List[Tuple[Any, ...]] = []
+    if output_csv is not None:
+        append = resume and Path(output_csv).exists() and Path(output_csv).stat().st_size > 0
+        handle = open(
+            output_csv, "a" if append else "w", newline="", encoding="utf-8", buffering=1 << 20
         )
-        results.append(row)
+        if not append:
+            csv.writer(handle).writerow(CSV_COLUMNS)
+        batches = queue.Queue(maxsize=_CSV_QUEUE_BATCHES)
+        writer_thread = threading.Thread(
+            target=_csv_writer_loop, args=(handle, batches, write_errors), daemon=True
+        )
+        writer_thread.start()
 
-        if row["passes_all"]:
-            n_pass += 1
+    if done:
+        print(f"Resuming scan: {len(done)}/{total} points already in {output_csv}")
 
-        if progress_every > 0 and (sample_index + 1) % progress_every == 0:
-            elapsed = time.time() - t_start
-            rate = (sample_index + 1) / elapsed if elapsed > 0 else 0
-            print(
-                f"  [{sample_index + 1}/{total}]  accepted: {n_pass}  ({rate:.0f} pts/s)"
-            )
-
-    elapsed = time.time() - t_start
+    rows = _iter_scan_values(config, extra_filters, n_workers, chunksize, skip=done)
+    try:
+        for values in rows:
+            n_done += 1
+            if batches is not None:
+                pending.append(values)
+                if len(pending) >= config.csv_chunksize:
+                    if write_errors:
+                        raise write_errors[0]
+                    batches.put(pending)
+                    pending = []
+            if columns is not None:
+                idx = values[0]  # sample_index
+                for arr, value in zip(column_arrays, values):
+                    arr[idx] = value
+            elif return_rows:
+                results.append(dict(zip(CSV_COLUMNS, values)))
+
+            if values[_PASSES_ALL_INDEX]:
+                n_pass += 1
+
+            if progress_every > 0 and n_done % progress_every == 0:
+                elapsed = time.perf_counter() - t_start
+                rate = n_done / elapsed if elapsed > 0 else 0
+                print(
+                    f"  [{n_done + len(done)}/{total}]  accepted: {n_pass}  ({rate:.0f} pts/s)"
+                )
+                if batches is not None:
+                    # Bound what a killed job loses to one progress interval.
+                    batches.put(pending)
+                    batches.put(_CSV_FLUSH)
+                    pending = []
+    finally:
+        # Closing the generator tears down its worker pool.
+        rows.close()
+        if handle is not None:
+            batches.put(pending)
+            batches.put(None)
+            writer_thread.join()
+            handle.close()
+    if write_errors:
+        raise write_errors[0]
+
+    elapsed = time.perf_counter() - t_start
     print(
         f"Scan complete: {total} points in {elapsed:.1f}s, "
         f"{n_pass} accepted ({100 * n_pass / max(total, 1):.1f}%)"
     )
-
     if output_csv is not None:
-        with open(output_csv, "w", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=CSV_COLUMNS)
-            writer.writeheader()
-            writer.writerows(results)
         print(f"Results written to {output_csv}")
 
+    if columns is not None:
+        return columns
     return results
+
+
+def write_scan_columns(columns: Dict[str, np.ndarray], path: Union[str, Path]) -> Path:
+    """Write ``run_scan(..., columnar=True)`` output to disk in one pass.
+
+    The format follows the file suffix: ``.parquet`` goes through pandas /
+    pyarrow (typed, compressed columns; both are optional dependencies) and
+    anything else is written as CSV with the same layout as ``run_scan``'s
+    streamed ``output_csv``.
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        try:
+            import pandas as pd
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "Writing .parquet scan output requires pandas and pyarrow."
+            ) from exc
+        frame = pd.DataFrame(columns)
+        # Per-sample seeds are full uint64 values, stored as a nullable column.
+        for col in ("rng_seed_global", "rng_seed_sample"):
+            if col in frame:
+                frame[col] = pd.array(columns[col].tolist(), dtype="UInt64")
+        frame.to_parquet(path, index=False)
+        return path
+
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
+        writer = csv.writer(handle)
+        writer.writerow(list(columns))
+        writer.writerows(zip(*(arr.tolist() for arr in columns.values())))
+    return path
@@ -6,9 +6,10 @@ Perez–Randall-inspired bulk-mass inputs and current repo conventions, rather
 than claiming an exact reproduction of Eq. (10) / Table I.
 
 Run:
-  python scripts/benchmark_perez_randall.py
+  python scripts/benchmark_perez_randall.py [--skip-lfv]
 """
 
+import argparse
 import sys
 
 import numpy as np
@@ -22,7 +23,20 @@ except ModuleNotFoundError as exc:
     ) from exc
 
 
-def main() -> int:
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Validate the repo's paper-inspired Yukawa benchmark point."
+    )
+    parser.add_argument(
+        "--skip-lfv",
+        action="store_true",
+        help="Skip the informational mu -> e gamma section (e.g. in CI smoke runs)",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = _build_parser().parse_args(argv)
     result = compute_all_yukawas(
         Lambda_IR=3000,
         c_L=0.58,
@@ -71,6 +85,8 @@ def main() -> int:
 
     print("All checks passed within 2% relative tolerance.")
     print()
+    if args.skip_lfv:
+        return 0
 
     # --- μ→eγ constraint check (informational) ---
     lfv = check_mu_to_e_gamma(result)
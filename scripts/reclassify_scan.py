@@ -5,9 +5,245 @@ from __future__ import annotations
 
 import argparse
 import csv
+import gc
+import multiprocessing as mp
+import os
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain, islice
 from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Tuple
 
-from scanParams import AnarchyConfig, ReclassifyConfig, classify_row
+from scanParams import AnarchyConfig, ReclassifyConfig, classify_rows_batch
+
+_GLOBAL_RECLASS_CONFIG: ReclassifyConfig | None = None
+
+# Input columns classify_rows_batch reads; only these are sent to workers.
+_CLASSIFY_INPUTS = (
+    "Y_E_bar_1",
+    "Y_E_bar_2",
+    "Y_E_bar_3",
+    "Y_N_bar_1",
+    "Y_N_bar_2",
+    "Y_N_bar_3",
+    "lfv_ratio",
+    "lfv_lhs",
+    "lfv_rhs",
+    "ordering",
+    "majorana_alpha",
+    "majorana_beta",
+)
+_CLASSIFY_TEXT_INPUTS = ("ordering",)
+
+# reclass_* columns written by this script, with their Parquet types.
+_RECLASS_COLUMNS = {
+    "reclass_max_Y_bar_observed": "float64",
+    "reclass_min_Y_bar_observed": "float64",
+    "reclass_perturbative": "bool",
+    "reclass_natural": "bool",
+    "reclass_lfv_passes": "bool",
+    "reclass_anarchy_score": "float64",
+    "reclass_anarchy_band_penalty": "float64",
+    "reclass_anarchy_condition_penalty": "float64",
+    "reclass_anarchy_yN_overall": "float64",
+    "reclass_passes_all": "bool",
+    "reclass_reject_reason": "string",
+}
+
+_OUTPUT_BUFFER_BYTES = 1 << 20
+
+
+def _worker_init(reclass_config: ReclassifyConfig) -> None:
+    global _GLOBAL_RECLASS_CONFIG
+    _GLOBAL_RECLASS_CONFIG = reclass_config
+
+
+def _worker_classify_chunk(columns: Mapping[str, List[Any]]) -> Dict[str, Any]:
+    if _GLOBAL_RECLASS_CONFIG is None:
+        raise RuntimeError("worker was not initialized")
+    return classify_rows_batch(columns, _GLOBAL_RECLASS_CONFIG)
+
+
+def _classifier_inputs(columns: Mapping[str, Any]) -> Dict[str, Any]:
+    return {name: columns[name] for name in _CLASSIFY_INPUTS if name in columns}
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic GC for one allocation-heavy block that builds no cycles."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _iter_column_chunks(
+    reader: Iterator[List[str]], in_fields: List[str], chunk_size: int
+) -> Iterator[Tuple[Dict[str, List[str]], Dict[str, Any]]]:
+    """Yield the remaining CSV rows as ``(columns, classifier inputs)`` chunks.
+
+    Each block of ``chunk_size`` rows is transposed with one ``zip(*)`` pass,
+    so rows are never held as per-row dicts and only the chunks in flight are
+    in memory.  The cyclic GC is paused while a chunk is parsed: its cell
+    strings and row lists cannot form cycles, and repeated collections over
+    them roughly double the parse time.
+    """
+    rows = (row for row in reader if row)
+    while True:
+        with _gc_paused():
+            block = list(islice(rows, chunk_size))
+            if not block:
+                return
+            for row in block:
+                if len(row) != len(in_fields):
+                    raise ValueError(
+                        f"a row has {len(row)} fields, header has {len(in_fields)}"
+                    )
+            columns = dict(zip(in_fields, map(list, zip(*block))))
+        yield columns, _classifier_inputs(columns)
+
+
+def _iter_arrow_chunks(
+    input_path: Path, in_fields: List[str], chunk_size: int
+) -> Iterator[Tuple[Dict[str, List[str]], Dict[str, Any]]]:
+    """``_iter_column_chunks`` on pyarrow's streaming C CSV reader.
+
+    Every column is read as text so pass-through cells are written back
+    unchanged.  Classifier inputs that parse as floats in every row of a
+    chunk are handed over as float64 arrays (Arrow's cast replaces the
+    per-cell ``float()``); columns with empty or unparsable cells stay text
+    so ``classify_rows_batch`` keeps its missing-value and error handling.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+
+    reader = pa_csv.open_csv(
+        input_path,
+        read_options=pa_csv.ReadOptions(
+            column_names=in_fields, skip_rows=1, block_size=1 << 24
+        ),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in in_fields},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        ),
+    )
+    for batch in reader:
+        for start in range(0, batch.num_rows, chunk_size):
+            part = batch.slice(start, chunk_size)
+            columns = {
+                name: part.column(i).to_pylist() for i, name in enumerate(in_fields)
+            }
+            inputs = _classifier_inputs(columns)
+            for name in inputs:
+                if name in _CLASSIFY_TEXT_INPUTS:
+                    continue
+                try:
+                    values = pc.cast(part.column(in_fields.index(name)), pa.float64())
+                except pa.ArrowInvalid:
+                    continue
+                inputs[name] = values.to_numpy(zero_copy_only=False)
+            yield columns, inputs
+
+
+def _classify_chunks(
+    chunks: Iterator[Tuple[Dict[str, List[str]], Dict[str, Any]]],
+    reclass_config: ReclassifyConfig,
+    n_workers: int,
+) -> Iterator[Tuple[Dict[str, List[str]], Dict[str, Any]]]:
+    """Yield ``(columns, classification)`` pairs in input order.
+
+    With several workers at most ``2 * n_workers`` chunks are in flight, so
+    reading, classification and writing overlap without the whole file being
+    queued up front (``Pool.imap`` would drain the reader eagerly).  Workers
+    only receive the classifier inputs, not the pass-through columns.
+    """
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if n_workers <= 1 or second is None:
+        _worker_init(reclass_config)
+        for columns, inputs in chain([first], [] if second is None else [second], chunks):
+            yield columns, _worker_classify_chunk(inputs)
+        return
+
+    with mp.Pool(n_workers, initializer=_worker_init, initargs=(reclass_config,)) as pool:
+        pending: Deque[Tuple[Dict[str, List[str]], Any]] = deque()
+        for columns, inputs in chain([first, second], chunks):
+            pending.append((columns, pool.apply_async(_worker_classify_chunk, (inputs,))))
+            if len(pending) >= 2 * n_workers:
+                done, result = pending.popleft()
+                yield done, result.get()
+        while pending:
+            done, result = pending.popleft()
+            yield done, result.get()
+
+
+@contextmanager
+def _open_csv_sink(
+    output_path: Path, out_fields: List[str]
+) -> Iterator[Callable[[Dict[str, Any]], None]]:
+    """Yield a ``write(columns)`` callable appending one chunk to a CSV file.
+
+    The file is opened with a 1 MiB buffer and flushed after every chunk, so
+    syscalls are amortized while a long run still shows steady progress on
+    disk.
+    """
+    with output_path.open(
+        "w", encoding="utf-8", newline="", buffering=_OUTPUT_BUFFER_BYTES
+    ) as out_handle:
+        writer = csv.writer(out_handle)
+        writer.writerow(out_fields)
+
+        def write(columns: Dict[str, Any]) -> None:
+            columns.update((c, columns[c].tolist()) for c in _RECLASS_COLUMNS)
+            writer.writerows(zip(*(columns[field] for field in out_fields)))
+            out_handle.flush()
+
+        yield write
+
+
+@contextmanager
+def _open_parquet_sink(
+    output_path: Path, out_fields: List[str]
+) -> Iterator[Callable[[Dict[str, Any]], None]]:
+    """``_open_csv_sink`` writing one Parquet row group per chunk.
+
+    Pass-through columns are stored as text, exactly as read; the reclass_*
+    columns keep their float/bool types.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ModuleNotFoundError as exc:
+        raise ModuleNotFoundError("--output-format parquet requires pyarrow") from exc
+
+    schema = pa.schema(
+        [(field, pa.type_for_alias(_RECLASS_COLUMNS.get(field, "string"))) for field in out_fields]
+    )
+    with pq.ParquetWriter(output_path, schema) as parquet_writer:
+
+        def write(columns: Dict[str, Any]) -> None:
+            table = pa.Table.from_pydict(
+                {field: columns[field] for field in out_fields}, schema=schema
+            )
+            parquet_writer.write_table(table)
+
+        yield write
+
+
+def _have_pyarrow() -> bool:
+    try:
+        import pyarrow.csv  # noqa: F401
+    except ModuleNotFoundError:
+        return False
+    return True
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -65,6 +301,31 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--anarchy-w-band", type=float, default=1.0)
     parser.add_argument("--anarchy-w-cond", type=float, default=1.0)
     parser.add_argument("--anarchy-w-fit", type=float, default=0.0)
+    parser.add_argument(
+        "--n-workers",
+        type=int,
+        default=int(os.environ.get("SLURM_CPUS_PER_TASK", "1")),
+        help="Worker processes for row classification (rows are split into chunks)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=50_000,
+        help="Rows per classification chunk handed to a worker",
+    )
+    parser.add_argument(
+        "--csv-engine",
+        choices=("python", "pyarrow", "auto"),
+        default="python",
+        help="CSV parser: the csv module (default) or pyarrow's C reader (optional "
+        "dependency, opt-in); 'auto' uses pyarrow when it is installed",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("csv", "parquet"),
+        default="csv",
+        help="Output file format; parquet (requires pyarrow) stores reclass_* columns typed",
+    )
     return parser
 
 
@@ -101,47 +362,41 @@ def main() -> int:
     if not input_path.exists():
         raise FileNotFoundError(f"Input CSV not found: {input_path}")
 
+    use_arrow = args.csv_engine == "pyarrow" or (args.csv_engine == "auto" and _have_pyarrow())
+    print(f"CSV engine: {'pyarrow' if use_arrow else 'python'}")
+
+    # Rows stream through in chunks: read, classify, and write each chunk
+    # before later ones are parsed.  Each chunk is written in out_fields
+    # order, straight from the column-wise chunks: input columns pass through,
+    # reclass_* columns (appended, or replaced on a re-run) come from the
+    # classifier.
+    n_rows = 0
+    n_pass = 0
     with input_path.open("r", encoding="utf-8", newline="") as in_handle:
-        reader = csv.DictReader(in_handle)
-        if reader.fieldnames is None:
+        reader = csv.reader(in_handle)
+        in_fields = next(reader, None)
+        if in_fields is None:
             raise ValueError(f"Input CSV has no header: {input_path}")
-        in_fields = list(reader.fieldnames)
-        rows = list(reader)
-
-    reclass_columns = [
-        "reclass_max_Y_bar_observed",
-        "reclass_min_Y_bar_observed",
-        "reclass_perturbative",
-        "reclass_natural",
-        "reclass_lfv_passes",
-        "reclass_anarchy_score",
-        "reclass_anarchy_band_penalty",
-        "reclass_anarchy_condition_penalty",
-        "reclass_anarchy_yN_overall",
-        "reclass_passes_all",
-        "reclass_reject_reason",
-    ]
-    out_fields = in_fields + [c for c in reclass_columns if c not in in_fields]
+        out_fields = in_fields + [c for c in _RECLASS_COLUMNS if c not in in_fields]
+        chunk_size = max(int(args.chunk_size), 1)
+        if use_arrow:
+            chunks = _iter_arrow_chunks(input_path, in_fields, chunk_size)
+        else:
+            chunks = _iter_column_chunks(reader, in_fields, chunk_size)
 
-    n_pass = 0
-    out_rows = []
-    for row in rows:
-        rec = classify_row(row, reclass_config)
-        merged = dict(row)
-        merged.update(rec)
-        out_rows.append(merged)
-        if rec["reclass_passes_all"]:
-            n_pass += 1
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as out_handle:
-        writer = csv.DictWriter(out_handle, fieldnames=out_fields)
-        writer.writeheader()
-        writer.writerows(out_rows)
-
-    print(f"Wrote {len(out_rows)} rows to {output_path}")
-    acceptance = 100.0 * n_pass / max(len(out_rows), 1)
-    print(f"Reclassified acceptance: {n_pass}/{len(out_rows)} ({acceptance:.1f}%)")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        open_sink = _open_parquet_sink if args.output_format == "parquet" else _open_csv_sink
+        with open_sink(output_path, out_fields) as write:
+            for chunk, rec in _classify_chunks(chunks, reclass_config, int(args.n_workers)):
+                n_rows += len(rec["reclass_passes_all"])
+                n_pass += int(rec["reclass_passes_all"].sum())
+                # The chunk's column dict is not used again: merge in place.
+                chunk.update((c, rec[c]) for c in _RECLASS_COLUMNS)
+                write(chunk)
+
+    print(f"Wrote {n_rows} rows to {output_path}")
+    acceptance = 100.0 * n_pass / max(n_rows, 1)
+    print(f"Reclassified acceptance: {n_pass}/{n_rows} ({acceptance:.1f}%)")
     return 0
 
 
@@ -940,11 +940,13 @@ def _require_valid_quark_fit(
 
 
 def _require_perturbative_leptons(lepton_yukawas: YukawaResult, cfg: ScanConfig) -> None:
-    max_ybar = max(
-        float(np.max(np.abs(lepton_yukawas.Y_E_bar))),
-        float(np.max(np.abs(lepton_yukawas.Y_N_bar))),
-    )
-    if not math.isfinite(max_ybar) or not lepton_yukawas.is_perturbative(cfg.perturbative_ybar_max):
+    # Six entries: a builtin max over plain floats beats two NumPy reductions.
+    # NaN entries fail the isfinite check below, as with np.max.
+    abs_ybar = [abs(y) for y in lepton_yukawas.Y_E_bar.tolist()]
+    abs_ybar += [abs(y) for y in lepton_yukawas.Y_N_bar.tolist()]
+    max_ybar = math.nan if any(math.isnan(y) for y in abs_ybar) else max(abs_ybar)
+    # Same test as YukawaResult.is_perturbative, reusing the reduction above.
+    if not math.isfinite(max_ybar) or not max_ybar < cfg.perturbative_ybar_max:
         raise RuntimeError(f"nonperturbative_lepton_yukawa:{max_ybar:.6g}")
 
 
@@ -22,11 +22,18 @@ from __future__ import annotations
 
 import math
 import warnings
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from scipy.optimize import brentq
-from scipy.special import jn_zeros, jv, yv  # jn_zeros only for integer order
+from scipy.special import cython_special, jn_zeros, jv, yv  # jn_zeros only for integer order
+
+try:  # vectorized Chandrupatla bracket solver, SciPy >= 1.15
+    from scipy.optimize.elementwise import find_root as _find_root
+except ImportError:  # pragma: no cover - older SciPy falls back to brentq
+    _find_root = None
 
 # =========================
 # 0) GLOBAL / DEFAULT PARAMS
@@ -42,6 +49,10 @@ _TINY = 1e-14
 _MIN_X = 1e-12
 _SCAN_START_X = 1e-6
 _ROOT_SCAN_STEP = math.pi / 16.0
+# Below this many brackets per-bracket brentq beats the array solver's setup cost.
+_VECTOR_ROOT_MIN_BRACKETS = 64
+# Dimensionless towers kept by `_cached_tower` (least recently used dropped first).
+_TOWER_CACHE_SIZE = 2048
 
 
 # =========================
@@ -106,30 +117,80 @@ def _nu_for(species: str, bc: str, c: Optional[float]) -> Tuple[float, str]:
         raise ValueError(f"Species must be 'gauge' or 'fermion'. Got '{species}'.")
 
 
-def _F_exact(nu: float, eps: float) -> Callable[[float], float]:
+def _F_exact(nu: float, eps: float, guard: bool = True) -> Callable[[float], float]:
     """
     Exact quantization equation in a numerically stable cross-product form:
         F(x) = J_ν(x) Y_ν(εx) - J_ν(εx) Y_ν(x) = 0
     This avoids explicit division by Y_ν and stays finite near zeros.
+
+    This scalar form is what brentq calls on every iteration, so it uses the
+    `cython_special` Bessel functions: the same kernels as the `jv`/`yv`
+    ufuncs (bit-identical values) without the ufunc dispatch per call.
+    guard=False drops the x <= _MIN_X branch, for callers whose brackets
+    start at or above _SCAN_START_X.
     """
+    nu = float(nu)
+    eps = float(eps)
+    jv_s, yv_s = cython_special.jv, cython_special.yv
+
+    if not guard:
+        def F_unguarded(x: float) -> float:
+            ex = eps * x
+            return jv_s(nu, x) * yv_s(nu, ex) - jv_s(nu, ex) * yv_s(nu, x)
+        return F_unguarded
+
     def F(x: float) -> float:
         if x <= _MIN_X:
             return np.sign(x) * 1.0  # avoid evaluating at 0
-        return jv(nu, x) * yv(nu, eps * x) - jv(nu, eps * x) * yv(nu, x)
+        ex = eps * x
+        return jv_s(nu, x) * yv_s(nu, ex) - jv_s(nu, ex) * yv_s(nu, x)
     return F
 
 
-def _F_ironly(nu: float) -> Callable[[float], float]:
+def _F_ironly(nu: float, guard: bool = True) -> Callable[[float], float]:
     """
     IR-only approximation: J_ν(x) = 0
     """
+    nu = float(nu)
+    jv_s = cython_special.jv
+    if not guard:
+        return partial(jv_s, nu)
+
     def F(x: float) -> float:
         if x <= _MIN_X:
             return 1.0
-        return jv(nu, x)
+        return jv_s(nu, x)
     return F
 
 
+def _F_exact_vec(nu: float, eps: float) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Array version of `_F_exact` for bracket scans: one ufunc call per Bessel
+    factor over the whole grid, elementwise identical to the scalar F.  Guarded
+    points (x <= _MIN_X) are masked after the fact, so the inf/nan values the
+    Bessel factors produce there are computed with warnings silenced.
+    """
+    def F_vec(x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        ex = eps * x
+        with np.errstate(invalid="ignore"):
+            vals = jv(nu, x) * yv(nu, ex) - jv(nu, ex) * yv(nu, x)
+        return np.where(x <= _MIN_X, np.sign(x), vals)
+    return F_vec
+
+
+def _F_ironly_vec(nu: float) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Array version of `_F_ironly`.
+    """
+    def F_vec(x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        with np.errstate(invalid="ignore"):
+            vals = jv(nu, x)
+        return np.where(x <= _MIN_X, 1.0, vals)
+    return F_vec
+
+
 # =========================
 # 3) ROOT BRACKETING UTILITIES
 # =========================
@@ -167,11 +228,11 @@ def _bracket_around(F: Callable[[float], float],
     b = float(x0) + width
     fa = F(a)
     fb = F(b)
-    if np.sign(fa) == 0.0:
+    if fa == 0.0:
         return (max(a - 0.1 * width, _SCAN_START_X), a + 0.1 * width)
-    if np.sign(fb) == 0.0:
+    if fb == 0.0:
         return (max(b - 0.1 * width, _SCAN_START_X), b + 0.1 * width)
-    if np.sign(fa) != np.sign(fb):
+    if np.signbit(fa) ^ np.signbit(fb):
         return (a, b)
 
     # Expand additively, capped below pi/2 so one bracket cannot span two roots.
@@ -181,36 +242,87 @@ def _bracket_around(F: Callable[[float], float],
         b = float(x0) + width
         fa = F(a)
         fb = F(b)
-        if np.sign(fa) != np.sign(fb):
+        if fa == 0.0 or fb == 0.0 or np.signbit(fa) ^ np.signbit(fb):
             return (a, b)
     return None
 
 
-def _scan_for_brackets(F: Callable[[float], float],
+def _scan_grid(x_prev: float, step: float, block: int, x_max: float) -> np.ndarray:
+    """
+    Next `block` scan points after x_prev (x_prev included as element 0),
+    accumulated with a running sum and clipped at x_max.
+    """
+    xs = np.cumsum(np.concatenate(([x_prev], np.full(block, float(step)))))
+    past = np.flatnonzero(xs >= x_max)
+    if past.size:
+        xs = xs[:past[0] + 1]
+        xs[-1] = x_max
+    return xs
+
+
+def _scan_block_size(step: float, n_needed: int) -> int:
+    """Scan points spanning n_needed + 1 root spacings (~pi each)."""
+    return (n_needed + 1) * int(math.ceil(math.pi / step))
+
+
+def _scan_for_brackets(F_vec: Callable[[np.ndarray], np.ndarray],
                        x_start: float,
                        step: float,
                        n_needed: int,
-                       x_max: float = 200.0) -> List[Tuple[float, float]]:
+                       x_max: float = 200.0,
+                       block: Optional[int] = None,
+                       first_block: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                       endpoint_values: Optional[Dict[float, float]] = None,
+                       ) -> List[Tuple[float, float]]:
     """
     Linear scan to collect brackets with sign changes of F.
+
+    The grid x_start, x_start + step, ... (clipped to x_max) is evaluated
+    `block` points at a time with the array form of F, so each block costs a
+    handful of ufunc calls instead of one Python-level F(x) per point.  Grid
+    points are accumulated with a running sum, matching a step-by-step walk.
+    The default block spans n_needed + 1 root spacings (~pi each), so the
+    first pass usually yields every bracket.  `first_block` = (xs, F(xs))
+    supplies an already evaluated first block (see `solve_kk_batch`).  If
+    `endpoint_values` is given, F at each sign-change bracket's ends is
+    stored in it so the root finder does not evaluate them again.
     """
-    brackets = []
+    if block is None:
+        block = _scan_block_size(step, n_needed)
+    brackets: List[Tuple[float, float]] = []
+    delta = min(step * 0.25, 0.1)
     x_prev = max(x_start, _SCAN_START_X)
-    f_prev = F(x_prev)
-    x = x_prev
-    while len(brackets) < n_needed and x < x_max:
-        x = min(x + step, x_max)
-        f = F(x)
-        if not (np.isfinite(f_prev) and np.isfinite(f)):
-            x_prev, f_prev = x, f
-            continue
-        if np.sign(f_prev) == 0.0:
-            # near exact zero, create a small bracket
-            delta = min(step * 0.25, 0.1)
-            brackets.append((max(x_prev - delta, _SCAN_START_X), x_prev + delta))
-        elif np.sign(f_prev) != np.sign(f):
-            brackets.append((x_prev, x))
-        x_prev, f_prev = x, f
+    f_prev = None
+    while len(brackets) < n_needed and x_prev < x_max:
+        if first_block is not None:
+            xs, fs = first_block
+            first_block = None
+        elif f_prev is None:
+            xs = _scan_grid(x_prev, step, block, x_max)
+            fs = F_vec(xs)
+        else:
+            xs = _scan_grid(x_prev, step, block, x_max)
+            fs = np.empty_like(xs)
+            fs[0] = f_prev
+            fs[1:] = F_vec(xs[1:])
+
+        f0, f1 = fs[:-1], fs[1:]
+        finite = np.isfinite(f0) & np.isfinite(f1)
+        # Sign changes from the sign bits; an exact zero at the right end
+        # counts as a change, one at the left end gets its own bracket.
+        at_zero = finite & (f0 == 0.0)
+        crossing = finite & ~at_zero & ((f1 == 0.0) | (np.signbit(f0) ^ np.signbit(f1)))
+        for i in np.flatnonzero(at_zero | crossing)[:n_needed - len(brackets)]:
+            a, b = float(xs[i]), float(xs[i + 1])
+            if at_zero[i]:
+                # near exact zero, create a small bracket
+                brackets.append((max(a - delta, _SCAN_START_X), a + delta))
+            else:
+                brackets.append((a, b))
+                if endpoint_values is not None:
+                    endpoint_values[a] = float(fs[i])
+                    endpoint_values[b] = float(fs[i + 1])
+        x_prev, f_prev = float(xs[-1]), fs[-1]
     return brackets
 
 
@@ -250,9 +362,178 @@ def _validate_roots(xs: np.ndarray, *, tol: float) -> None:
         )
 
 
+def _solve_brackets(F: Callable[[float], float],
+                    F_vec: Callable[[np.ndarray], np.ndarray],
+                    brackets: List[Tuple[float, float]],
+                    tol: float,
+                    known: Optional[Dict[float, float]] = None) -> List[float]:
+    """
+    Root of F in each bracket.
+
+    Long towers are solved in one vectorized Chandrupatla run (each iteration
+    is a single F_vec call over all unconverged brackets); short ones, and any
+    bracket the array solver does not converge on, use scalar brentq.  `known`
+    maps x -> F(x) for points the bracket scan already evaluated (the bracket
+    ends), which brentq would otherwise recompute first thing.
+    """
+    if known:
+        F_scalar = F
+
+        def F(x: float) -> float:
+            value = known.get(x)
+            return F_scalar(x) if value is None else value
+
+    roots: List[Optional[float]] = [None] * len(brackets)
+    if _find_root is not None and len(brackets) >= _VECTOR_ROOT_MIN_BRACKETS:
+        lo, hi = np.array(brackets, dtype=float).T
+        res = _find_root(F_vec, (lo, hi), tolerances=dict(xatol=tol, xrtol=tol), maxiter=200)
+        for i in np.flatnonzero(res.success):
+            roots[i] = float(res.x[i])
+
+    for i, (a, b) in enumerate(brackets):
+        if roots[i] is not None:
+            continue
+        try:
+            roots[i] = brentq(F, a, b, xtol=tol, rtol=tol, maxiter=200)
+        except ValueError:
+            # Failsafe: nudge ends slightly and retry once
+            aa = max(a - 0.01 * (b - a), _SCAN_START_X)
+            bb = b + 0.01 * (b - a)
+            roots[i] = brentq(F, aa, bb, xtol=tol, rtol=tol, maxiter=200)
+    return roots
+
+
 # =========================
 # 4) MAIN SOLVER
 # =========================
+def _ir_only_suffices(nu: float, eps: float, tol: float, x_max: float) -> bool:
+    """
+    True if the UV boundary term cannot move an exact root by more than `tol`.
+
+    The exact condition is J_ν(x) + b Y_ν(x) = 0 with b = -J_ν(εx)/Y_ν(εx);
+    near a root of J_ν the shift is ≈ |b| |Y_ν/J_ν'| ≈ |b|.  For εx ≪ 1, |b|
+    grows with x (∝ (εx)^{2ν}), so its value at x_max bounds every root.  For
+    ν = 0 (gauge NN) |b| ~ 1/|ln ε| and the exact equation is always kept.
+    """
+    x_uv = eps * x_max
+    if not x_uv < 1e-3:
+        return False
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        b_max = abs(jv(nu, x_uv) / yv(nu, x_uv))
+    return bool(b_max < tol)
+
+
+def _solve_tower(nu: float,
+                 eps: float,
+                 n_roots: int,
+                 exact: bool,
+                 tol: float,
+                 x_max: float,
+                 first_block: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                 ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bracket, solve and post-process the KK tower of one Bessel order.
+    Returns the dimensionless (x roots, b_n); they do not depend on Λ_IR.
+    """
+    # Build the function F(x): scalar form for Brent, array form for the scan.
+    # Every bracket starts at or above _SCAN_START_X, so Brent's F skips the
+    # x <= _MIN_X guard.
+    F = _F_exact(nu, eps, guard=False) if exact else _F_ironly(nu, guard=False)
+    F_vec = _F_exact_vec(nu, eps) if exact else _F_ironly_vec(nu)
+
+    # C-4: scan sequentially with a fixed step below the ~pi root spacing.  This
+    # avoids relative seed windows that grow wide enough to contain multiple roots.
+    endpoint_values: Dict[float, float] = {}
+    brackets = _scan_for_brackets(
+        F_vec,
+        x_start=_SCAN_START_X,
+        step=_ROOT_SCAN_STEP,
+        n_needed=n_roots,
+        x_max=x_max,
+        first_block=first_block,
+        endpoint_values=endpoint_values,
+    )
+
+    if len(brackets) < n_roots:
+        warnings.warn(
+            f"Only found {len(brackets)} sign-change brackets up to x={x_max}. "
+            "Returning fewer roots.",
+            stacklevel=2,
+        )
+        n_roots = len(brackets)
+
+    xs = _sorted_unique_roots(
+        _solve_brackets(F, F_vec, brackets[:n_roots], tol, known=endpoint_values), tol
+    )
+    if len(xs) < n_roots:
+        warnings.warn(
+            f"Only found {len(xs)} unique KK Bessel roots up to x={x_max}. "
+            "Returning fewer roots.",
+            stacklevel=2,
+        )
+        n_roots = len(xs)
+    _validate_roots(xs, tol=tol)
+
+    # Compute b_n for all modes at once:
+    #   exact=True : IR ratio at x
+    #   exact=False: UV ratio at εx (since Jν(x)=0 at IR in the approximation)
+    xb = xs if exact else eps * xs
+    J = jv(nu, xb)
+    Y = yv(nu, xb)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bvals = np.where(np.abs(Y) < 1e-300, np.nan, -J / Y)
+
+    return xs, bvals
+
+
+_TowerKey = Tuple[float, float, int, bool, float, float]
+_TOWER_CACHE: "OrderedDict[_TowerKey, Tuple[np.ndarray, np.ndarray, Tuple[Any, ...]]]" = (
+    OrderedDict()
+)
+
+
+def _tower_key(nu: float, eps: float, n_roots: int, exact: bool,
+               tol: float, x_max: float) -> _TowerKey:
+    return (float(nu), float(eps), int(n_roots), bool(exact), float(tol), float(x_max))
+
+
+def _cached_tower(nu: float,
+                  eps: float,
+                  n_roots: int,
+                  exact: bool,
+                  tol: float,
+                  x_max: float,
+                  first_block: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `_solve_tower` memoized on (ν, ε, n_roots, exact, tol, x_max).
+
+    The tower depends on the geometry only through ε (masses are x Λ_IR), so
+    repeated solves of one (ν, ε), e.g. rebuilding a spectrum for every scan
+    point or rescaling k and Λ_IR together, reuse it.  Keys are the exact floats
+    (no rounding), so cached results are identical to a fresh solve.  Returned
+    arrays are read-only and shared; warnings raised by the solve are replayed
+    on every hit.
+    """
+    key = _tower_key(nu, eps, n_roots, exact, tol, x_max)
+    entry = _TOWER_CACHE.get(key)
+    if entry is None:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            xs, bvals = _solve_tower(nu, eps, n_roots, exact, tol, x_max, first_block)
+        xs.setflags(write=False)
+        bvals.setflags(write=False)
+        entry = (xs, bvals, tuple((w.message, w.category) for w in caught))
+        _TOWER_CACHE[key] = entry
+        if len(_TOWER_CACHE) > _TOWER_CACHE_SIZE:
+            _TOWER_CACHE.popitem(last=False)
+    else:
+        _TOWER_CACHE.move_to_end(key)
+    for message, category in entry[2]:
+        warnings.warn(message, category, stacklevel=3)
+    return entry[0], entry[1]
+
+
 def solve_kk(species: str,
              bc: str,
              geometry: Dict[str, float],
@@ -262,7 +543,8 @@ def solve_kk(species: str,
              exact: bool = DEFAULT_EXACT,
              tol: float = DEFAULT_TOL,
              x_max: float = 200.0,
-             return_extras: bool = True) -> Tuple[np.ndarray, Dict[str, Any]]:
+             return_extras: bool = True,
+             auto_ir_only: bool = False) -> Tuple[np.ndarray, Dict[str, Any]]:
     """
     Find the first `n_roots` KK masses for the given field and BC.
 
@@ -277,6 +559,11 @@ def solve_kk(species: str,
     tol     : root-finder tolerance in x
     x_max   : upper scan limit in dimensionless x
     return_extras : if True, also return dict with 'x', 'b', and 'masses'
+    auto_ir_only  : if True and exact=True, solve J_ν(x)=0 instead whenever the
+                    UV term shifts every root by less than `tol` (ε^{2ν} ≪ tol);
+                    (opt-in); labels['exact'] and labels['equation'] record
+                    the equation actually solved and
+                    labels['ir_only_substituted'] flags the substitution
 
     Returns
     -------
@@ -304,76 +591,117 @@ def solve_kk(species: str,
     # Determine ν for this species/BC
     nu, nu_label = _nu_for(species, bc, c)
 
-    # Build the function F(x)
-    F = _F_exact(nu, eps) if exact else _F_ironly(nu)
-
-    # C-4: scan sequentially with a fixed step below the ~pi root spacing.  This
-    # avoids relative seed windows that grow wide enough to contain multiple roots.
-    brackets = _scan_for_brackets(
-        F,
-        x_start=_SCAN_START_X,
-        step=_ROOT_SCAN_STEP,
-        n_needed=n_roots,
-        x_max=x_max,
-    )
-
-    if len(brackets) < n_roots:
-        warnings.warn(
-            f"Only found {len(brackets)} sign-change brackets up to x={x_max}. "
-            "Returning fewer roots.",
-            stacklevel=2,
-        )
-        n_roots = len(brackets)
-
-    # Solve each bracket with Brent
-    xs_raw = []
-    for (a, b) in brackets[:n_roots]:
-        try:
-            root = brentq(F, a, b, xtol=tol, rtol=tol, maxiter=200)
-        except ValueError:
-            # Failsafe: nudge ends slightly and retry once
-            aa = max(a - 0.01 * (b - a), _SCAN_START_X)
-            bb = b + 0.01 * (b - a)
-            root = brentq(F, aa, bb, xtol=tol, rtol=tol, maxiter=200)
-        xs_raw.append(root)
-    xs = _sorted_unique_roots(xs_raw, tol)
-    if len(xs) < n_roots:
-        warnings.warn(
-            f"Only found {len(xs)} unique KK Bessel roots up to x={x_max}. "
-            "Returning fewer roots.",
-            stacklevel=2,
-        )
-        n_roots = len(xs)
-    _validate_roots(xs, tol=tol)
+    solve_exact = exact and not (auto_ir_only and _ir_only_suffices(nu, eps, tol, x_max))
+    xs, bvals = _cached_tower(nu, eps, n_roots=n_roots, exact=solve_exact, tol=tol, x_max=x_max)
 
     # Map to masses: m = x * Λ
     masses = xs * Lam
 
-    # Compute b_n per mode
-    bvals = []
-    for x in xs:
-        if exact:
-            # IR ratio
-            denom = yv(nu, x)
-            if abs(denom) < 1e-300:
-                bvals.append(np.nan)
-            else:
-                bvals.append(- jv(nu, x) / denom)
-        else:
-            # UV ratio (since Jν(x)=0 at IR in the approximation)
-            xp = eps * x
-            denom = yv(nu, xp)
-            if abs(denom) < 1e-300:
-                bvals.append(np.nan)
-            else:
-                bvals.append(- jv(nu, xp) / denom)
-    bvals = np.array(bvals)
-
     extras = dict(
-        x=xs,
-        b=bvals,
+        x=xs.copy(),
+        b=bvals.copy(),
         nu=nu,
-        labels=dict(nu_label=nu_label, species=species, bc=bc, exact=exact),
+        labels=dict(nu_label=nu_label, species=species, bc=bc, exact=solve_exact,
+                    equation="exact" if solve_exact else "ir_only",
+                    ir_only_substituted=exact and not solve_exact),
         geometry=geometry,
     )
     return masses, extras
+
+
+def solve_kk_batch(species: Union[str, Sequence[str]],
+                   bc: Union[str, Sequence[str]],
+                   geometry: Dict[str, float],
+                   c: Union[None, float, Sequence[Optional[float]]] = None,
+                   # Numerics
+                   n_roots: int = DEFAULT_N_ROOTS,
+                   exact: bool = DEFAULT_EXACT,
+                   tol: float = DEFAULT_TOL,
+                   x_max: float = 200.0,
+                   auto_ir_only: bool = False) -> List[Tuple[np.ndarray, Dict[str, Any]]]:
+    """
+    `solve_kk` for several fields sharing one geometry.
+
+    `species`, `bc` and `c` may each be a single value or a sequence; single
+    values are repeated to the common length.  Each distinct Bessel order is
+    solved once; the first scan block of every order is evaluated in one
+    broadcast (orders x grid) Bessel call per factor, and each order is then
+    finished exactly as in `solve_kk`, so the results match field-by-field
+    calls.
+
+    Returns
+    -------
+    list of (masses, extras), one per field, as returned by `solve_kk`.
+    """
+    def _as_list(value: Any) -> List[Any]:
+        if value is None or isinstance(value, (str, float, int)):
+            return [value]
+        return list(value)
+
+    species_l, bc_l, c_l = _as_list(species), _as_list(bc), _as_list(c)
+    n_fields = max(len(species_l), len(bc_l), len(c_l))
+    for name, values in (("species", species_l), ("bc", bc_l), ("c", c_l)):
+        if len(values) not in (1, n_fields):
+            raise ValueError(f"{name} has {len(values)} entries; expected 1 or {n_fields}")
+    species_l = species_l * n_fields if len(species_l) == 1 else species_l
+    bc_l = bc_l * n_fields if len(bc_l) == 1 else bc_l
+    c_l = c_l * n_fields if len(c_l) == 1 else c_l
+
+    geometry = _validate_geometry(geometry)
+    eps = geometry["epsilon"]
+    Lam = geometry["Lambda_IR"]
+
+    orders = [_nu_for(sp, b, cc) for sp, b, cc in zip(species_l, bc_l, c_l)]
+    # Fields sharing a Bessel order (e.g. flavour-universal c, or (++, c) and
+    # (--, c') landing on the same nu) share one tower.
+    distinct = list(dict.fromkeys(nu for nu, _ in orders))
+    solve_exact = {
+        nu: exact and not (auto_ir_only and _ir_only_suffices(nu, eps, tol, x_max))
+        for nu in distinct
+    }
+
+    # Shared first scan block, evaluated at once for all orders missing from
+    # the tower cache (one broadcast call per equation).  Neighbouring orders
+    # (++ uses alpha -/+ 1, -- uses alpha) are evaluated directly in this
+    # broadcast call rather than via the three-term recurrence: forward
+    # recurrence for J_nu(eps x) with eps x << nu cancels catastrophically,
+    # and stepping alpha-1 -> alpha needs J_{alpha-2} as well.
+    xs = _scan_grid(_SCAN_START_X, _ROOT_SCAN_STEP,
+                    _scan_block_size(_ROOT_SCAN_STEP, n_roots), x_max)
+    first_blocks: Dict[float, Tuple[np.ndarray, np.ndarray]] = {}
+    for use_exact in (True, False):
+        missing = [
+            nu for nu in distinct
+            if solve_exact[nu] == use_exact
+            and _tower_key(nu, eps, n_roots, use_exact, tol, x_max) not in _TOWER_CACHE
+        ]
+        if not missing:
+            continue
+        nus = np.array(missing, dtype=float)[:, None]
+        F_all = (_F_exact_vec(nus, eps) if use_exact else _F_ironly_vec(nus))(xs)
+        first_blocks.update((nu, (xs, F_all[j])) for j, nu in enumerate(missing))
+
+    towers = {
+        nu: _cached_tower(
+            nu, eps, n_roots=n_roots, exact=solve_exact[nu], tol=tol, x_max=x_max,
+            first_block=first_blocks.get(nu),
+        )
+        for nu in distinct
+    }
+
+    results = []
+    for i, (nu, nu_label) in enumerate(orders):
+        roots, bvals = towers[nu]
+        masses = roots * Lam
+        extras = dict(
+            x=roots.copy(),
+            b=bvals.copy(),
+            nu=nu,
+            labels=dict(nu_label=nu_label, species=species_l[i], bc=bc_l[i],
+                        exact=solve_exact[nu],
+                        equation="exact" if solve_exact[nu] else "ir_only",
+                        ir_only_substituted=exact and not solve_exact[nu]),
+            geometry=geometry,
+        )
+        results.append((masses, extras))
+    return results
@@ -8,7 +8,14 @@ import numpy as np
 import pytest
 
 from qcd import ALPHA_S_MZ, M_TOP_MS, M_Z, alpha_s, alpha_s_array, match_alpha_s
-from qcd.beta_function import beta_0, beta_1, beta_coefficients
+from qcd.beta_function import (
+    beta_0,
+    beta_1,
+    beta_2,
+    beta_3,
+    beta_coefficients,
+    beta_rhs,
+)
 
 # ---------- Beta function coefficients ----------
 
@@ -48,6 +55,35 @@ def test_beta_coefficients_invalid():
         beta_coefficients(5, 5)
 
 
+def test_beta_rhs_horner_matches_explicit_series():
+    """The Horner form equals -(a_s^2/4pi) sum_i beta_i(n_f) (a_s/4pi)^i."""
+    for n_f in range(3, 7):
+        betas = [beta_0(n_f), beta_1(n_f), beta_2(n_f), beta_3(n_f)]
+        for n_loops in range(1, 5):
+            for alpha in (0.05, 0.118, 0.3):
+                a = alpha / (4.0 * np.pi)
+                series = -(alpha**2 / (4.0 * np.pi)) * sum(
+                    betas[i] * a**i for i in range(n_loops)
+                )
+                assert beta_rhs(alpha, n_f, n_loops) == pytest.approx(series, rel=1e-14)
+
+
+def test_beta_functions_accept_integral_non_int_orders():
+    """n_f = 5.0 or np.int64(5) behaves like 5; non-integral values are rejected."""
+    reference = beta_rhs(0.118, 5, 4)
+    for n_f in (5.0, np.int64(5), np.float64(5.0)):
+        assert beta_rhs(0.118, n_f, 4) == reference
+        assert beta_rhs(0.118, 5, float(4)) == reference
+        np.testing.assert_array_equal(beta_coefficients(n_f, 4.0), beta_coefficients(5, 4))
+    for bad in (5.5, "5", None):
+        with pytest.raises(ValueError, match="n_f must be an integer"):
+            beta_rhs(0.118, bad, 4)
+        with pytest.raises(ValueError, match="n_f must be an integer"):
+            beta_coefficients(bad, 4)
+    with pytest.raises(ValueError, match="n_f must be 0..6"):
+        beta_rhs(0.118, 7.0, 4)
+
+
 # ---------- alpha_s running ----------
 
 
@@ -115,6 +151,25 @@ def test_1loop_analytic():
     assert np.isclose(alpha_s(mu, n_loops=1), expected, rtol=1e-6)
 
 
+def test_analytic_method_matches_tight_ode():
+    """Closed-form 1-/2-loop running agrees with a tightly integrated ODE."""
+    mus = [2.0, 4.18, 150.0, 3000.0, 1e5]
+    for n_loops in (1, 2):
+        analytic = [alpha_s(mu, n_loops=n_loops, method='analytic') for mu in mus]
+        ode = [alpha_s(mu, n_loops=n_loops, rtol=1e-13, atol=1e-15) for mu in mus]
+        np.testing.assert_allclose(analytic, ode, rtol=1e-12)
+        np.testing.assert_allclose(
+            alpha_s_array(mus, n_loops=n_loops, method='analytic'), analytic, rtol=1e-14
+        )
+
+
+def test_analytic_method_requires_low_loop_order():
+    with pytest.raises(ValueError):
+        alpha_s(1000.0, n_loops=3, method='analytic')
+    with pytest.raises(ValueError):
+        alpha_s(1000.0, method='exact')
+
+
 # ---------- Threshold handling ----------
 
 
@@ -161,6 +216,27 @@ def test_alpha_s_array():
     assert np.all(np.diff(result) < 0)
 
 
+def test_alpha_s_array_matches_pointwise_across_thresholds():
+    """Batched evolution agrees with per-scale alpha_s, including at thresholds."""
+    mus = np.array([[3000.0, 2.0, M_Z], [M_TOP_MS, 4.18, 500.0]])
+    result = alpha_s_array(mus)
+    expected = np.vectorize(alpha_s)(mus)
+    assert result.shape == mus.shape
+    np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+
+def test_alpha_s_array_forwards_integrator_tolerances():
+    """rtol/atol reach the batched integration; tight ones match alpha_s to round-off."""
+    mus = np.array([[3000.0, 2.0, M_Z], [M_TOP_MS, 4.18, 500.0]])
+    tight = dict(rtol=1e-13, atol=1e-15)
+    expected = np.vectorize(lambda mu: alpha_s(mu, **tight))(mus)
+    np.testing.assert_allclose(alpha_s_array(mus, **tight), expected, rtol=1e-14)
+
+    loose = alpha_s_array(mus, rtol=1e-4, atol=1e-6)
+    assert not np.array_equal(loose, alpha_s_array(mus))
+    np.testing.assert_allclose(loose, expected, rtol=1e-4)
+
+
 def test_matching_round_trip():
     """Matching down then up returns the original value (to matching order)."""
     a = alpha_s(1000.0, n_loops=4)
@@ -3,7 +3,16 @@ import pytest
 from scipy.optimize import brentq
 from scipy.special import jv
 
-from solvers.bessel import _F_exact, _nu_for, solve_kk
+from solvers import bessel
+from solvers.bessel import (
+    _F_exact,
+    _F_exact_vec,
+    _F_ironly,
+    _F_ironly_vec,
+    _nu_for,
+    solve_kk,
+    solve_kk_batch,
+)
 from warpConfig.baseParams import get_warp_params
 
 
@@ -132,3 +141,135 @@ def test_deep_exact_fermion_pp_roots_are_sorted_and_do_not_skip():
     assert np.all(np.diff(extras["x"]) > 0.0)
     assert np.allclose(extras["x"], expected, rtol=1e-10, atol=1e-10)
     assert extras["x"][4] == pytest.approx(15.29, abs=0.002)
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+@pytest.mark.parametrize("nu", [0.0, -0.33, 0.77, 1.25])
+def test_vectorized_quantization_functions_match_scalar_forms(nu):
+    """The array F used by the bracket scan agrees bit-for-bit with the scalar F."""
+    eps = get_warp_params(Lambda_IR=3000.0)["epsilon"]
+    xs = np.concatenate(([0.0, 1.0e-13], np.linspace(1.0e-6, 60.0, 257)))
+
+    exact = _F_exact(nu, eps)
+    ironly = _F_ironly(nu)
+    np.testing.assert_array_equal(_F_exact_vec(nu, eps)(xs), [exact(x) for x in xs])
+    np.testing.assert_array_equal(_F_ironly_vec(nu)(xs), [ironly(x) for x in xs])
+
+
+@pytest.mark.parametrize("exact", [True, False])
+def test_solve_kk_batch_matches_per_field_calls(exact):
+    """Batched fields share the first Bessel scan but return solve_kk's towers."""
+    geometry = get_warp_params(Lambda_IR=3000.0)
+    c_values = [0.58, 0.27, -0.75, 0.75]
+    batch = solve_kk_batch("fermion", ["++", "--", "++", "++"], geometry, c=c_values,
+                           n_roots=4, exact=exact)
+
+    assert len(batch) == len(c_values)
+    for (masses, extras), bc, c in zip(batch, ["++", "--", "++", "++"], c_values):
+        ref_masses, ref_extras = solve_kk("fermion", bc, geometry, c=c, n_roots=4, exact=exact)
+        np.testing.assert_array_equal(masses, ref_masses)
+        np.testing.assert_array_equal(extras["x"], ref_extras["x"])
+        np.testing.assert_array_equal(extras["b"], ref_extras["b"])
+        assert extras["nu"] == ref_extras["nu"]
+        assert extras["labels"] == ref_extras["labels"]
+
+    with pytest.raises(ValueError, match="bc has 2 entries"):
+        solve_kk_batch("fermion", ["++", "--"], geometry, c=c_values)
+
+
+@pytest.mark.skipif(bessel._find_root is None, reason="needs scipy.optimize.elementwise")
+def test_long_tower_vectorized_roots_match_brentq(monkeypatch):
+    """Towers long enough for the array solver agree with per-bracket brentq."""
+    geometry = get_warp_params(Lambda_IR=3000.0)
+    n_roots = 2 * bessel._VECTOR_ROOT_MIN_BRACKETS
+    kwargs = dict(n_roots=n_roots, exact=True, x_max=(n_roots + 2) * np.pi)
+
+    bessel._TOWER_CACHE.clear()
+    _, vectorized = solve_kk("gauge", "NN", geometry, **kwargs)
+    monkeypatch.setattr(bessel, "_VECTOR_ROOT_MIN_BRACKETS", n_roots + 1)
+    bessel._TOWER_CACHE.clear()
+    _, scalar = solve_kk("gauge", "NN", geometry, **kwargs)
+
+    assert len(vectorized["x"]) == n_roots
+    np.testing.assert_allclose(vectorized["x"], scalar["x"], rtol=1e-11)
+    np.testing.assert_allclose(vectorized["b"], scalar["b"], rtol=1e-8)
+
+
+def test_solve_kk_batch_shares_towers_of_equal_order_without_aliasing():
+    """Gauge NN and fermion ++ at c = 1/2 both use nu = 0 and share one solve."""
+    geometry = get_warp_params(Lambda_IR=3000.0)
+    (m_gauge, gauge), (m_fermion, fermion) = solve_kk_batch(
+        ["gauge", "fermion"], ["NN", "++"], geometry, c=[None, 0.5], n_roots=3
+    )
+
+    np.testing.assert_array_equal(gauge["x"], fermion["x"])
+    np.testing.assert_array_equal(m_gauge, m_fermion)
+    assert gauge["labels"]["species"] == "gauge"
+    assert fermion["labels"]["nu_label"].startswith("nu=alpha-1")
+    assert not np.shares_memory(gauge["x"], fermion["x"])
+
+
+def test_solve_kk_reuses_dimensionless_tower_at_equal_epsilon():
+    bessel._TOWER_CACHE.clear()
+    low = get_warp_params(Lambda_IR=3000.0)
+    high = get_warp_params(k=2.0 * low["k"], Lambda_IR=6000.0)
+    assert low["epsilon"] == high["epsilon"]
+    m_low, low_extras = solve_kk("fermion", "++", low, c=0.61, n_roots=3)
+    m_high, high_extras = solve_kk("fermion", "++", high, c=0.61, n_roots=3)
+
+    np.testing.assert_array_equal(low_extras["x"], high_extras["x"])
+    np.testing.assert_array_equal(m_high, high_extras["x"] * high["Lambda_IR"])
+    assert len(bessel._TOWER_CACHE) == 1
+
+    low_extras["x"][0] = 0.0
+    _, again = solve_kk("fermion", "++", low, c=0.61, n_roots=3)
+    assert again["x"][0] == high_extras["x"][0]
+
+
+def test_cached_tower_replays_solver_warnings():
+    bessel._TOWER_CACHE.clear()
+    geometry = get_warp_params(Lambda_IR=3000.0)
+    for _ in range(2):
+        with pytest.warns(UserWarning, match="sign-change brackets"):
+            masses, _ = solve_kk("gauge", "NN", geometry, n_roots=5, x_max=8.0)
+        assert len(masses) < 5
+
+
+def test_auto_ir_only_applies_only_when_uv_term_is_below_tol():
+    geometry = get_warp_params(Lambda_IR=3000.0)
+
+    _, gauge = solve_kk("gauge", "NN", geometry, n_roots=3, auto_ir_only=True)
+    assert gauge["labels"]["equation"] == "exact"
+    assert gauge["labels"]["ir_only_substituted"] is False
+
+    _, auto = solve_kk("fermion", "--", geometry, c=1.1, n_roots=4, auto_ir_only=True)
+    _, exact = solve_kk("fermion", "--", geometry, c=1.1, n_roots=4)
+    assert auto["labels"]["equation"] == "ir_only"
+    assert exact["labels"]["equation"] == "exact"
+    np.testing.assert_allclose(auto["x"], exact["x"], rtol=0, atol=1e-11)
+
+
+def test_solver_labels_record_the_equation_actually_solved():
+    """exact=True keeps the exact equation unless auto_ir_only is opted into."""
+    geometry = get_warp_params(Lambda_IR=3000.0)
+    bcs = ["--", "++"]
+    for auto_ir_only in (False, True):
+        labels = [
+            solve_kk("fermion", bc, geometry, c=0.6, n_roots=3,
+                     auto_ir_only=auto_ir_only)[1]["labels"]
+            for bc in bcs
+        ]
+        batch = solve_kk_batch("fermion", bcs, geometry, c=0.6, n_roots=3,
+                               auto_ir_only=auto_ir_only)
+        assert [extras["labels"] for _, extras in batch] == labels
+        substituted = [auto_ir_only, False]
+        assert [lab["ir_only_substituted"] for lab in labels] == substituted
+        assert [lab["exact"] for lab in labels] == [not flag for flag in substituted]
+        assert [lab["equation"] for lab in labels] == [
+            "ir_only" if flag else "exact" for flag in substituted
+        ]
+
+    _, ir_only = solve_kk("fermion", "--", geometry, c=1.1, n_roots=3, exact=False,
+                          auto_ir_only=True)
+    assert ir_only["labels"]["exact"] is False
+    assert ir_only["labels"]["ir_only_substituted"] is False
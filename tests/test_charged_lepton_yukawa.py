@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from yukawa.charged_lepton import compute_charged_lepton_yukawas
+from yukawa.constants import LEPTON_MASSES
+
+
+def test_compute_charged_lepton_yukawas_matches_eq5_inversion():
+    """The float fast path reproduces the array form of the Eq. (5) inversion."""
+    f_L = 0.015976144656324655
+    f_E = np.array([1.2e-3, 0.021, 0.14])
+    v = 174.0
+    k = 1.2209e19
+
+    result = compute_charged_lepton_yukawas(f_L=f_L, f_E=f_E, k=k, v=v)
+
+    expected_y_bar = np.asarray(LEPTON_MASSES) / (v * f_L * f_E)
+    assert np.array_equal(result["Y_E_bar"], expected_y_bar)
+    assert np.array_equal(result["Y_E"], expected_y_bar * (0.5 / k))
+    np.testing.assert_allclose(
+        result["Y_E"], np.asarray(LEPTON_MASSES) / (2.0 * v * k * f_L * f_E), rtol=1e-15
+    )
+    assert result["Y_E"].shape == (3,)
+
+
+@pytest.mark.parametrize(
+    ("f_L", "f_E", "expected_msg"),
+    [
+        (0.0, [0.1, 0.1, 0.1], "f_L must be positive"),
+        (0.1, [0.1, -0.1, 0.1], "All f_E values must be positive"),
+        (0.1, [[0.1, 0.1, 0.1]], "f_E must have shape"),
+    ],
+)
+def test_compute_charged_lepton_yukawas_rejects_bad_overlaps(f_L, f_E, expected_msg):
+    with pytest.raises(ValueError, match=expected_msg):
+        compute_charged_lepton_yukawas(f_L=f_L, f_E=f_E, k=1.0e19)
+
+
+@pytest.mark.parametrize("lepton_masses", [(1.0e-3, 0.1), (1.0e-3, 0.1, 1.7, 2.0)])
+def test_compute_charged_lepton_yukawas_rejects_wrong_mass_count(lepton_masses):
+    with pytest.raises(ValueError, match="lepton_masses must have 3 entries"):
+        compute_charged_lepton_yukawas(
+            f_L=0.02, f_E=[1.2e-3, 0.021, 0.14], k=1.0e19, lepton_masses=lepton_masses
+        )
+
+
+def test_compute_charged_lepton_yukawas_returns_fresh_mass_arrays():
+    f_E = np.array([1.2e-3, 0.021, 0.14])
+    first = compute_charged_lepton_yukawas(f_L=0.02, f_E=f_E, k=1.0e19)
+    first["masses_GeV"][0] = -1.0
+    second = compute_charged_lepton_yukawas(f_L=0.02, f_E=f_E, k=1.0e19)
+    assert np.array_equal(second["masses_GeV"], np.asarray(LEPTON_MASSES))
+
+    custom = compute_charged_lepton_yukawas(
+        f_L=0.02, f_E=[1.2e-3, 0.021, 0.14], k=1.0e19, lepton_masses=(1.0, 2.0, 3.0)
+    )
+    assert np.array_equal(custom["masses_GeV"], [1.0, 2.0, 3.0])
+    assert np.array_equal(custom["Y_E_bar"], np.array([1.0, 2.0, 3.0]) / (174.0 * 0.02 * f_E))
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from diagonalization.diag import Takagi, _sqrtm_via_eig
+
+
+def _random_unitary(rng, n=3):
+    q, _ = np.linalg.qr(rng.normal(size=(n, n)) + 1j * rng.normal(size=(n, n)))
+    return q
+
+
+@pytest.mark.parametrize("gap", [1e-2, 1e-5, 1e-7, 1e-9, 0.0])
+def test_takagi_complex_path_stays_accurate_near_degeneracy(gap):
+    """Nearly degenerate pairs fall back to sqrtm when the phase fix misses tol."""
+    rng = np.random.default_rng(5)
+    for _ in range(10):
+        W = _random_unitary(rng)
+        A = W @ np.diag([1.0, 1.0 - gap, 0.3]) @ W.T
+        r, U = Takagi(A)
+        np.testing.assert_allclose(r, [1.0, 1.0 - gap, 0.3], rtol=0, atol=1e-12)
+        assert np.max(np.abs((U * r) @ U.T - A)) < 1e-12
+        assert np.max(np.abs(U.conj().T @ U - np.eye(3))) < 1e-12
+
+
+@pytest.mark.parametrize("is_real", [True, False])
+@pytest.mark.parametrize("svd_order", [True, False])
+def test_takagi_only_values_matches_full_decomposition(is_real, svd_order):
+    rng = np.random.default_rng(7)
+    for _ in range(10):
+        B = rng.normal(size=(3, 3))
+        if not is_real:
+            B = B + 1j * rng.normal(size=(3, 3))
+        A = B + B.T
+        r_full, U = Takagi(A, svd_order=svd_order)
+        r, no_vectors = Takagi(A, svd_order=svd_order, only_values=True)
+        assert no_vectors is None
+        assert U is not None
+        np.testing.assert_allclose(r, r_full, rtol=1e-12, atol=1e-14)
+
+    r, no_vectors = Takagi(np.zeros((3, 3)), only_values=True)
+    assert no_vectors is None
+    assert np.array_equal(r, np.zeros(3))
+
+
+def test_takagi_check_symmetric_false_skips_the_symmetry_raise():
+    rng = np.random.default_rng(9)
+    B = rng.normal(size=(3, 3)) + 1j * rng.normal(size=(3, 3))
+    A = B + B.T
+    r, U = Takagi(A)
+    r_unchecked, U_unchecked = Takagi(A, check_symmetric=False)
+    assert np.array_equal(r_unchecked, r)
+    assert np.array_equal(U_unchecked, U)
+
+    skewed = A + 1e-6 * rng.normal(size=(3, 3))
+    with pytest.raises(ValueError, match="not \\(numerically\\) symmetric"):
+        Takagi(skewed)
+    r_skewed, _ = Takagi(skewed, check_symmetric=False, only_values=True)
+    np.testing.assert_allclose(r_skewed, np.linalg.svd(skewed, compute_uv=False))
+
+
+def _spy_linalg(monkeypatch):
+    """Record which numpy.linalg routines _sqrtm_via_eig calls."""
+    calls = []
+    for name in ("eigh", "eig", "solve"):
+        original = getattr(np.linalg, name)
+
+        def spy(*args, _original=original, _name=name, **kwargs):
+            calls.append(_name)
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(np.linalg, name, spy)
+    return calls
+
+
+def _check_sqrtm(S, M, rtol):
+    scipy_linalg = pytest.importorskip("scipy.linalg")
+    np.testing.assert_allclose(S, scipy_linalg.sqrtm(M), rtol=rtol, atol=rtol * np.abs(S).max())
+    np.testing.assert_allclose(S @ S, M, rtol=0, atol=rtol * np.abs(M).max())
+
+
+def test_sqrtm_via_eig_hermitian_psd_takes_the_eigh_branch(monkeypatch):
+    rng = np.random.default_rng(11)
+    B = rng.normal(size=(3, 3)) + 1j * rng.normal(size=(3, 3))
+    M = B @ B.conj().T
+    calls = _spy_linalg(monkeypatch)
+    S = _sqrtm_via_eig(M)
+    assert calls == ["eigh"]
+    np.testing.assert_allclose(S, S.conj().T, atol=1e-12)
+    _check_sqrtm(S, M, 1e-12)
+
+
+def test_sqrtm_via_eig_normal_matrix_uses_unitary_eigenvectors(monkeypatch):
+    """A complex symmetric unitary (the Takagi use) is normal but not Hermitian."""
+    rng = np.random.default_rng(12)
+    W = _random_unitary(rng)
+    Z = W @ np.diag(np.exp(1j * np.array([0.3, -1.2, 2.5]))) @ W.T
+    calls = _spy_linalg(monkeypatch)
+    S = _sqrtm_via_eig(Z)
+    assert calls == ["eig"]
+    _check_sqrtm(S, Z, 1e-12)
+
+
+@pytest.mark.parametrize("smallest", [0.5, 1e-6])
+def test_sqrtm_via_eig_non_normal_matrix_falls_back_to_solve(monkeypatch, smallest):
+    """Non-normal (and nearly singular) input needs V^{-1}, taken by a solve."""
+    M = np.array(
+        [[4.0, 1.0 + 0.5j, 0.3], [0.0, 1.0, 2.0j], [0.0, 0.0, smallest]], dtype=complex
+    )
+    calls = _spy_linalg(monkeypatch)
+    S = _sqrtm_via_eig(M)
+    assert calls == ["eig", "solve"]
+    _check_sqrtm(S, M, 1e-9)
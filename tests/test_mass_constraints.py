@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from neutrinos.massConstraints import (
+    find_allowed_lightest_masses,
+    find_allowed_lightest_masses_both,
+)
+from neutrinos.neutrinoValues import compute_masses
+
+
+def _loop_reference(max_sum, ordering, step, max_lightest):
+    """The original accumulating while-loop sweep."""
+    rows = []
+    m = 0.0
+    while m <= max_lightest:
+        m1, m2, m3, Mtot = compute_masses(m, ordering)
+        if Mtot >= max_sum:
+            break
+        rows.append((m1, m2, m3, Mtot))
+        m += step
+    return tuple(np.array(column, dtype=float) for column in zip(*rows)) or (np.empty(0),) * 4
+
+
+# max_lightest is kept off the step grid: at an exact multiple the loop's
+# accumulated m can overshoot it and drop the endpoint that the index-based
+# grid (k * step) keeps.
+CASES = [
+    (0.082, 1e-3, 10.0),
+    (0.12, 5e-4, 10.0),
+    (0.2, 1e-3, 0.0305),
+]
+
+
+@pytest.mark.parametrize("ordering", ["normal", "inverted"])
+@pytest.mark.parametrize("max_sum, step, max_lightest", CASES)
+def test_vectorized_sweep_matches_original_loop(ordering, max_sum, step, max_lightest):
+    # The loop accumulates m += step, so the grids agree only to rounding.
+    expected = _loop_reference(max_sum, ordering, step, max_lightest)
+    result = find_allowed_lightest_masses(max_sum, ordering, step, max_lightest)
+    assert [len(column) for column in result] == [len(column) for column in expected]
+    for got, want in zip(result, expected):
+        np.testing.assert_allclose(got, want, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("max_sum, step, max_lightest", CASES)
+def test_both_orderings_match_original_loop(max_sum, step, max_lightest):
+    both = find_allowed_lightest_masses_both(max_sum, step, max_lightest)
+    assert set(both) == {"normal", "inverted"}
+    for ordering, result in both.items():
+        expected = _loop_reference(max_sum, ordering, step, max_lightest)
+        assert [len(column) for column in result] == [len(column) for column in expected]
+        for got, want in zip(result, expected):
+            np.testing.assert_allclose(got, want, rtol=1e-12, atol=1e-15)
+
+
+def test_sweep_with_no_allowed_spectrum_is_empty():
+    # The inverted ordering needs at least ~0.1 eV in total.
+    m1, m2, m3, Mtot = find_allowed_lightest_masses(0.082, "inverted", step=1e-3)
+    assert Mtot.size == m1.size == m2.size == m3.size == 0
+    with pytest.raises(ValueError, match="step"):
+        find_allowed_lightest_masses(step=0.0)
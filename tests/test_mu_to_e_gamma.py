@@ -8,6 +8,7 @@ from flavorConstraints.muToEGamma import (
     PEREZ_RANDALL_LFV_XI_KK,
     assert_perez_randall_lfv_m_kk_convention,
     check_mu_to_e_gamma,
+    check_mu_to_e_gamma_batch,
     check_mu_to_e_gamma_raw,
     coefficient_from_br_limit,
     default_m_kk_from_lambda_ir,
@@ -85,6 +86,53 @@ def test_m_kk_override_changes_lfv_rhs_scaling():
     assert np.isclose(override["lhs"], no_override["lhs"])
 
 
+def test_off_diagonal_fast_path_matches_full_product():
+    """full_product=False should reproduce the (1,2) element without the matrix."""
+    result = compute_all_yukawas(
+        Lambda_IR=3000.0,
+        c_L=0.58,
+        c_E=[0.75, 0.60, 0.50],
+        c_N=0.27,
+        M_N=1.22e18,
+        lightest_nu_mass=0.002,
+        ordering="normal",
+    )
+    U = _pmns_from_sin2()
+
+    full = check_mu_to_e_gamma(result, C=C_PAPER)
+    fast = check_mu_to_e_gamma(result, C=C_PAPER, full_product=False)
+    assert fast["product_matrix"] is None
+    assert fast["off_diagonal_12"] == pytest.approx(full["off_diagonal_12"])
+    assert fast["passes"] == full["passes"]
+
+    full_raw = check_mu_to_e_gamma_raw(result.Y_N_bar, U, M_KK=3000.0)
+    fast_raw = check_mu_to_e_gamma_raw(result.Y_N_bar, U, M_KK=3000.0, full_product=False)
+    assert fast_raw["product_matrix"] is None
+    assert fast_raw["off_diagonal_12"] == pytest.approx(full_raw["off_diagonal_12"])
+    assert fast_raw["lhs"] == pytest.approx(full_raw["lhs"])
+
+
+def test_batch_check_matches_pointwise_raw_check():
+    U = _pmns_from_sin2()
+    y_batch = np.array(
+        [
+            [0.04, 0.06, 0.14],
+            [0.20416916, 0.43091265, 1.02237364],
+            [0.5, 0.5, 0.5],
+        ]
+    )
+    m_kk = np.array([3000.0, 3000.0, 6000.0])
+
+    batch = check_mu_to_e_gamma_batch(y_batch, U, m_kk, C=C_PAPER)
+    for i in range(len(y_batch)):
+        single = check_mu_to_e_gamma_raw(y_batch[i], U, M_KK=m_kk[i], C=C_PAPER)
+        assert batch["off_diagonal_12"][i] == pytest.approx(single["off_diagonal_12"])
+        assert batch["lhs"][i] == pytest.approx(single["lhs"])
+        assert batch["rhs"][i] == pytest.approx(single["rhs"])
+        assert batch["ratio"][i] == pytest.approx(single["ratio"])
+        assert bool(batch["passes"][i]) == bool(single["passes"])
+
+
 def test_default_lfv_check_uses_internal_lambda_ir_convention():
     """Default LFV check should not silently switch to the gauge KK root."""
     result = compute_all_yukawas(
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from neutrinos import neutrinoValues as nv
+from neutrinos.neutrinoValues import (
+    compute_masses,
+    delta_m3l_sq_inverted,
+    delta_m3l_sq_normal,
+    delta_m21_sq,
+)
+
+
+def _uncached_masses(lightest, ordering):
+    if ordering == "normal":
+        m1 = lightest
+        m2 = np.sqrt(m1 * m1 + delta_m21_sq)
+        m3 = np.sqrt(m1 * m1 + delta_m3l_sq_normal)
+    else:
+        m3 = lightest
+        m2_sq = m3 * m3 + abs(delta_m3l_sq_inverted)
+        m2 = np.sqrt(m2_sq)
+        m1 = np.sqrt(m2_sq - delta_m21_sq)
+    return float(m1), float(m2), float(m3)
+
+
+@pytest.mark.parametrize("ordering", ["normal", "inverted", " Inverted "])
+def test_compute_masses_accepts_numpy_inputs(ordering):
+    """numpy scalars and 0-d arrays normalize to the plain-float result."""
+    for lightest in (0.0, 0.002, 0.05):
+        expected = compute_masses(lightest, ordering)
+        for value in (np.float64(lightest), np.float32(lightest), np.array(lightest)):
+            result = compute_masses(value, ordering)
+            assert result == pytest.approx(expected, rel=1e-7 if value.dtype == np.float32 else 0)
+            assert all(type(x) is float for x in result)
+
+        m1, m2, m3 = _uncached_masses(lightest, ordering.strip().lower())
+        assert expected == (m1, m2, m3, m1 + m2 + m3)
+
+    with pytest.raises(ValueError, match="non-negative"):
+        compute_masses(np.array(-1e-3), ordering)
+    with pytest.raises(ValueError, match="ordering"):
+        compute_masses(np.float64(0.01), "flat")
+
+
+def _pdg_pmns(theta12, theta23, theta13, delta_cp, alpha=0.0, beta=0.0):
+    """Uncached PDG construction R23 . U13(delta) . R12 . diag(Majorana)."""
+    s12, c12 = np.sin(theta12), np.cos(theta12)
+    s23, c23 = np.sin(theta23), np.cos(theta23)
+    s13, c13 = np.sin(theta13), np.cos(theta13)
+    r23 = np.array([[1, 0, 0], [0, c23, s23], [0, -s23, c23]], dtype=complex)
+    u13 = np.array(
+        [
+            [c13, 0, s13 * np.exp(-1j * delta_cp)],
+            [0, 1, 0],
+            [-s13 * np.exp(1j * delta_cp), 0, c13],
+        ]
+    )
+    r12 = np.array([[c12, s12, 0], [-s12, c12, 0], [0, 0, 1]], dtype=complex)
+    majorana = np.diag([1.0, np.exp(1j * alpha / 2), np.exp(1j * beta / 2)])
+    return r23 @ u13 @ r12 @ majorana
+
+
+@pytest.mark.parametrize("ordering", ["normal", "inverted"])
+@pytest.mark.parametrize("phases", [(0.0, 0.0), (0.7, -2.1)])
+def test_cached_pmns_is_unitary_and_matches_uncached_construction(ordering, phases):
+    angles = {
+        "normal": (nv.theta12, nv.theta23_normal, nv.theta13_normal, nv.delta_CP_normal),
+        "inverted": (nv.theta12, nv.theta23_inverted, nv.theta13_inverted, nv.delta_CP_inverted),
+    }[ordering]
+    U = nv.get_pmns(ordering, *phases)
+    np.testing.assert_allclose(U.conj().T @ U, np.eye(3), atol=1e-14)
+    np.testing.assert_allclose(U, _pdg_pmns(*angles, *phases), rtol=0, atol=1e-15)
+    assert np.array_equal(U, nv.pmns_matrix.__wrapped__(*angles, *phases))
+    assert nv.get_pmns(ordering, *phases) is U
+
+
+def test_cached_pmns_arrays_are_read_only():
+    """Cached PMNS arrays are shared, so in-place writes must fail loudly."""
+    assert nv.PMNS_NORMAL is nv.get_pmns("normal")
+    assert nv.PMNS_INVERTED is nv.get_pmns("inverted")
+    for U in (nv.PMNS_NORMAL, nv.PMNS_INVERTED, nv.get_pmns("normal", 0.3, 0.1)):
+        assert not U.flags.writeable
+        with pytest.raises(ValueError, match="read-only"):
+            U[0, 0] = 0.0
+        with pytest.raises(ValueError, match="read-only"):
+            U *= 2.0
+    copy = nv.PMNS_NORMAL.copy()
+    copy[0, 0] = 0.0
+    assert nv.PMNS_NORMAL[0, 0] != 0.0
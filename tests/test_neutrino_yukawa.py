@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from yukawa.neutrino import compute_neutrino_yukawas
 
@@ -30,3 +31,200 @@ def test_compute_neutrino_yukawas_matches_eq6_scalar_inversion():
 
     assert np.allclose(result["Y_N"], expected_y, rtol=1e-12, atol=0.0)
     assert np.allclose(result["Y_N_bar"], expected_y_bar, rtol=1e-12, atol=0.0)
+
+
+def test_compute_neutrino_yukawas_broadcasts_over_parameter_grids():
+    """Array inputs give one (3,) row per grid point, equal to the scalar calls."""
+    f_L = np.array([0.012, 0.016, 0.021])[:, None]
+    f_N = np.array([0.41, 0.48])
+    M_N = np.array([1.0e17, 1.22e18])
+    masses_eV = np.array([0.002, 0.009, 0.05])
+    k = 1.2209e19
+
+    grid = compute_neutrino_yukawas(f_L, f_N, 1.2e-4, M_N, masses_eV, k)
+
+    assert grid["Y_N_bar"].shape == (3, 2, 3)
+    for i, j in np.ndindex(3, 2):
+        point = compute_neutrino_yukawas(
+            float(f_L[i, 0]), float(f_N[j]), 1.2e-4, float(M_N[j]), masses_eV, k
+        )
+        assert np.array_equal(grid["Y_N_bar"][i, j], point["Y_N_bar"])
+        assert np.array_equal(grid["Y_N"][i, j], point["Y_N"])
+
+    per_point_masses = np.tile(masses_eV, (2, 1))
+    rows = compute_neutrino_yukawas(0.016, f_N, 1.2e-4, M_N, per_point_masses, k)
+    assert np.array_equal(rows["Y_N_bar"], grid["Y_N_bar"][1])
+
+    with pytest.raises(ValueError, match="f_N must be positive"):
+        compute_neutrino_yukawas(f_L, np.array([0.41, 0.0]), 1.2e-4, M_N, masses_eV, k)
+    with pytest.raises(ValueError, match="shape"):
+        compute_neutrino_yukawas(f_L, f_N, 1.2e-4, M_N, masses_eV[:2], k)
+
+
+def test_mass_spectrum_scan_at_fixed_geometry_matches_point_calls():
+    from neutrinos.neutrinoValues import compute_masses
+
+    spectra = np.array([compute_masses(m, "normal")[:3] for m in (0.0, 0.002, 0.01, 0.05)])
+    args = (0.016, 0.48, 1.2e-4, 1.22e18)
+
+    rows = compute_neutrino_yukawas(*args, spectra, 1.2209e19)
+
+    assert rows.Y_N_bar.shape == (4, 3)
+    for spectrum, Y_N_bar in zip(spectra, rows.Y_N_bar):
+        point = compute_neutrino_yukawas(*args, tuple(spectrum), 1.2209e19)
+        assert np.array_equal(Y_N_bar, point.Y_N_bar)
+
+
+def test_grid_results_filter_perturbativity_per_point():
+    f_L = np.array([1.0e-3, 0.016, 0.02, 0.5])
+    f_N = np.full(4, 0.48)
+    M_N = np.array([1.22e18, 1.22e18, 1.0e10, 1.22e18])
+    masses_eV = (0.002, 0.009, 0.05)
+
+    grid = compute_neutrino_yukawas(f_L, f_N, 1.2e-4, M_N, masses_eV, 1.2209e19)
+
+    assert grid.Y_N_bar.shape == (4, 3)
+    assert grid.Y_N_bar.flags.c_contiguous
+    mask = grid.is_perturbative()
+    expected = [
+        bool(compute_neutrino_yukawas(float(a), 0.48, 1.2e-4, float(m), masses_eV, 1.2209e19)
+             .is_perturbative())
+        for a, m in zip(f_L, M_N)
+    ]
+    assert mask.tolist() == expected
+    assert expected.count(False) == 1
+    assert not grid.is_perturbative(max_Y_bar=1e-12).any()
+
+
+def test_unchecked_seesaw_inversion_matches_validated_function():
+    from yukawa import compute_neutrino_yukawas_unchecked
+
+    masses_eV = (0.0, 0.0086, 0.0503)
+    args = (0.015976144656324655, 0.4795831681596669, 0.00012321551579024553, 1.22e18)
+
+    checked = compute_neutrino_yukawas(*args, masses_eV, 1.2209e19)
+    unchecked = compute_neutrino_yukawas_unchecked(*args, masses_eV, 1.2209e19)
+
+    for key in checked._fields:
+        assert np.array_equal(checked[key], unchecked[key]), key
+
+
+def test_neutrino_yukawas_result_keeps_dict_style_access():
+    import pickle
+
+    result = compute_neutrino_yukawas(0.016, 0.48, 1.2e-4, 1.22e18, (0.002, 0.009, 0.05), 1.2e19)
+
+    assert result["Y_N_bar"] is result.Y_N_bar
+    assert "Y_N" in result and "Y_E" not in result
+    assert list(result) == list(result.keys()) == ["Y_N", "Y_N_bar", "masses_eV"]
+    assert len(result) == 3
+    assert result.get("masses_eV") is result.masses_eV
+    assert result.get("Y_E", "missing") == "missing"
+    assert dict(result) == result.asdict()
+    assert all(value is result[key] for key, value in result.items())
+    assert np.array_equal(result["masses_eV"], [0.002, 0.009, 0.05])
+    with pytest.raises(KeyError):
+        result["Y_E"]
+    with pytest.raises(KeyError):
+        result[0]
+    restored = pickle.loads(pickle.dumps(result))
+    assert np.array_equal(restored.Y_N_bar, result.Y_N_bar)
+
+
+def test_yukawa_matrix_is_pmns_times_diagonal_eigenvalues():
+    """The column-scaled Y_N matrix equals V_PMNS @ diag(Y_N) exactly."""
+    from neutrinos.neutrinoValues import get_pmns
+    from yukawa import compute_all_yukawas
+
+    result = compute_all_yukawas(
+        Lambda_IR=3000.0,
+        c_L=0.58,
+        c_E=[0.75, 0.60, 0.50],
+        c_N=0.27,
+        M_N=1.22e18,
+        lightest_nu_mass=0.002,
+        majorana_alpha=0.4,
+        majorana_beta=1.1,
+    )
+
+    expected = get_pmns("normal", 0.4, 1.1) @ np.diag(result.Y_N)
+    assert np.array_equal(result.Y_N_matrix, expected)
+
+
+def test_batch_result_rows_match_scalar_yukawa_results():
+    from yukawa import compute_all_yukawas, compute_all_yukawas_batch
+
+    c_L = np.array([0.52, 0.58])
+    c_E = np.array([[0.75, 0.60, 0.50], [0.70, 0.62, 0.55]])
+    batch = compute_all_yukawas_batch(3000.0, c_L, c_E, 0.27, 1.22e18, 0.002)
+
+    assert len(batch) == 2
+    for i in range(2):
+        row = batch.result(i)
+        scalar = compute_all_yukawas(3000.0, c_L[i], c_E[i], 0.27, 1.22e18, 0.002)
+        np.testing.assert_allclose(row.Y_E_bar, scalar.Y_E_bar, rtol=1e-12)
+        np.testing.assert_allclose(row.Y_N_matrix, scalar.Y_N_matrix, rtol=1e-12)
+        assert row.f_L == pytest.approx(scalar.f_L, rel=1e-12)
+        assert row.params["c_E"] == scalar.params["c_E"]
+
+
+def test_yukawa_result_params_read_like_a_dict():
+    import pickle
+
+    from yukawa import compute_all_yukawas
+
+    result = compute_all_yukawas(3000.0, 0.58, [0.75, 0.60, 0.50], 0.27, 1.22e18, 0.002)
+    params = result.params
+
+    assert list(params) == [
+        "Lambda_IR", "c_L", "c_E", "c_N", "M_N", "lightest_nu_mass",
+        "ordering", "majorana_alpha", "majorana_beta", "k", "v",
+    ]
+    assert params["c_E"] == [0.75, 0.60, 0.50]
+    assert params.get("M_KK", "missing") == "missing"
+    assert dict(params)["Lambda_IR"] == 3000.0
+    assert params == dict(params)
+    assert pickle.loads(pickle.dumps(params)) == params
+    with pytest.raises(TypeError):
+        params["c_L"] = 0.6
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected_msg"),
+    [
+        ({"f_L": 0.0}, "f_L must be positive"),
+        ({"M_N": -1.0}, "M_N must be positive"),
+        ({"neutrino_masses_eV": (-0.001, 0.009, 0.05)}, "cannot be negative"),
+        ({"neutrino_masses_eV": np.array([[0.0, 0.009, -0.05]])}, "cannot be negative"),
+        ({"neutrino_masses_eV": (float("nan"), -0.009, 0.05)}, "cannot be negative"),
+        ({"neutrino_masses_eV": np.array([[np.nan, -0.009, 0.05]])}, "cannot be negative"),
+        ({"neutrino_masses_eV": (0.009, 0.05)}, "must have shape"),
+    ],
+)
+def test_compute_neutrino_yukawas_rejects_bad_inputs(kwargs, expected_msg):
+    base = dict(f_L=0.016, f_N=0.48, f_N_UV=1.2e-4, M_N=1.22e18,
+                neutrino_masses_eV=(0.002, 0.009, 0.05), k=1.2209e19)
+    with pytest.raises(ValueError, match=expected_msg):
+        compute_neutrino_yukawas(**{**base, **kwargs})
+
+
+def test_compute_neutrino_yukawas_over_a_c_grid_matches_full_pipeline():
+    """Overlap arrays from a (c_L, c_N) grid feed straight into the seesaw inversion."""
+    from neutrinos.neutrinoValues import compute_masses
+    from warpConfig.baseParams import MPL, warp_epsilon
+    from warpConfig.wavefuncs import f_IR, f_UV
+    from yukawa import compute_all_yukawas
+
+    epsilon = warp_epsilon(MPL, 3000.0)
+    c_L = np.array([0.52, 0.58, 0.66])[:, None]
+    c_N = np.array([0.15, 0.27])
+    masses = compute_masses(0.002, "normal")[:3]
+
+    grid = compute_neutrino_yukawas(
+        f_IR(c_L, epsilon), f_IR(c_N, epsilon), f_UV(c_N, epsilon), 1.22e18, masses, MPL
+    )
+
+    assert grid["Y_N_bar"].shape == (3, 2, 3)
+    for i, j in np.ndindex(3, 2):
+        point = compute_all_yukawas(3000.0, c_L[i, 0], [0.75, 0.60, 0.50], c_N[j], 1.22e18, 0.002)
+        np.testing.assert_allclose(grid["Y_N_bar"][i, j], point.Y_N_bar, rtol=1e-14)
@@ -1,11 +1,23 @@
 """Tests for scan post-processing/reclassification."""
 
 import numpy as np
+import pytest
 
-from scanParams import AnarchyConfig, ReclassifyConfig, ScanConfig, classify_row, run_scan
+from scanParams import (
+    AnarchyConfig,
+    ClassifyColumns,
+    ReclassifyConfig,
+    ScanConfig,
+    classify_columns,
+    classify_row,
+    classify_rows_batch,
+    run_scan,
+)
 
 
-def _benchmark_row():
+@pytest.fixture(scope="module")
+def benchmark_row():
+    """The 1-point benchmark scan row, evaluated once for the whole module."""
     config = ScanConfig(
         record_git_metadata=False,
         Lambda_IR_values=np.array([3000.0]),
@@ -19,8 +31,8 @@ def _benchmark_row():
     return run_scan(config, progress_every=0)[0]
 
 
-def test_classify_row_reproduces_default_core_flags():
-    row = _benchmark_row()
+def test_classify_row_reproduces_default_core_flags(benchmark_row):
+    row = benchmark_row
     rec = classify_row(row, ReclassifyConfig())
 
     assert rec["reclass_perturbative"] == row["perturbative"]
@@ -28,8 +40,8 @@ def test_classify_row_reproduces_default_core_flags():
     assert rec["reclass_lfv_passes"] == row["lfv_passes"]
 
 
-def test_classify_row_accepts_csv_style_string_values():
-    row = _benchmark_row()
+def test_classify_row_accepts_csv_style_string_values(benchmark_row):
+    row = benchmark_row
     row_as_strings = {k: str(v) for k, v in row.items()}
     rec = classify_row(row_as_strings, ReclassifyConfig())
 
@@ -38,8 +50,8 @@ def test_classify_row_accepts_csv_style_string_values():
     assert isinstance(rec["reclass_lfv_passes"], bool)
 
 
-def test_reclassify_allows_posthoc_anarchy_threshold_changes():
-    row = _benchmark_row()
+def test_reclassify_allows_posthoc_anarchy_threshold_changes(benchmark_row):
+    row = benchmark_row
     base_kwargs = dict(
         max_Y_bar=10.0,
         naturalness_range=(1e-6, 10.0),
@@ -53,3 +65,59 @@ def test_reclassify_allows_posthoc_anarchy_threshold_changes():
     assert rec_loose["reclass_passes_all"]
     assert not rec_tight["reclass_passes_all"]
     assert "anarchy_score" in rec_tight["reclass_reject_reason"]
+
+
+def test_classify_rows_batch_matches_classify_row(benchmark_row):
+    row = benchmark_row
+    failing = dict(row, Y_E_bar_1=7.5, lfv_ratio=2.0)
+    csv_rows = [{k: str(v) for k, v in r.items()} for r in (row, failing)]
+    config = ReclassifyConfig(anarchy=AnarchyConfig(), anarchy_min_score=-1.0)
+
+    columns = {k: [r[k] for r in csv_rows] for k in csv_rows[0]}
+    batch = classify_rows_batch(columns, config)
+
+    for i, r in enumerate(csv_rows):
+        rec = classify_row(r, config)
+        for key, value in rec.items():
+            if isinstance(value, str):
+                assert batch[key][i] == value
+            else:
+                assert np.isclose(batch[key][i], value, rtol=1e-9, equal_nan=True)
+
+
+def test_classify_rows_batch_handles_empty_cells_and_mixed_pmns_metadata(benchmark_row):
+    row = benchmark_row
+    inverted = dict(row, ordering="inverted", majorana_alpha=0.3, lfv_ratio="")
+    csv_rows = [{k: str(v) for k, v in r.items()} for r in (row, inverted, row)]
+    config = ReclassifyConfig(anarchy=AnarchyConfig(), anarchy_min_score=-1.0)
+
+    columns = {k: [r[k] for r in csv_rows] for k in csv_rows[0]}
+    batch = classify_rows_batch(columns, config)
+
+    for i, r in enumerate(csv_rows):
+        rec = classify_row(r, config)
+        assert batch["reclass_lfv_passes"][i] == rec["reclass_lfv_passes"]
+        assert np.isclose(batch["reclass_anarchy_score"][i], rec["reclass_anarchy_score"])
+    assert batch["reclass_anarchy_score"][0] == batch["reclass_anarchy_score"][2]
+
+    columns["Y_E_bar_2"] = ["0.1", "oops", "0.2"]
+    with pytest.raises(ValueError, match="Y_E_bar_2='oops'"):
+        classify_rows_batch(columns, config)
+
+
+def test_parsed_classify_columns_can_be_reclassified_under_new_cuts(benchmark_row):
+    row = benchmark_row
+    csv_rows = [{k: str(v) for k, v in r.items()} for r in (row, dict(row, lfv_ratio=""))]
+    columns = {k: [r[k] for r in csv_rows] for k in csv_rows[0]}
+    loose = ReclassifyConfig(anarchy=AnarchyConfig(), anarchy_min_score=-100.0)
+    tight = ReclassifyConfig(anarchy=AnarchyConfig(), anarchy_min_score=0.0)
+
+    cols = ClassifyColumns.from_columns(columns, loose)
+    assert cols.y_bar.shape == (2, 6)
+    assert cols.lfv_rhs[0] == 1.0
+
+    for config in (loose, tight):
+        batch = classify_rows_batch(columns, config)
+        parsed = classify_columns(cols, config)
+        for key, value in batch.items():
+            np.testing.assert_array_equal(parsed[key], value)
@@ -0,0 +1,150 @@
+"""Output-format and CSV-engine agreement for ``scripts/reclassify_scan.py``."""
+from __future__ import annotations
+
+import csv
+import importlib.util
+import math
+import sys
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from scanParams import ScanConfig, perturbativity_prefilter, run_scan
+
+REPO = Path(__file__).resolve().parents[1]
+SCRIPT_PATH = REPO / "scripts" / "reclassify_scan.py"
+
+
+@pytest.fixture(scope="module")
+def reclass_module():
+    name = "_test_reclassify_scan_module"
+    spec = importlib.util.spec_from_file_location(name, SCRIPT_PATH)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="module")
+def scan_csv(tmp_path_factory):
+    """A small scan CSV with prefiltered (short-circuited) rows and NaN cells."""
+    config = ScanConfig(
+        record_git_metadata=False,
+        Lambda_IR_values=np.array([3000.0]),
+        c_L_values=np.array([0.52, 0.58, 0.66]),
+        c_N_values=np.array([0.15, 0.27, 0.45]),
+        c_E_fixed=[0.75, 0.60, 0.50],
+        MN_mode="fixed_ratio",
+        MN_over_k=1.22e18 / 1.2209e19,
+        lightest_nu_mass_values=np.array([0.0, 0.002]),
+        prefilter_fn=partial(perturbativity_prefilter, margin=2.0),
+    )
+    path = tmp_path_factory.mktemp("reclass") / "scan.csv"
+    rows = run_scan(config, output_csv=str(path), progress_every=0)
+    assert any(row["reject_reason"].startswith("prefilter") for row in rows)
+    assert any(not row["reject_reason"].startswith("prefilter") for row in rows)
+    return path
+
+
+def _run(reclass_module, monkeypatch, input_csv, output, *extra):
+    argv = [
+        "reclassify_scan.py",
+        str(input_csv),
+        str(output),
+        "--chunk-size",
+        "5",
+        "--n-workers",
+        "1",
+        *extra,
+    ]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert reclass_module.main() == 0
+    return output
+
+
+def _read_csv(path):
+    with open(path, encoding="utf-8", newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+def test_reclassify_csv_engines_agree(reclass_module, scan_csv, tmp_path, monkeypatch, capsys):
+    """pyarrow's reader and the csv module give byte-identical CSV output."""
+    pytest.importorskip("pyarrow")
+    default = _run(reclass_module, monkeypatch, scan_csv, tmp_path / "default.csv")
+    assert "CSV engine: python" in capsys.readouterr().out
+    outputs = [
+        _run(reclass_module, monkeypatch, scan_csv, tmp_path / name, "--csv-engine", engine)
+        for name, engine in (("python.csv", "python"), ("pyarrow.csv", "pyarrow"))
+    ]
+    assert "CSV engine: pyarrow" in capsys.readouterr().out
+    assert outputs[0].read_bytes() == outputs[1].read_bytes() == default.read_bytes()
+
+    rows = _read_csv(outputs[0])
+    assert any(row["reject_reason"].startswith("prefilter") for row in rows)
+    assert any(row["Y_E_bar_1"] == "nan" for row in rows)
+    assert any(row["reclass_reject_reason"] == "perturbativity;naturalness" for row in rows)
+
+
+@pytest.mark.parametrize("engine", ["python", "pyarrow"])
+def test_reclassify_parquet_output_matches_csv(
+    reclass_module, scan_csv, tmp_path, monkeypatch, engine
+):
+    """Parquet keeps the CSV cells as text and types the reclass_* columns."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    csv_out = _run(
+        reclass_module, monkeypatch, scan_csv, tmp_path / "out.csv", "--csv-engine", engine
+    )
+    parquet_out = _run(
+        reclass_module,
+        monkeypatch,
+        scan_csv,
+        tmp_path / "out.parquet",
+        "--csv-engine",
+        engine,
+        "--output-format",
+        "parquet",
+    )
+    rows = _read_csv(csv_out)
+    stored_rows = pq.read_table(parquet_out).to_pylist()
+    assert len(stored_rows) == len(rows)
+    typed = reclass_module._RECLASS_COLUMNS
+    for row, stored in zip(rows, stored_rows):
+        assert list(stored) == list(row)
+        for field, text in row.items():
+            value = stored[field]
+            kind = typed.get(field, "string")
+            if kind == "float64":
+                expected = float(text)
+                assert value == expected or (math.isnan(value) and math.isnan(expected))
+            elif kind == "bool":
+                assert value is (text == "True")
+            else:
+                assert value == text
+
+
+def test_gc_is_paused_only_while_a_chunk_is_parsed(reclass_module, scan_csv, tmp_path, monkeypatch):
+    """The cyclic GC is off inside a chunk's parse and back on around the run."""
+    import gc
+
+    states = []
+    original = reclass_module.islice
+
+    def spy(*args):
+        states.append(gc.isenabled())
+        return original(*args)
+
+    monkeypatch.setattr(reclass_module, "islice", spy)
+    reader = iter([["1", "2"], ["3", "4"], ["5", "6"]])
+    for _ in reclass_module._iter_column_chunks(reader, ["a", "b"], 2):
+        assert gc.isenabled()
+    assert states == [False, False, False]
+
+    _run(reclass_module, monkeypatch, scan_csv, tmp_path / "out.csv")
+    assert gc.isenabled()
+    with pytest.raises(ValueError, match="fields"):
+        list(reclass_module._iter_column_chunks(iter([["1"]]), ["a", "b"], 2))
+    assert gc.isenabled()
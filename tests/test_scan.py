@@ -1,12 +1,23 @@
 """Tests for scanParams module."""
 
 import csv as csv_mod
+import warnings
+from dataclasses import replace
 
 import numpy as np
 import pytest
 
 from flavorConstraints import coefficient_from_br_limit
-from scanParams import AnarchyConfig, ScanConfig, run_scan
+from scanParams import (
+    AnarchyConfig,
+    ScanConfig,
+    iter_scan,
+    perturbativity_prefilter,
+    run_mcmc_scan,
+    run_scan,
+    screen_grid,
+    write_scan_columns,
+)
 from scanParams.scan import BR_LIMIT_MEGII_2025
 
 
@@ -75,6 +86,9 @@ def test_scan_csv_output(tmp_path):
     csv_path = str(tmp_path / "test_scan.csv")
     results = run_scan(config, output_csv=csv_path, progress_every=0)
     assert len(results) == 4  # 2 x 2 grid
+    batched_path = tmp_path / "batched.csv"
+    run_scan(replace(config, csv_chunksize=3), output_csv=str(batched_path), progress_every=0)
+    assert batched_path.read_bytes() == (tmp_path / "test_scan.csv").read_bytes()
 
     with open(csv_path, encoding="utf-8") as handle:
         reader = csv_mod.DictReader(handle)
@@ -98,6 +112,19 @@ def test_extra_filter():
     assert "custom_reject" in results[0]["reject_reason"]
 
 
+def test_reject_reason_lists_extra_filters_before_anarchy():
+    """Extra filter labels sit between the built-in LFV and anarchy reasons."""
+    config = _benchmark_config(anarchy=AnarchyConfig(), anarchy_min_score=1e9)
+
+    def always_reject(result):
+        return (False, "custom_reject")
+
+    row = run_scan(config, extra_filters=[always_reject], progress_every=0)[0]
+    assert row["reject_reason"] == (
+        "perturbativity;naturalness;mu_to_e_gamma;custom_reject;anarchy_score"
+    )
+
+
 @pytest.mark.parametrize(
     ("kwargs", "expected_msg"),
     [
@@ -110,6 +137,9 @@ def test_extra_filter():
         ({"MN_mode": "scan_ratio", "MN_over_k_values": None}, "MN_over_k_values must be provided"),
         ({"ordering": "inverted"}, "supports only ordering='normal'"),
         ({"max_fL_ratio": 1.0}, "max_fL_ratio must be > 1"),
+        ({"n_jobs": 0}, "n_jobs must be a positive integer or -1"),
+        ({"csv_chunksize": 0}, "csv_chunksize must be >= 1"),
+        ({"dtype": np.float16}, "dtype must be float32 or float64"),
     ],
 )
 def test_scan_config_validates_inputs(kwargs, expected_msg):
@@ -144,6 +174,8 @@ def test_scan_config_accepts_c_e_grid():
         ],
     )
     assert config.total_points == 2
+    assert config.c_E_points == [(0.70, 0.55, 0.45), (0.72, 0.55, 0.45)]
+    np.testing.assert_array_equal(config.c_E_matrix, np.array(config.c_E_points))
 
 
 def test_sorts_c_e_descending_for_fixed_point():
@@ -220,3 +252,579 @@ def test_anarchy_min_score_filter_rejects_low_score_points():
     row = run_scan(config, progress_every=0)[0]
     assert not row["passes_all"]
     assert "anarchy_score" in row["reject_reason"]
+
+
+def test_massless_lightest_neutrino_scores_minus_infinity():
+    """A zero column in Ybar_N is infinitely ill-conditioned, not an error."""
+    config = _benchmark_config(
+        anarchy=AnarchyConfig(), lightest_nu_mass_values=np.array([0.0])
+    )
+    row = run_scan(config, progress_every=0)[0]
+    assert row["anarchy_score"] == -np.inf
+
+
+def test_parallel_scan_matches_serial_rows():
+    """A worker-pool scan returns the serial rows in sample order."""
+    config = _benchmark_config(
+        c_L_values=np.array([0.55, 0.58, 0.62]),
+        c_N_values=np.array([0.25, 0.27]),
+        anarchy=AnarchyConfig(),
+    )
+    serial = run_scan(config, progress_every=0)
+    parallel = run_scan(replace(config, n_jobs=2), progress_every=0, chunksize=2)
+
+    assert [r["sample_index"] for r in parallel] == list(range(len(serial)))
+    for row_s, row_p in zip(serial, parallel):
+        assert row_s.keys() == row_p.keys()
+        for key, value in row_s.items():
+            if isinstance(value, float):
+                assert np.isclose(value, row_p[key], equal_nan=True)
+            else:
+                assert value == row_p[key]
+
+
+def test_n_workers_argument_is_deprecated_and_overrides_n_jobs(monkeypatch):
+    """ScanConfig.n_jobs is the worker knob; n_workers= warns and still wins."""
+    from scanParams import scan as scan_module
+
+    resolved = []
+    original = scan_module._iter_scan_values
+
+    def spy(config, extra_filters=None, n_workers=None, chunksize=None, skip=frozenset()):
+        resolved.append(n_workers)
+        return original(config, extra_filters, n_workers, chunksize, skip)
+
+    monkeypatch.setattr(scan_module, "_iter_scan_values", spy)
+    config = _benchmark_config(n_jobs=2)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        run_scan(config, progress_every=0)
+        list(iter_scan(config))
+    with pytest.warns(DeprecationWarning, match="set ScanConfig.n_jobs"):
+        run_scan(config, progress_every=0, n_workers=1)
+    with pytest.warns(DeprecationWarning, match="set ScanConfig.n_jobs"):
+        list(iter_scan(config, n_workers=1))
+    assert resolved == [2, 2, 1, 1]
+
+
+def test_iter_scan_yields_run_scan_rows_lazily():
+    """iter_scan streams the run_scan rows and can be abandoned midway."""
+    config = _benchmark_config(
+        c_L_values=np.array([0.55, 0.58, 0.62]),
+        c_N_values=np.array([0.25, 0.27]),
+        anarchy=AnarchyConfig(),
+    )
+    rows = run_scan(config, progress_every=0)
+    streamed = list(iter_scan(config))
+    assert [r["sample_index"] for r in streamed] == [r["sample_index"] for r in rows]
+    assert [r["reject_reason"] for r in streamed] == [r["reject_reason"] for r in rows]
+    assert [r["max_Y_bar"] for r in streamed] == [r["max_Y_bar"] for r in rows]
+
+    parallel = iter_scan(replace(config, n_jobs=2), chunksize=1)
+    first = next(parallel)
+    parallel.close()
+    assert first["sample_index"] == 0
+
+
+def test_scan_streams_csv_without_returning_rows(tmp_path):
+    """return_rows=False keeps only the streamed CSV."""
+    config = _benchmark_config(c_N_values=np.array([0.25, 0.27, 0.30]))
+    csv_path = str(tmp_path / "streamed.csv")
+    results = run_scan(config, output_csv=csv_path, progress_every=0, return_rows=False)
+    assert results == []
+
+    with open(csv_path, encoding="utf-8") as handle:
+        rows = list(csv_mod.DictReader(handle))
+    assert [int(r["sample_index"]) for r in rows] == [0, 1, 2]
+
+
+def test_streamed_csv_spans_several_writer_batches(tmp_path):
+    """Rows handed to the CSV writer thread arrive complete and in order."""
+    config = _benchmark_config(
+        c_L_values=np.linspace(0.52, 0.70, 30), c_N_values=np.linspace(0.15, 0.45, 50)
+    )
+    csv_path = str(tmp_path / "batched.csv")
+    rows = run_scan(config, output_csv=csv_path, progress_every=700)
+
+    with open(csv_path, encoding="utf-8") as handle:
+        written = list(csv_mod.DictReader(handle))
+    assert [int(r["sample_index"]) for r in written] == list(range(config.total_points))
+    assert [r["reject_reason"] for r in written] == [r["reject_reason"] for r in rows]
+
+
+def test_columnar_scan_matches_row_scan():
+    """columnar=True returns one array per CSV column in sample order."""
+    from scanParams.scan import CSV_COLUMNS
+
+    config = _benchmark_config(c_L_values=np.array([0.55, 0.58]), anarchy=AnarchyConfig())
+    rows = run_scan(config, progress_every=0)
+    columns = run_scan(config, progress_every=0, columnar=True)
+
+    assert list(columns) == CSV_COLUMNS
+    assert columns["passes_all"].dtype == bool
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            if isinstance(value, float):
+                assert np.isclose(columns[key][i], value, equal_nan=True)
+            else:
+                assert columns[key][i] == value
+
+
+def test_screen_grid_matches_run_scan_filters():
+    """Vectorized pre-screen reproduces the per-point filter flags and values."""
+    config = _benchmark_config(
+        Lambda_IR_values=np.array([3000.0, 10000.0]),
+        c_L_values=np.array([0.52, 0.58, 0.66]),
+        c_N_values=np.array([0.15, 0.27, 0.45]),
+        c_E_grid=[np.array([0.75]), np.array([0.60, 0.70]), np.array([0.50])],
+        lightest_nu_mass_values=np.array([0.0, 0.002]),
+        naturalness_range=(0.01, 4.0),
+    )
+    rows = run_scan(config, progress_every=0)
+    screen = screen_grid(config)
+
+    assert len(screen["passes_screen"]) == len(rows)
+    for i, row in enumerate(rows):
+        for key in ("Lambda_IR", "c_L", "c_N", "c_E2", "lightest_nu_mass"):
+            assert screen[key][i] == row[key]
+        for key in ("Y_E_bar_1", "Y_N_bar_3", "max_Y_bar", "lfv_lhs", "lfv_ratio"):
+            assert np.isclose(screen[key][i], row[key], rtol=1e-12, equal_nan=True)
+        for key in ("perturbative", "natural", "lfv_passes"):
+            assert bool(screen[key][i]) == row[key]
+        assert bool(screen["passes_screen"][i]) == row["passes_all"]
+
+
+def test_screen_grid_scores_anarchy_like_run_scan():
+    """Batched anarchy scoring in screen_grid matches the per-point scores."""
+    config = _benchmark_config(
+        c_L_values=np.array([0.52, 0.58]),
+        c_N_values=np.array([0.15, 0.27, 0.45]),
+        naturalness_range=(0.01, 4.0),
+        anarchy=AnarchyConfig(),
+        anarchy_min_score=-20.0,
+    )
+    rows = run_scan(config, progress_every=0)
+    screen = screen_grid(config)
+
+    for i, row in enumerate(rows):
+        for key in ("score", "band_penalty", "condition_penalty", "yN_overall"):
+            column = f"anarchy_{key}"
+            assert np.isclose(screen[column][i], row[column], rtol=1e-9)
+        assert bool(screen["passes_screen"][i]) == row["passes_all"]
+    assert "anarchy_score" not in screen_grid(replace(config, anarchy=None))
+
+
+def test_short_circuit_skips_filters_after_perturbativity_failure():
+    """short_circuit leaves LFV/anarchy columns unset for non-perturbative points."""
+    full = run_scan(_benchmark_config(anarchy=AnarchyConfig()), progress_every=0)[0]
+    short = run_scan(
+        _benchmark_config(anarchy=AnarchyConfig(), short_circuit=True), progress_every=0
+    )[0]
+
+    assert not full["perturbative"]
+    assert np.isfinite(full["lfv_ratio"])
+    assert not short["passes_all"]
+    assert not short["lfv_passes"]
+    assert np.isnan(short["lfv_ratio"])
+    assert np.isnan(short["anarchy_score"])
+    assert short["reject_reason"] == "perturbativity;naturalness"
+    assert short["max_Y_bar"] == full["max_Y_bar"]
+
+
+def test_perturbativity_prefilter_drops_only_far_non_perturbative_points():
+    """Prefiltered points are exactly those with max|Y_bar| above the margin."""
+    grid = dict(
+        c_L_values=np.array([0.52, 0.58, 0.68, 0.75]),
+        c_N_values=np.array([0.15, 0.27, 0.45]),
+    )
+    full = run_scan(_benchmark_config(**grid), progress_every=0)
+    pre = run_scan(
+        _benchmark_config(**grid, prefilter_fn=perturbativity_prefilter), progress_every=0
+    )
+
+    n_dropped = 0
+    for full_row, pre_row in zip(full, pre):
+        assert pre_row["sample_index"] == full_row["sample_index"]
+        if full_row["max_Y_bar"] > 10.0 * 4.0:
+            n_dropped += 1
+            assert pre_row["reject_reason"] == "prefilter:perturbativity"
+            assert not pre_row["perturbative"]
+            assert np.isnan(pre_row["max_Y_bar"])
+            assert pre_row["delta_cL_max_symmetric"] == full_row["delta_cL_max_symmetric"]
+        else:
+            assert pre_row == full_row
+    assert 0 < n_dropped < len(full)
+
+    with pytest.raises(ValueError, match="prefilter_fn"):
+        _benchmark_config(prefilter_fn="not callable")
+
+
+def test_write_scan_columns_matches_streamed_csv(tmp_path):
+    """Columnar CSV export is byte-identical to the streamed run_scan CSV."""
+    config = _benchmark_config(c_N_values=np.array([0.15, 0.27]), anarchy=AnarchyConfig())
+    streamed = tmp_path / "streamed.csv"
+    columns = run_scan(config, output_csv=str(streamed), progress_every=0, columnar=True)
+
+    written = write_scan_columns(columns, tmp_path / "columns.csv")
+    assert written.read_bytes() == streamed.read_bytes()
+
+    pytest.importorskip("pyarrow")
+    import pandas as pd
+
+    frame = pd.read_parquet(write_scan_columns(columns, tmp_path / "columns.parquet"))
+    assert list(frame.columns) == list(columns)
+    np.testing.assert_array_equal(frame["max_Y_bar"].to_numpy(), columns["max_Y_bar"])
+
+
+def test_mcmc_scan_stays_in_box_and_perturbative_region():
+    """The Metropolis chain is reproducible, bounded and never leaves the support."""
+    config = _benchmark_config(
+        c_L_values=np.array([0.52, 0.70]),
+        c_N_values=np.array([0.15, 0.45]),
+        c_E_grid=[np.array([0.6, 0.8]), np.array([0.5, 0.7]), np.array([0.4, 0.6])],
+        rng_seed_global=7,
+    )
+    rows = run_mcmc_scan(config, 60, proposal_sigma=0.02)
+    again = run_mcmc_scan(config, 60, proposal_sigma=0.02)
+
+    assert [row["sample_index"] for row in rows] == list(range(60))
+    assert [row["c_L"] for row in rows] == [row["c_L"] for row in again]
+    assert all(0.52 <= row["c_L"] <= 0.70 for row in rows)
+    assert all(0.15 <= row["c_N"] <= 0.45 for row in rows)
+    perturbative = [row["perturbative"] for row in rows]
+    first = perturbative.index(True)
+    assert all(perturbative[first:])
+
+
+def test_mcmc_scan_streams_csv_without_keeping_rows(tmp_path):
+    config = _benchmark_config(rng_seed_global=7)
+    rows = run_mcmc_scan(config, 20, proposal_sigma=0.02)
+    path = tmp_path / "chain.csv"
+    # 7 rows per writerows batch: two full batches plus a partial tail.
+    assert run_mcmc_scan(replace(config, csv_chunksize=7), 20, proposal_sigma=0.02,
+                         output_csv=str(path), return_rows=False) == []
+
+    with open(path, newline="", encoding="utf-8") as handle:
+        written = list(csv_mod.DictReader(handle))
+    assert [int(row["sample_index"]) for row in written] == list(range(20))
+    assert [float(row["c_L"]) for row in written] == [row["c_L"] for row in rows]
+
+
+def test_resume_appends_missing_points_to_partial_csv(tmp_path):
+    """resume=True completes an interrupted CSV to match an uninterrupted run."""
+    config = _benchmark_config(c_N_values=np.array([0.15, 0.27, 0.35, 0.45]))
+    full = tmp_path / "full.csv"
+    run_scan(config, output_csv=str(full), progress_every=0, return_rows=False)
+
+    lines = full.read_bytes().splitlines(keepends=True)
+    partial = tmp_path / "partial.csv"
+    partial.write_bytes(b"".join(lines[:3]) + lines[3][:20])
+
+    rows = run_scan(config, output_csv=str(partial), progress_every=0, resume=True)
+    assert [row["sample_index"] for row in rows] == [2, 3]
+    assert partial.read_bytes() == full.read_bytes()
+
+
+def test_c_l_degeneracy_table_is_scoped_to_its_scan(monkeypatch):
+    """Each scan consults only its own grid's c_L table, and a table delta is
+    bit-identical to the uncached per-point solve."""
+    from scanParams import scan as scan_module
+
+    tables_seen = []
+    original = scan_module._cL_degeneracy_deltas
+
+    def spy(c_L0, k, Lambda_IR, max_fL_ratio, table=None):
+        tables_seen.append(None if table is None else sorted(table))
+        return original(c_L0, k, Lambda_IR, max_fL_ratio, table)
+
+    monkeypatch.setattr(scan_module, "_cL_degeneracy_deltas", spy)
+    config_a = _benchmark_config(c_L_values=np.array([0.60, 0.845]))
+    config_b = _benchmark_config(c_L_values=np.array([0.70]))
+    run_scan(config_a, progress_every=0)
+    tables_seen.clear()
+    run_scan(config_b, progress_every=0)
+
+    key_b = (0.70, float(config_b.k), 3000.0, float(config_b.max_fL_ratio))
+    assert tables_seen and all(table == [key_b] for table in tables_seen)
+
+    for c_L in (0.70, 0.845):
+        config = _benchmark_config(c_L_values=np.array([c_L]))
+        key = (c_L, float(config.k), 3000.0, float(config.max_fL_ratio))
+        assert scan_module._precompute_cL_degeneracy_table(config) == {
+            key: scan_module._solve_cL_degeneracy_deltas(*key)
+        }
+        scanned = run_scan(config, progress_every=0)[0]
+        sampled = run_mcmc_scan(config, n_samples=1, start=(c_L, 0.27, 0.75, 0.60, 0.50))[0]
+        for column in ("delta_cL_max_symmetric", "delta_cL_max_one_sided"):
+            assert scanned[column] == sampled[column]
+
+
+def test_materialized_grid_slices_follow_sample_index_order():
+    """Any slice of the SoA grid table matches the flat itertools.product order."""
+    import itertools
+
+    from scanParams.scan import _materialize_grid
+
+    config = _benchmark_config(
+        Lambda_IR_values=np.array([2000.0, 3000.0]),
+        c_L_values=np.array([0.55, 0.60]),
+        c_N_values=np.array([0.20, 0.30, 0.40]),
+        c_E_fixed=None,
+        c_E_grid=[np.array([0.50, 0.75]), np.array([0.60, 0.70]), np.array([0.55])],
+        MN_mode="scan_ratio",
+        MN_over_k_values=np.array([0.05, 0.1]),
+    )
+    expected = [
+        (Lambda_IR, c_L, c_N, *sorted(c_E, reverse=True), MN_over_k, m_light)
+        for Lambda_IR, c_L, c_N, *c_E, MN_over_k, m_light in itertools.product(
+            config.Lambda_IR_values,
+            config.c_L_values,
+            config.c_N_values,
+            *config.c_E_grid,
+            config.MN_over_k_values,
+            config.lightest_nu_mass_values,
+        )
+    ]
+    table = _materialize_grid(config)
+    assert table.shape == (config.total_points, 8)
+    np.testing.assert_array_equal(table, np.array(expected))
+    np.testing.assert_array_equal(_materialize_grid(config, 5, 17), table[5:17])
+
+
+def test_sample_seed_matches_seed_sequence_reference():
+    """The packed-entropy fast path reproduces SeedSequence([global, index])."""
+    from scanParams.scan import _sample_seed
+
+    for global_seed in (0, 12345, 2**32 - 1, 2**40 + 3):
+        for sample_index in (0, 1, 777, 2**32, 2**33 + 5):
+            reference = np.random.SeedSequence([global_seed, sample_index])
+            expected = int(reference.generate_state(1, dtype=np.uint64)[0])
+            assert _sample_seed(global_seed, sample_index) == expected
+    assert _sample_seed(None, 3) is None
+
+
+def test_sample_seeds_do_not_depend_on_worker_order():
+    """Each point's seed comes from its own SeedSequence, however points are dispatched."""
+    config = _benchmark_config(
+        c_L_values=np.array([0.55, 0.58, 0.62]),
+        c_N_values=np.array([0.25, 0.27]),
+        anarchy=AnarchyConfig(),
+        rng_seed_global=2024,
+    )
+    serial = run_scan(config, progress_every=0)
+    expected = [
+        int(np.random.SeedSequence([2024, i]).generate_state(1, dtype=np.uint64)[0])
+        for i in range(len(serial))
+    ]
+    assert [r["rng_seed_sample"] for r in serial] == expected
+    assert len(set(expected)) == len(expected)
+
+    for rows in (
+        run_scan(replace(config, n_jobs=2), progress_every=0, chunksize=1),
+        run_scan(replace(config, vectorized=True, n_jobs=2), progress_every=0),
+    ):
+        assert [r["rng_seed_sample"] for r in rows] == expected
+        np.testing.assert_allclose(
+            [r["anarchy_score"] for r in rows], [r["anarchy_score"] for r in serial], rtol=1e-12
+        )
+
+
+def test_float32_perturbativity_prefilter_matches_float64_screen():
+    """The float32 screen with float64 re-checks drops exactly the float64 rows."""
+    from scanParams.scan import _materialize_grid
+
+    config = _benchmark_config(
+        Lambda_IR_values=np.array([3000.0, 10000.0]),
+        c_L_values=np.linspace(0.45, 0.95, 26),
+        c_N_values=np.linspace(-0.6, 0.6, 25),
+        c_E_grid=[np.array([0.75, 1.4]), np.array([0.60]), np.array([0.50])],
+    )
+    grid = _materialize_grid(config)
+    for margin in (0.5, 1.0, 10.0):
+        exact = perturbativity_prefilter(config, grid, margin=margin, dtype=np.float64)
+        assert 0 < exact.sum() < len(grid)
+        np.testing.assert_array_equal(perturbativity_prefilter(config, grid, margin=margin), exact)
+
+    # A bound on a row whose float32 value rounds above its float64 value
+    # would drop it in float32 alone; the re-check keeps it.
+    from scanParams.scan import _screen_max_y_bar
+
+    y64, _ = _screen_max_y_bar(config, 3000.0, grid[:50], np.inf, np.float64)
+    y32, _ = _screen_max_y_bar(config, 3000.0, grid[:50], np.inf, np.float32)
+    target = float(y64[np.flatnonzero(y32 > y64)[0]])
+    _, unsure = _screen_max_y_bar(config, 3000.0, grid[:50], target, np.float32)
+    assert unsure.any()
+    edge = replace(config, max_Y_bar=target)
+    np.testing.assert_array_equal(
+        perturbativity_prefilter(edge, grid[:50], margin=1.0),
+        perturbativity_prefilter(edge, grid[:50], margin=1.0, dtype=np.float64),
+    )
+
+
+def test_vectorized_sample_seeds_match_scalar_derivation():
+    """Block-wise seed hashing reproduces _sample_seed, fallback included."""
+    from scanParams.scan import _sample_seed, _sample_seeds
+
+    for global_seed in (0, 12345, 2**32 - 1, 2**40 + 3):
+        expected = [_sample_seed(global_seed, i) for i in range(250, 400)]
+        assert _sample_seeds(global_seed, 250, 400) == expected
+    top = 2**32
+    assert _sample_seeds(7, top - 2, top) == [_sample_seed(7, top - 2), _sample_seed(7, top - 1)]
+    assert _sample_seeds(None, 0, 3) == [None, None, None]
+
+
+def test_vectorized_sample_seeds_replay_the_public_seed_sequence():
+    """The uint32 replay of numpy's SeedSequence hashing (hard-coded constants)
+    agrees with ``np.random.SeedSequence`` itself across many indices."""
+    from scanParams.scan import _sample_seeds
+
+    def reference(global_seed, start, stop):
+        return [
+            int(np.random.SeedSequence([global_seed, i]).generate_state(1, dtype=np.uint64)[0])
+            for i in range(start, stop)
+        ]
+
+    rng = np.random.default_rng(3)
+    seeds = [0, 1, 12345, 2**31, 2**32 - 1, *rng.integers(0, 2**32, size=3).tolist()]
+    starts = [0, 2**16 - 100, 2**31 - 100, 2**32 - 200, *rng.integers(0, 2**32 - 200, 4).tolist()]
+    for global_seed in seeds:
+        assert _sample_seeds(global_seed, 0, 2000) == reference(global_seed, 0, 2000)
+        for start in starts:
+            assert _sample_seeds(global_seed, start, start + 200) == reference(
+                global_seed, start, start + 200
+            )
+
+
+def test_read_git_head_resolves_loose_packed_and_detached_refs(tmp_path):
+    """HEAD is read without git for the usual layouts and left to git otherwise."""
+    from scanParams.scan import _read_git_head
+
+    sha_loose, sha_packed = "a" * 40, "b" * 40
+    git_dir = tmp_path / "repo" / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "refs" / "heads" / "main").write_text(sha_loose + "\n")
+    (git_dir / "packed-refs").write_text(
+        f"# pack-refs with: peeled\n{sha_packed} refs/heads/release\n"
+    )
+
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    assert _read_git_head(git_dir.parent) == sha_loose
+    (git_dir / "HEAD").write_text("ref: refs/heads/release\n")
+    assert _read_git_head(git_dir.parent) == sha_packed
+    (git_dir / "HEAD").write_text(sha_packed + "\n")
+    assert _read_git_head(git_dir.parent) == sha_packed
+    (git_dir / "HEAD").write_text("ref: refs/heads/missing\n")
+    assert _read_git_head(git_dir.parent) == ""
+
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (worktree / ".git").write_text("gitdir: ../repo/.git/worktrees/wt\n")
+    assert _read_git_head(worktree) == ""
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"anarchy": AnarchyConfig(), "anarchy_min_score": -20.0},
+        {"anarchy": AnarchyConfig(), "short_circuit": True},
+        {"prefilter_fn": perturbativity_prefilter},
+    ],
+)
+@pytest.mark.parametrize(("dtype", "rtol"), [(np.float64, 1e-12), (np.float32, 1e-4)])
+def test_vectorized_scan_matches_per_point_rows(overrides, dtype, rtol):
+    """Block evaluation reproduces the per-point rows up to rounding."""
+    config = _benchmark_config(
+        Lambda_IR_values=np.array([3000.0, 10000.0]),
+        c_L_values=np.array([0.52, 0.58, 0.66, 0.75]),
+        c_N_values=np.array([0.15, 0.27, 0.45]),
+        c_E_grid=[np.array([0.75]), np.array([0.60, 0.70]), np.array([0.50])],
+        naturalness_range=(0.01, 4.0),
+        **overrides,
+    )
+    rows = run_scan(config, progress_every=0)
+    fast = run_scan(replace(config, vectorized=True, dtype=dtype), progress_every=0)
+
+    assert len(fast) == len(rows)
+    for row, fast_row in zip(rows, fast):
+        assert list(fast_row) == list(row)
+        for key, value in row.items():
+            if isinstance(value, float):
+                assert np.isclose(fast_row[key], value, rtol=rtol, atol=0.0, equal_nan=True)
+            else:
+                assert fast_row[key] == value, key
+
+
+
+def _require_tau_near_one(result):
+    return (0.5 <= abs(result.Y_E_bar[2]) <= 2.0, "tau_yukawa")
+
+
+def test_vectorized_scan_applies_extra_filters_per_row():
+    config = _benchmark_config(
+        c_L_values=np.array([0.52, 0.58, 0.66]),
+        c_N_values=np.array([0.15, 0.45]),
+        c_E_grid=[np.array([0.75]), np.array([0.60, 0.70]), np.array([0.50, 0.56])],
+        naturalness_range=(0.01, 4.0),
+        anarchy=AnarchyConfig(),
+        anarchy_min_score=-2.0,
+    )
+    rows = run_scan(config, progress_every=0, extra_filters=[_require_tau_near_one])
+    fast = run_scan(
+        replace(config, vectorized=True), progress_every=0, extra_filters=[_require_tau_near_one]
+    )
+
+    assert any("tau_yukawa" in row["reject_reason"] for row in rows)
+    assert [row["reject_reason"] for row in fast] == [row["reject_reason"] for row in rows]
+    assert [row["passes_all"] for row in fast] == [row["passes_all"] for row in rows]
+
+    # c_E1 = 2 underflows the float32 overlaps, so that row falls back to
+    # _evaluate_point, which must still run the extra filters.
+    def always_reject(result):
+        return (False, "always_reject")
+
+    underflow = _benchmark_config(c_E_fixed=[2.0, 0.60, 0.50])
+    for overrides in ({}, {"vectorized": True}, {"vectorized": True, "dtype": np.float32}):
+        row = run_scan(
+            replace(underflow, **overrides), progress_every=0, extra_filters=[always_reject]
+        )[0]
+        assert "always_reject" in row["reject_reason"]
+        assert not row["passes_all"]
+
+
+def test_overlap_table_lookup_matches_direct_overlaps():
+    from scanParams.scan import _materialize_grid, _OverlapTable
+    from warpConfig.wavefuncs import f_IR, f_UV
+
+    config = _benchmark_config(
+        Lambda_IR_values=np.array([3000.0, 10000.0]),
+        c_L_values=np.array([0.5, 0.58, 0.66]),
+        c_N_values=np.array([0.15, 0.5]),
+        c_E_grid=[np.array([0.75, 0.58]), np.array([0.60, 0.70]), np.array([0.50])],
+    )
+    table = _OverlapTable.from_config(config)
+    grid = _materialize_grid(config)
+    for Lambda_IR in config.Lambda_IR_values.tolist():
+        rows = grid[grid[:, 0] == Lambda_IR]
+        epsilon = Lambda_IR / config.k
+        f_L, f_E, f_N, f_N_UV = table.lookup(Lambda_IR, rows)
+        np.testing.assert_allclose(f_L, f_IR(rows[:, 1], epsilon), rtol=1e-15)
+        np.testing.assert_allclose(f_E, f_IR(rows[:, 3:6], epsilon), rtol=1e-15)
+        np.testing.assert_allclose(f_N, f_IR(rows[:, 2], epsilon), rtol=1e-15)
+        np.testing.assert_allclose(f_N_UV, f_UV(rows[:, 2], epsilon), rtol=1e-15)
+
+
+def test_vectorized_scan_spreads_blocks_over_workers():
+    config = _benchmark_config(
+        Lambda_IR_values=np.array([3000.0, 10000.0]),
+        c_L_values=np.array([0.52, 0.58, 0.66, 0.75]),
+        c_N_values=np.array([0.15, 0.27, 0.45]),
+        c_E_grid=[np.array([0.75]), np.array([0.60, 0.70]), np.array([0.50])],
+        vectorized=True,
+    )
+    serial = run_scan(config, progress_every=0)
+    parallel = run_scan(replace(config, n_jobs=2), progress_every=0)
+
+    assert [row["sample_index"] for row in parallel] == list(range(config.total_points))
+    # repr: NaN columns compare unequal as values.
+    assert repr(parallel) == repr(serial)
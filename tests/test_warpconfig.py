@@ -1,7 +1,9 @@
+import math
+
 import numpy as np
 import pytest
 
-from warpConfig.wavefuncs import f_IR, f_UV
+from warpConfig.wavefuncs import f_IR, f_IR_from_logeps, f_UV, f_UV_from_logeps
 
 
 EPSILON_RS = 1.0e-15
@@ -58,3 +60,59 @@ def test_ir_uv_overlap_identity():
         rtol=1e-12,
         atol=1e-300,
     )
+
+
+def test_overlap_is_accurate_near_c_half():
+    """f_IR^2 matches independent references on both sides of c = 1/2.
+
+    With t = (1 - 2c) ln(eps), f_IR^2 = t / (e^t - 1) / (-2 ln eps); near c = 1/2
+    it is compared with the Bernoulli series of t / (e^t - 1) (truncation
+    < 1e-20 for |t| < 0.1), away from it with the direct baseline formula.
+    """
+    log_eps = math.log(EPSILON_RS)
+    for delta in (-1.0e-3, -1.0e-9, 0.0, 1.0e-12, 1.0e-7, 1.0e-5, 1.0e-3):
+        t = -2.0 * delta * log_eps
+        series = 1.0 - t / 2 + t**2 / 12 - t**4 / 720 + t**6 / 30240 - t**8 / 1209600
+        expected_sq = series / (-2.0 * log_eps)
+        assert float(f_IR(0.5 + delta, EPSILON_RS)) ** 2 == pytest.approx(expected_sq, rel=1e-13)
+
+    for c in (0.2, 0.4, 0.45, 0.55, 0.6, 0.8):
+        expected_sq = (0.5 - c) / (1.0 - EPSILON_RS ** (1.0 - 2.0 * c))
+        assert float(f_IR(c, EPSILON_RS)) ** 2 == pytest.approx(expected_sq, rel=1e-12)
+
+
+def test_vectorized_warp_params_match_scalar_dicts():
+    from warpConfig.baseParams import get_warp_params, get_warp_params_vec
+
+    lambdas = np.array([1.0, 3000.0, 1.0e4])
+    arrays = get_warp_params_vec(lambdas, k=1.2209e19)
+
+    for i, lam in enumerate(lambdas):
+        scalar = get_warp_params(k=1.2209e19, Lambda_IR=lam)
+        for key in ("epsilon", "rc", "z_v", "warp_log"):
+            assert getattr(arrays, key)[i] == pytest.approx(scalar[key], rel=1e-15)
+        assert arrays.z_h == scalar["z_h"]
+
+    with pytest.raises(ValueError, match="epsilon must be > 0"):
+        get_warp_params_vec(np.array([3000.0, -1.0]))
+
+
+def test_overlaps_from_log_epsilon_match_epsilon_form():
+    c = np.array([-0.3, 0.27, 0.5, 0.58, 1.4])
+    log_eps = np.log(EPSILON_RS)
+
+    assert np.array_equal(f_IR_from_logeps(c, log_eps), f_IR(c, EPSILON_RS))
+    assert np.array_equal(f_UV_from_logeps(c, log_eps), f_UV(c, EPSILON_RS))
+
+
+def test_overlap_arrays_through_c_half_raise_no_floating_point_errors():
+    c = np.array([0.3, 0.5, 0.5 + 1.0e-13, 0.5, 40.0, -40.0])
+
+    with np.errstate(all="raise"):
+        ir = f_IR(c, EPSILON_RS)
+        uv = f_UV(c, EPSILON_RS)
+
+    assert np.all(np.isfinite(ir)) and np.all(np.isfinite(uv))
+    for i, c_i in enumerate(c):
+        assert ir[i] == float(f_IR(c_i, EPSILON_RS))
+        assert uv[i] == float(f_UV(c_i, EPSILON_RS))
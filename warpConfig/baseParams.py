@@ -1,4 +1,7 @@
 import math
+from dataclasses import dataclass
+
+import numpy as np
 
 # Electroweak vev (GeV)
 V_EWSB = 174.0
@@ -12,6 +15,22 @@ MBARPL = 2.435e18    # reduced Planck mass (GeV)
 DEFAULT_K = MPL
 DEFAULT_LAMBDA_IR = 3000.0  # geometric IR scale, Lambda_IR = 1 / z_v
 
+def warp_epsilon(k=DEFAULT_K, Lambda_IR=DEFAULT_LAMBDA_IR):
+    """
+    Warp factor epsilon = Lambda_IR / k, validated as in `get_warp_params`.
+
+    Hot paths that only need epsilon (e.g. the Yukawa solver, once per scan
+    point) call this instead of building the full parameter dict.
+    """
+    # Derive epsilon from Lambda_IR and k
+    # Lambda_IR = k * epsilon  =>  epsilon = Lambda_IR / k
+    epsilon = Lambda_IR / k
+
+    if epsilon <= 0:
+        raise ValueError("epsilon must be > 0. Ensure Lambda_IR and k have the same sign.")
+    return epsilon
+
+
 def get_warp_params(k=DEFAULT_K, Lambda_IR=DEFAULT_LAMBDA_IR):
     """
     Calculate and return warp geometry parameters.
@@ -36,12 +55,7 @@ def get_warp_params(k=DEFAULT_K, Lambda_IR=DEFAULT_LAMBDA_IR):
         - z_v: IR brane position (1/Lambda_IR)
         - warp_log: pi * k * rc
     """
-    # Derive epsilon from Lambda_IR and k
-    # Lambda_IR = k * epsilon  =>  epsilon = Lambda_IR / k
-    epsilon = Lambda_IR / k
-
-    if epsilon <= 0:
-        raise ValueError("epsilon must be > 0. Ensure Lambda_IR and k have the same sign.")
+    epsilon = warp_epsilon(k, Lambda_IR)
 
     # Derive rc from epsilon
     # epsilon = exp(-pi k rc)  =>  ln(epsilon) = -pi k rc  =>  rc = -ln(epsilon) / (pi k)
@@ -57,3 +71,39 @@ def get_warp_params(k=DEFAULT_K, Lambda_IR=DEFAULT_LAMBDA_IR):
         "z_v": 1.0 / Lambda_IR, # IR brane position in conformal coord (e^{pi k rc}/k) = 1/(k*eps)
         "warp_log": warp_log # pi*k*rc = ln(k/Lambda)
     }
+
+
+@dataclass(frozen=True)
+class WarpParamsArrays:
+    """`get_warp_params` for many Lambda_IR values, one array per field."""
+
+    k: float
+    Lambda_IR: np.ndarray
+    epsilon: np.ndarray
+    rc: np.ndarray
+    z_h: float
+    z_v: np.ndarray
+    warp_log: np.ndarray
+
+
+def get_warp_params_vec(Lambda_IR, k=DEFAULT_K):
+    """
+    Vectorized `get_warp_params` over an array of Lambda_IR at fixed k.
+
+    Returns a `WarpParamsArrays` whose array fields have the shape of
+    `Lambda_IR`; element i equals ``get_warp_params(k, Lambda_IR[i])[field]``.
+    """
+    Lambda_IR = np.asarray(Lambda_IR, dtype=float)
+    epsilon = Lambda_IR / k
+    if np.any(~(epsilon > 0)):
+        raise ValueError("epsilon must be > 0. Ensure Lambda_IR and k have the same sign.")
+    warp_log = -np.log(epsilon)
+    return WarpParamsArrays(
+        k=k,
+        Lambda_IR=Lambda_IR,
+        epsilon=epsilon,
+        rc=warp_log / (math.pi * k),
+        z_h=1.0 / k,
+        z_v=1.0 / Lambda_IR,
+        warp_log=warp_log,
+    )
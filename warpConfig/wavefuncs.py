@@ -7,6 +7,44 @@ for 5D fermion zero modes in a warped geometry.
 from typing import Union
 
 import numpy as np
+from numpy.typing import DTypeLike
+
+
+def _overlap(
+    c: Union[float, np.ndarray], log_eps: float, sign: float, dtype: DTypeLike = float
+) -> Union[float, np.ndarray]:
+    """
+    sqrt((0.5 - c) / (sign * expm1(sign * (2c - 1) ln epsilon))), branch-free.
+
+    sign = -1 gives f_IR and +1 gives f_UV.  expm1 has the sign of its
+    argument and suffers no cancellation, so the ratio is never negative and
+    stays accurate arbitrarily close to c = 0.5; only c == 0.5 itself (0/0)
+    takes the limit 1 / (-2 ln epsilon).  Evaluated in ``dtype``.
+    """
+    c_arr = np.asarray(c, dtype=dtype)
+    log_eps = np.asarray(log_eps, dtype=dtype)
+    # expm1 overflows to inf far from c = 0.5, giving the correct limit 0.
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        res_sq = (0.5 - c_arr) / (sign * np.expm1(sign * (2.0 * c_arr - 1.0) * log_eps))
+    return np.sqrt(np.where(c_arr == 0.5, 1.0 / (-2.0 * log_eps), res_sq))
+
+
+def f_IR_from_logeps(
+    c: Union[float, np.ndarray], log_eps: float, dtype: DTypeLike = float
+) -> Union[float, np.ndarray]:
+    """
+    f_IR(c) from log(epsilon), for callers that evaluate many overlaps at one
+    epsilon and compute the logarithm once.  ``dtype=np.float32`` trades
+    precision (~1e-7 relative) for speed in exploratory scans.
+    """
+    return _overlap(c, log_eps, -1.0, dtype)
+
+
+def f_UV_from_logeps(
+    c: Union[float, np.ndarray], log_eps: float, dtype: DTypeLike = float
+) -> Union[float, np.ndarray]:
+    """f_UV(c) from log(epsilon); see :func:`f_IR_from_logeps`."""
+    return _overlap(c, log_eps, 1.0, dtype)
 
 
 def f_IR(c: Union[float, np.ndarray], epsilon: float) -> Union[float, np.ndarray]:
@@ -28,30 +66,8 @@ def f_IR(c: Union[float, np.ndarray], epsilon: float) -> Union[float, np.ndarray
     float or np.ndarray
         The value of f_IR(c).
     """
-    c_arr = np.asarray(c, dtype=float)
-    res_sq = np.zeros_like(c_arr)
-
-    # Handle the singularity at c = 0.5
-    mask = ~np.isclose(c_arr, 0.5)
-
-    # For c != 0.5
-    if np.any(mask):
-        c_safe = c_arr[mask]
-        # Note: epsilon**(1-2c) can be very large or very small.
-        # If c > 0.5, 1-2c < 0, exponent is negative, term is large (epsilon is small).
-        # If c < 0.5, 1-2c > 0, exponent is positive, term is small.
-        denom = 1.0 - epsilon**(1.0 - 2.0*c_safe)
-        res_sq[mask] = (0.5 - c_safe) / denom
-
-    # For c == 0.5, take the limit
-    # Limit_{c->0.5} f^2 = 1 / (-2 * ln(epsilon))
-    if np.any(~mask):
-        res_sq[~mask] = 1.0 / (-2.0 * np.log(epsilon))
-
-    # Ensure non-negative before sqrt; numerical noise can drive tiny values below zero.
-    res_sq = np.maximum(res_sq, 0.0)
-
-    return np.sqrt(res_sq)
+    # 1 - epsilon**(1-2c) = -expm1((1-2c) ln epsilon), accurate near c = 0.5.
+    return _overlap(c, np.log(epsilon), -1.0)
 
 
 def f_UV(c: Union[float, np.ndarray], epsilon: float) -> Union[float, np.ndarray]:
@@ -73,24 +89,5 @@ def f_UV(c: Union[float, np.ndarray], epsilon: float) -> Union[float, np.ndarray
     float or np.ndarray
         The value of f_UV(c).
     """
-    c_arr = np.asarray(c, dtype=float)
-    res_sq = np.zeros_like(c_arr)
-
-    # Handle the singularity at c = 0.5
-    mask = ~np.isclose(c_arr, 0.5)
-
-    # For c != 0.5
-    if np.any(mask):
-        c_safe = c_arr[mask]
-        denom = epsilon**(2.0*c_safe - 1.0) - 1.0
-        res_sq[mask] = (0.5 - c_safe) / denom
-
-    # For c == 0.5, take the limit
-    # Limit_{c->0.5} f^2 = 1 / (-2 * ln(epsilon))
-    if np.any(~mask):
-        res_sq[~mask] = 1.0 / (-2.0 * np.log(epsilon))
-
-    # Ensure non-negative
-    res_sq = np.maximum(res_sq, 0.0)
-
-    return np.sqrt(res_sq)
+    # epsilon**(2c-1) - 1 = expm1((2c-1) ln epsilon), accurate near c = 0.5.
+    return _overlap(c, np.log(epsilon), 1.0)
@@ -22,7 +22,12 @@ Example
 """
 
 from .charged_lepton import compute_charged_lepton_yukawas
-from .compute_yukawas import YukawaResult, compute_all_yukawas
+from .compute_yukawas import (
+    YukawaResult,
+    YukawaResultBatch,
+    compute_all_yukawas,
+    compute_all_yukawas_batch,
+)
 from .constants import (
     EV_TO_GEV,
     LEPTON_MASSES,
@@ -30,15 +35,23 @@ from .constants import (
     M_MUON,
     M_TAU,
 )
-from .neutrino import compute_neutrino_yukawas
+from .neutrino import (
+    NeutrinoYukawas,
+    compute_neutrino_yukawas,
+    compute_neutrino_yukawas_unchecked,
+)
 
 __all__ = [
     # Main API
     'compute_all_yukawas',
+    'compute_all_yukawas_batch',
     'YukawaResult',
+    'YukawaResultBatch',
     # Individual computation functions
     'compute_charged_lepton_yukawas',
     'compute_neutrino_yukawas',
+    'compute_neutrino_yukawas_unchecked',
+    'NeutrinoYukawas',
     # Constants
     'M_ELECTRON',
     'M_MUON',
@@ -32,6 +32,9 @@ import numpy as np
 
 from .constants import LEPTON_MASSES
 
+# Default masses as floats, converted once rather than on every call.
+_LEPTON_MASSES_FLOAT = tuple(float(m) for m in LEPTON_MASSES)
+_LEPTON_MASSES_ARR = np.array(_LEPTON_MASSES_FLOAT)
 
 def compute_charged_lepton_yukawas(
     f_L: float,
@@ -72,7 +75,8 @@ def compute_charged_lepton_yukawas(
     Raises
     ------
     ValueError
-        If any f-factor is zero or negative (would cause division by zero).
+        If any f-factor is zero or negative (would cause division by zero),
+        or if lepton_masses does not have three entries.
 
     Examples
     --------
@@ -84,28 +88,44 @@ def compute_charged_lepton_yukawas(
     >>> result = compute_charged_lepton_yukawas(f_L, f_E, MPL)
     >>> print(result['Y_E_bar'])  # Should be O(1) to O(few)
     """
-    # Convert to numpy arrays
-    f_E_arr = np.asarray(f_E, dtype=float)
-    m_E = np.asarray(lepton_masses, dtype=float)
+    # Convert to numpy arrays (float64 arrays from f_IR pass straight through)
+    if isinstance(f_E, np.ndarray) and f_E.dtype == np.float64:
+        f_E_arr = f_E
+    else:
+        f_E_arr = np.asarray(f_E, dtype=float)
 
     # Validate inputs
     if f_L <= 0:
         raise ValueError(f"f_L must be positive, got {f_L}")
-    if np.any(f_E_arr <= 0):
-        raise ValueError(f"All f_E values must be positive, got {f_E_arr}")
     if f_E_arr.shape != (3,):
+        if np.any(f_E_arr <= 0):
+            raise ValueError(f"All f_E values must be positive, got {f_E_arr}")
         raise ValueError(f"f_E must have shape (3,), got {f_E_arr.shape}")
+    # Three generations: plain float arithmetic beats per-call ufunc dispatch
+    # on 3-element arrays and rounds identically.
+    f_E_vals = f_E_arr.tolist()
+    if any(f <= 0 for f in f_E_vals):
+        raise ValueError(f"All f_E values must be positive, got {f_E_arr}")
+    if lepton_masses is LEPTON_MASSES:
+        m_E, masses_GeV = _LEPTON_MASSES_FLOAT, _LEPTON_MASSES_ARR.copy()
+    else:
+        m_E = [float(m) for m in lepton_masses]
+        if len(m_E) != 3:
+            raise ValueError(f"lepton_masses must have 3 entries, got {len(m_E)}")
+        masses_GeV = np.array(m_E, dtype=float)
+
+    # Compute rescaled (dimensionless) Yukawas directly
+    # Ȳ_{E_i} = m_{E_i} / (v · f_L · f_{E_i})
+    scale = v * f_L
+    Y_E_bar = [m / (scale * f) for m, f in zip(m_E, f_E_vals)]
 
     # Compute 5D Yukawa couplings
-    # Y_{E_i} = m_{E_i} / (2 v k · f_L · f_{E_i})
-    Y_E = m_E / (2.0 * v * k * f_L * f_E_arr)
-
-    # Compute rescaled (dimensionless) Yukawas
-    # Ȳ_{E_i} = 2k · Y_{E_i} = m_{E_i} / (v · f_L · f_{E_i})
-    Y_E_bar = 2.0 * k * Y_E  # Equivalently: m_E / (v * f_L * f_E_arr)
+    # Y_{E_i} = Ȳ_{E_i} / 2k = m_{E_i} / (2 v k · f_L · f_{E_i})
+    inv_2k = 0.5 / k
+    Y_E = [y * inv_2k for y in Y_E_bar]
 
     return {
-        'Y_E': Y_E,
-        'Y_E_bar': Y_E_bar,
-        'masses_GeV': m_E,
+        'Y_E': np.array(Y_E),
+        'Y_E_bar': np.array(Y_E_bar),
+        'masses_GeV': masses_GeV,
     }
@@ -20,14 +20,53 @@ This module provides the main entry point for computing all Yukawa couplings
     print(f"Perturbative: {result.is_perturbative()}")
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 from .charged_lepton import compute_charged_lepton_yukawas
 from .neutrino import compute_neutrino_yukawas
 
+# Keys of YukawaResult.params, in the order compute_all_yukawas fills them.
+_PARAM_KEYS = (
+    'Lambda_IR', 'c_L', 'c_E', 'c_N', 'M_N', 'lightest_nu_mass',
+    'ordering', 'majorana_alpha', 'majorana_beta', 'k', 'v',
+)
+_PARAM_INDEX = {key: i for i, key in enumerate(_PARAM_KEYS)}
+
+
+class _YukawaParams(Mapping):
+    """Read-only ``YukawaResult.params`` mapping backed by one tuple.
+
+    Every point of a scan carries the same eleven keys, so only the values
+    are stored per point; the key schema is shared.  Reads behave like the
+    dict it replaces (``params['c_L']``, ``.get``, ``dict(params)``).
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values: Tuple[Any, ...]):
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[_PARAM_INDEX[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = _PARAM_INDEX.get(key)
+        return default if i is None else self._values[i]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_PARAM_KEYS)
+
+    def __len__(self) -> int:
+        return len(_PARAM_KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(zip(_PARAM_KEYS, self._values)))
+
 
 @dataclass
 class YukawaResult:
@@ -56,9 +95,17 @@ class YukawaResult:
         UV overlap factor for RH neutrinos.
     epsilon : float
         Warp factor ε = Λ_IR/k.
-    params : dict
-        Input parameters used (for reproducibility).
+    params : Mapping
+        Input parameters used (for reproducibility); a read-only mapping
+        sharing its key schema across points.
     """
+    # One instance per scan point: slots drop the per-instance __dict__.
+    # Spelled out (not dataclass(slots=True)) to keep Python 3.9 support.
+    __slots__ = (
+        'Y_E', 'Y_E_bar', 'Y_N', 'Y_N_bar', 'Y_N_matrix',
+        'f_L', 'f_E', 'f_N', 'f_N_UV', 'epsilon', 'params',
+    )
+
     # Charged leptons
     Y_E: np.ndarray
     Y_E_bar: np.ndarray
@@ -78,7 +125,7 @@ class YukawaResult:
     epsilon: float
 
     # Input parameters
-    params: Dict
+    params: Mapping
 
     def is_perturbative(self, max_Y_bar: float = 4.0) -> bool:
         """Check if all rescaled Yukawas satisfy perturbativity bound.
@@ -151,6 +198,54 @@ class YukawaResult:
         return "\n".join(lines)
 
 
+@dataclass
+class YukawaResultBatch:
+    """Column-wise :class:`YukawaResult` for N points at one Lambda_IR.
+
+    Returned by :func:`compute_all_yukawas_batch`.  Each field stacks the
+    per-point values: ``(N, 3)`` for the Yukawa vectors and ``f_E``,
+    ``(N, 3, 3)`` for ``Y_N_matrix`` and ``(N,)`` for the scalar overlaps.
+    Points the scalar function would reject are NaN and ``valid`` is False.
+    ``params`` holds the broadcast inputs (arrays of shape ``(N,)``, ``c_E``
+    of shape ``(N, 3)``) and the scalar settings.
+    """
+    Y_E: np.ndarray
+    Y_E_bar: np.ndarray
+    Y_N: np.ndarray
+    Y_N_bar: np.ndarray
+    Y_N_matrix: np.ndarray
+    f_L: np.ndarray
+    f_E: np.ndarray
+    f_N: np.ndarray
+    f_N_UV: np.ndarray
+    valid: np.ndarray
+    epsilon: float
+    params: Dict
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def result(self, i: int) -> YukawaResult:
+        """Point ``i`` as a :class:`YukawaResult` (e.g. for per-point filters)."""
+        params = _YukawaParams(tuple(
+            value[i].tolist() if isinstance(value, np.ndarray) else value
+            for value in map(self.params.__getitem__, _PARAM_KEYS)
+        ))
+        return YukawaResult(
+            Y_E=self.Y_E[i],
+            Y_E_bar=self.Y_E_bar[i],
+            Y_N=self.Y_N[i],
+            Y_N_bar=self.Y_N_bar[i],
+            Y_N_matrix=self.Y_N_matrix[i],
+            f_L=float(self.f_L[i]),
+            f_E=self.f_E[i],
+            f_N=float(self.f_N[i]),
+            f_N_UV=float(self.f_N_UV[i]),
+            epsilon=self.epsilon,
+            params=params,
+        )
+
+
 def compute_all_yukawas(
     Lambda_IR: float,
     c_L: float,
@@ -239,23 +334,25 @@ def compute_all_yukawas(
     """
     # Import dependencies (local import to avoid circular deps)
     from neutrinos.neutrinoValues import compute_masses, get_pmns
-    from warpConfig.baseParams import MPL, get_warp_params
-    from warpConfig.wavefuncs import f_IR, f_UV
+    from warpConfig.baseParams import MPL, warp_epsilon
+    from warpConfig.wavefuncs import f_IR_from_logeps, f_UV_from_logeps
 
     # Set defaults
     if k is None:
         k = MPL
 
-    # Compute geometry
-    geom_params = get_warp_params(k=k, Lambda_IR=Lambda_IR)
-    epsilon = geom_params['epsilon']
+    # Compute geometry: only epsilon is needed, not the full parameter dict
+    epsilon = warp_epsilon(k, Lambda_IR)
 
-    # Compute overlap factors
+    # Compute overlap factors: one elementwise f_IR call over (c_L, c_E, c_N),
+    # sharing log(epsilon) with the f_UV call.
+    log_eps = np.log(epsilon)
     c_E_arr = np.asarray(c_E, dtype=float)
-    f_L_val = float(f_IR(c_L, epsilon))
-    f_E_vals = f_IR(c_E_arr, epsilon)
-    f_N_val = float(f_IR(c_N, epsilon))
-    f_N_UV_val = float(f_UV(c_N, epsilon))
+    f_IR_vals = f_IR_from_logeps(np.concatenate(([c_L], c_E_arr.ravel(), [c_N])), log_eps)
+    f_L_val = float(f_IR_vals[0])
+    f_E_vals = f_IR_vals[1:-1].reshape(c_E_arr.shape)
+    f_N_val = float(f_IR_vals[-1])
+    f_N_UV_val = float(f_UV_from_logeps(c_N, log_eps))
 
     # Compute neutrino mass spectrum
     m1, m2, m3, M_sum = compute_masses(lightest_nu_mass, ordering)
@@ -281,34 +378,140 @@ def compute_all_yukawas(
     )
 
     # Construct full neutrino Yukawa matrix with PMNS
-    # In the charged-lepton mass basis: Y_N → V_PMNS · diag(Y_N)
+    # In the charged-lepton mass basis: Y_N → V_PMNS · diag(Y_N), i.e. column j
+    # of V_PMNS scaled by Y_N[j] (get_pmns is cached on its arguments).
     V_pmns = get_pmns(ordering, majorana_alpha, majorana_beta)
-    Y_N_diag = np.diag(nu_result['Y_N'])
-    Y_N_matrix = V_pmns @ Y_N_diag
+    Y_N_matrix = V_pmns * nu_result.Y_N
 
     # Assemble result
     return YukawaResult(
         Y_E=cl_result['Y_E'],
         Y_E_bar=cl_result['Y_E_bar'],
-        Y_N=nu_result['Y_N'],
-        Y_N_bar=nu_result['Y_N_bar'],
+        Y_N=nu_result.Y_N,
+        Y_N_bar=nu_result.Y_N_bar,
         Y_N_matrix=Y_N_matrix,
         f_L=f_L_val,
         f_E=f_E_vals,
         f_N=f_N_val,
         f_N_UV=f_N_UV_val,
         epsilon=epsilon,
+        params=_YukawaParams((
+            Lambda_IR, c_L, c_E_arr.tolist(), c_N, M_N, lightest_nu_mass,
+            ordering, majorana_alpha, majorana_beta, k, v,
+        )),
+    )
+
+
+def compute_all_yukawas_batch(
+    Lambda_IR: float,
+    c_L: Union[float, np.ndarray],
+    c_E: np.ndarray,
+    c_N: Union[float, np.ndarray],
+    M_N: Union[float, np.ndarray],
+    lightest_nu_mass: Union[float, np.ndarray] = 0.0,
+    ordering: str = 'normal',
+    majorana_alpha: float = 0.0,
+    majorana_beta: float = 0.0,
+    k: Optional[float] = None,
+    v: float = 174.0,
+    overlaps: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None,
+    dtype: DTypeLike = np.float64,
+) -> YukawaResultBatch:
+    """
+    Vectorized :func:`compute_all_yukawas` over many points at one Lambda_IR.
+
+    ``c_L``, ``c_N``, ``M_N`` and ``lightest_nu_mass`` broadcast to shape
+    ``(N,)`` and ``c_E`` to ``(N, 3)``.  Points that the scalar function would
+    reject (non-positive overlap factors, ``M_N`` or a negative lightest mass)
+    are returned as NaN and flagged in ``'valid'`` instead of raising.
+
+    ``overlaps`` optionally supplies ``(f_L, f_E, f_N, f_N_UV)`` already
+    evaluated at these points and this Lambda_IR (e.g. looked up from a
+    per-scan table), skipping the ``f_IR``/``f_UV`` calls.
+
+    ``dtype`` sets the float type of the arithmetic and of the returned
+    arrays.  ``np.float32`` halves the memory traffic for exploratory scans;
+    it carries ~1e-6 relative error, and overlaps that underflow float32
+    (c far from 0.5) come back as invalid points.
+
+    Returns
+    -------
+    YukawaResultBatch
+        One array per :class:`YukawaResult` field plus the ``valid`` mask.
+    """
+    from neutrinos.neutrinoValues import _mass_spectrum, _ordering_index, get_pmns
+    from warpConfig.baseParams import MPL, warp_epsilon
+    from warpConfig.wavefuncs import f_IR_from_logeps, f_UV_from_logeps
+
+    from .constants import EV_TO_GEV, LEPTON_MASSES
+
+    if k is None:
+        k = MPL
+
+    epsilon = warp_epsilon(k, Lambda_IR)
+
+    c_E_arr = np.atleast_2d(np.asarray(c_E, dtype=dtype))
+    if c_E_arr.shape[-1] != 3:
+        raise ValueError(f"c_E must have shape (N, 3), got {c_E_arr.shape}")
+    c_L_arr, c_N_arr, M_N_arr, m_light = np.broadcast_arrays(
+        *(np.asarray(x, dtype=dtype) for x in (c_L, c_N, M_N, lightest_nu_mass)),
+        c_E_arr[:, 0],
+    )[:4]
+    c_E_arr = np.broadcast_to(c_E_arr, c_L_arr.shape + (3,))
+
+    if overlaps is None:
+        log_eps = np.log(epsilon)
+        f_L = f_IR_from_logeps(c_L_arr, log_eps, dtype)
+        f_E = f_IR_from_logeps(c_E_arr, log_eps, dtype)
+        f_N = f_IR_from_logeps(c_N_arr, log_eps, dtype)
+        f_N_UV = f_UV_from_logeps(c_N_arr, log_eps, dtype)
+    else:
+        f_L, f_E, f_N, f_N_UV = (np.asarray(f, dtype=dtype) for f in overlaps)
+    valid = (
+        (f_L > 0) & np.all(f_E > 0, axis=-1) & (f_N > 0) & (f_N_UV > 0)
+        & (M_N_arr > 0) & (m_light >= 0)
+    )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Same arithmetic as compute_charged_lepton_yukawas / compute_neutrino_yukawas.
+        inv_2k = 0.5 / k
+        m_E = np.asarray(LEPTON_MASSES, dtype=dtype)
+        Y_E_bar = m_E / (v * f_L[:, None] * f_E)
+        Y_E = Y_E_bar * inv_2k
+
+        m_nu_eV = np.stack(_mass_spectrum(m_light, _ordering_index(ordering)), axis=-1)
+        prefactor_bar = (2.0 * f_N_UV**2 * M_N_arr) / (v**2 * f_L**2 * f_N**2)
+        Y_N_bar = np.sqrt(m_nu_eV * (EV_TO_GEV * prefactor_bar)[:, None])
+        Y_N = Y_N_bar * inv_2k
+
+    for arr in (Y_E, Y_E_bar, Y_N, Y_N_bar):
+        arr[~valid] = np.nan
+
+    V_pmns = get_pmns(ordering, majorana_alpha, majorana_beta)
+    V_pmns = V_pmns.astype(np.result_type(dtype, np.complex64), copy=False)
+    return YukawaResultBatch(
+        Y_E=Y_E,
+        Y_E_bar=Y_E_bar,
+        Y_N=Y_N,
+        Y_N_bar=Y_N_bar,
+        Y_N_matrix=V_pmns * Y_N[:, None, :],
+        f_L=f_L,
+        f_E=f_E,
+        f_N=f_N,
+        f_N_UV=f_N_UV,
+        valid=valid,
+        epsilon=epsilon,
         params={
             'Lambda_IR': Lambda_IR,
-            'c_L': c_L,
-            'c_E': c_E_arr.tolist(),
-            'c_N': c_N,
-            'M_N': M_N,
-            'lightest_nu_mass': lightest_nu_mass,
+            'c_L': c_L_arr,
+            'c_E': c_E_arr,
+            'c_N': c_N_arr,
+            'M_N': M_N_arr,
+            'lightest_nu_mass': m_light,
             'ordering': ordering,
             'majorana_alpha': majorana_alpha,
             'majorana_beta': majorana_beta,
             'k': k,
             'v': v,
-        }
+        },
     )
@@ -37,58 +37,117 @@ Reference:
     Perez & Randall, arXiv:0805.4652, Eq. (6)
 """
 
-from typing import Dict, Tuple, Union
+import math
+from collections.abc import Mapping
+from typing import Dict, Iterator, Tuple, Union
 
 import numpy as np
+from numpy.typing import ArrayLike
 
 from .constants import EV_TO_GEV
 
+# Inputs of these types take the plain-float path of compute_neutrino_yukawas.
+_SCALAR = (int, float)
+
+# Electroweak VEV (GeV) used when v is not given.
+_DEFAULT_V = 174.0
+
+
+class NeutrinoYukawas(Mapping):
+    """Result of :func:`compute_neutrino_yukawas`.
+
+    A read-only mapping over ``Y_N``, ``Y_N_bar`` and ``masses_eV`` that
+    behaves like the dict it replaces (``result['Y_N']``, ``in``, ``.get``,
+    ``.keys()``, ``dict(result)``), with the same values also available as
+    attributes.  The slots keep each call to one small object.
+    """
+
+    __slots__ = ('Y_N', 'Y_N_bar', 'masses_eV')
+    _fields = ('Y_N', 'Y_N_bar', 'masses_eV')
+
+    def __init__(self, Y_N: np.ndarray, Y_N_bar: np.ndarray, masses_eV: np.ndarray):
+        self.Y_N = Y_N
+        self.Y_N_bar = Y_N_bar
+        self.masses_eV = masses_eV
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"NeutrinoYukawas({fields})"
+
+    def asdict(self) -> Dict[str, np.ndarray]:
+        return dict(self)
+
+    def is_perturbative(self, max_Y_bar: float = 4.0) -> Union[bool, np.ndarray]:
+        """``|Ȳ_N| < max_Y_bar`` for all three generations, per point.
+
+        The generation axis is last, so a grid result of shape ``S + (3,)``
+        filters to a boolean mask of shape ``S`` in one call.
+        """
+        return np.all(np.abs(self.Y_N_bar) < max_Y_bar, axis=-1)
+
 
 def compute_neutrino_yukawas(
-    f_L: float,
-    f_N: float,
-    f_N_UV: float,
-    M_N: float,
+    f_L: ArrayLike,
+    f_N: ArrayLike,
+    f_N_UV: ArrayLike,
+    M_N: ArrayLike,
     neutrino_masses_eV: Union[np.ndarray, Tuple[float, float, float]],
-    k: float,
-    v: float = 174.0
-) -> Dict[str, np.ndarray]:
+    k: ArrayLike,
+    v: ArrayLike = _DEFAULT_V
+) -> NeutrinoYukawas:
     """
     Compute neutrino Yukawa eigenvalues from the seesaw formula.
 
     This inverts the Type-I seesaw formula in the universal limit where
     c_L, c_N, and M_N are generation-independent.
 
+    Every input broadcasts: scalars give one point, and arrays of any
+    broadcastable shape ``S`` (with masses of shape ``(3,)`` or ``S + (3,)``)
+    evaluate a whole parameter grid in one NumPy pass.  To scan the mass
+    spectrum at fixed geometry, pass scalar overlaps with masses of shape
+    ``(N, 3)``: the seesaw prefactor is then evaluated once for all N rows.
+
     Parameters
     ----------
-    f_L : float
+    f_L : float or array-like
         IR overlap factor for lepton doublets (universal).
-    f_N : float
+    f_N : float or array-like
         IR overlap factor for RH neutrinos (universal).
         Computed as f_IR(c_N, epsilon).
-    f_N_UV : float
+    f_N_UV : float or array-like
         UV overlap factor for RH neutrinos.
         Computed as f_UV(c_N, epsilon).
         This enters the canonical normalization of the Majorana mass.
-    M_N : float
+    M_N : float or array-like
         UV-localized Majorana mass scale (GeV).
         Typically M_N ~ M_Pl/10 or similar.
-    neutrino_masses_eV : array-like of shape (3,)
+    neutrino_masses_eV : array-like of shape (..., 3)
         Light neutrino masses (m_1, m_2, m_3) in eV.
         Use neutrinoValues.compute_masses() to get these from oscillation data.
-    k : float
+    k : float or array-like
         AdS curvature scale (GeV). Typically ~M_Planck.
-    v : float, optional
+    v : float or array-like, optional
         Electroweak VEV (GeV). Default 174 GeV.
 
     Returns
     -------
-    dict with keys:
-        'Y_N' : np.ndarray of shape (3,)
+    NeutrinoYukawas with fields:
+        Y_N : np.ndarray of shape (..., 3)
             Neutrino Yukawa eigenvalues (dimension [mass]^{-1}).
-        'Y_N_bar' : np.ndarray of shape (3,)
+        Y_N_bar : np.ndarray of shape (..., 3)
             Rescaled (dimensionless) Yukawas Ȳ_{N_i} = 2k · Y_{N_i}.
-        'masses_eV' : np.ndarray of shape (3,)
+        masses_eV : np.ndarray
             Input neutrino masses (for verification).
 
     Raises
@@ -117,40 +176,116 @@ def compute_neutrino_yukawas(
     >>> f_N_UV = f_UV(0.27, epsilon)
     >>> m1, m2, m3, _ = compute_masses(0.002, 'normal')
     >>> result = compute_neutrino_yukawas(f_L, f_N, f_N_UV, 1.22e18, (m1, m2, m3), MPL)
-    >>> print(result['Y_N_bar'])  # Should be O(0.2) to O(1.0)
+    >>> print(result.Y_N_bar)  # Should be O(0.2) to O(1.0)
+
+    A whole (c_L, c_N) grid in one call, one row of three Yukawas per point:
+
+    >>> c_L = np.linspace(0.50, 0.70, 50)[:, None]
+    >>> c_N = np.linspace(0.10, 0.40, 40)
+    >>> grid = compute_neutrino_yukawas(
+    ...     f_IR(c_L, epsilon), f_IR(c_N, epsilon), f_UV(c_N, epsilon),
+    ...     1.22e18, (m1, m2, m3), MPL)
+    >>> grid.Y_N_bar.shape
+    (50, 40, 3)
     """
-    # Convert to numpy array and eV to GeV
+    # Convert to numpy array (eV; the GeV conversion is in the prefactor)
     m_nu_eV = np.asarray(neutrino_masses_eV, dtype=float)
-    m_nu_GeV = m_nu_eV * EV_TO_GEV
-
-    # Validate inputs
-    if f_L <= 0:
-        raise ValueError(f"f_L must be positive, got {f_L}")
-    if f_N <= 0:
-        raise ValueError(f"f_N must be positive, got {f_N}")
-    if f_N_UV <= 0:
-        raise ValueError(f"f_N_UV must be positive, got {f_N_UV}")
-    if M_N <= 0:
-        raise ValueError(f"M_N must be positive, got {M_N}")
-    if m_nu_eV.shape != (3,):
-        raise ValueError(f"neutrino_masses_eV must have shape (3,), got {m_nu_eV.shape}")
-    if np.any(m_nu_eV < 0):
+
+    grid = not (
+        isinstance(f_L, _SCALAR) and isinstance(f_N, _SCALAR) and isinstance(f_N_UV, _SCALAR)
+        and isinstance(M_N, _SCALAR) and isinstance(k, _SCALAR) and isinstance(v, _SCALAR)
+    )
+    # A single point of plain floats skips NumPy below (np.any alone costs
+    # more than the whole float computation).
+    point = not grid and m_nu_eV.shape == (3,)
+    m_vals = m_nu_eV.tolist() if point else None
+    _validate_inputs(f_L, f_N, f_N_UV, M_N, m_nu_eV, m_vals, grid)
+
+    if point:
+        Y_N, Y_N_bar = _seesaw_point(f_L, f_N, f_N_UV, M_N, m_vals, k, v)
+    else:
+        if grid:
+            # Parameter grids: a trailing axis lines each point up with the
+            # generation axis of the masses, so the formulas below broadcast.
+            # Plain-float inputs (usually k and the default v) stay floats, so
+            # v * v and 0.5 / k are scalar arithmetic, not array passes.
+            f_L, f_N, f_N_UV, M_N, k, v = (
+                x if isinstance(x, _SCALAR) else np.asarray(x, dtype=float)[..., None]
+                for x in (f_L, f_N, f_N_UV, M_N, k, v)
+            )
+
+        # Compute rescaled (dimensionless) Yukawas (zero masses give zero),
+        # taking the root in place
+        Y_N_bar = m_nu_eV * _prefactor_bar_eV(f_L, f_N, f_N_UV, M_N, v)
+        np.sqrt(Y_N_bar, out=Y_N_bar)
+
+        # Compute Y_N = Ȳ_N / 2k
+        Y_N = Y_N_bar * (0.5 / k)
+
+    return NeutrinoYukawas(Y_N, Y_N_bar, m_nu_eV)
+
+
+def compute_neutrino_yukawas_unchecked(
+    f_L: float,
+    f_N: float,
+    f_N_UV: float,
+    M_N: float,
+    neutrino_masses_eV: Tuple[float, float, float],
+    k: float,
+    v: float = _DEFAULT_V
+) -> NeutrinoYukawas:
+    """
+    :func:`compute_neutrino_yukawas` for one point, without input validation.
+
+    For inner scan loops whose inputs were validated once up front: the
+    arguments must be positive floats and three non-negative masses.
+    Nothing is checked, so bad inputs give NaN/inf or a ``math`` domain
+    error instead of a ``ValueError``.  Results are bit-identical to the
+    validated function.
+    """
+    Y_N, Y_N_bar = _seesaw_point(f_L, f_N, f_N_UV, M_N, neutrino_masses_eV, k, v)
+    return NeutrinoYukawas(Y_N, Y_N_bar, np.array(neutrino_masses_eV, dtype=float))
+
+
+def _validate_inputs(f_L, f_N, f_N_UV, M_N, m_nu_eV, m_vals, grid) -> None:
+    """Raise ``ValueError`` for inputs :func:`compute_neutrino_yukawas` rejects."""
+    for name, value in (("f_L", f_L), ("f_N", f_N), ("f_N_UV", f_N_UV), ("M_N", M_N)):
+        if np.any(np.less_equal(value, 0)) if grid else value <= 0:
+            raise ValueError(f"{name} must be positive, got {value}")
+    if m_nu_eV.shape[-1:] != (3,):
+        raise ValueError(f"neutrino_masses_eV must have shape (..., 3), got {m_nu_eV.shape}")
+    # Reductions without a temporary bool array: three float compares for a
+    # point, and fmin (which skips NaN like the old np.any(m < 0)) otherwise.
+    if m_vals is not None:
+        negative = m_vals[0] < 0 or m_vals[1] < 0 or m_vals[2] < 0
+    else:
+        negative = m_nu_eV.size > 0 and np.fmin.reduce(m_nu_eV, axis=None) < 0
+    if negative:
         raise ValueError(f"Neutrino masses cannot be negative, got {m_nu_eV}")
 
-    # Compute the seesaw prefactor
-    # From: m_ν = (2 k² v² f²_L f²_N) / ((f^UV_N)² M_N) · Y²_N
-    # Solve for Y²_N: Y²_N = m_ν · (f^UV_N)² · M_N / (2 k² v² f²_L f²_N)
-    prefactor = (f_N_UV**2 * M_N) / (2.0 * k**2 * v**2 * f_L**2 * f_N**2)
 
-    # Compute Y_N (handle zero masses gracefully)
-    Y_N_sq = m_nu_GeV * prefactor
-    Y_N = np.sqrt(Y_N_sq)
+def _prefactor_bar_eV(f_L, f_N, f_N_UV, M_N, v):
+    """Ȳ²_N per eV of m_ν, for floats or broadcast arrays.
+
+    From: m_ν = (2 k² v² f²_L f²_N) / ((f^UV_N)² M_N) · Y²_N
+    Solve for Y²_N: Y²_N = m_ν · (f^UV_N)² · M_N / (2 k² v² f²_L f²_N),
+    so Ȳ²_N = (2k)² Y²_N = m_ν · 2 (f^UV_N)² · M_N / (v² f²_L f²_N)
+    (x * x rather than x**2: correctly rounded, like the batch path's
+    np.square, and no float pow dispatch.)  EV_TO_GEV is folded in here so
+    the masses are used in eV without a separate conversion multiply.
+    """
+    return EV_TO_GEV * (
+        (2.0 * f_N_UV * f_N_UV * M_N) / ((v * v) * (f_L * f_L) * (f_N * f_N))
+    )
 
-    # Compute rescaled (dimensionless) Yukawas
-    Y_N_bar = 2.0 * k * Y_N
 
-    return {
-        'Y_N': Y_N,
-        'Y_N_bar': Y_N_bar,
-        'masses_eV': m_nu_eV,
-    }
+def _seesaw_point(f_L, f_N, f_N_UV, M_N, m_vals, k, v) -> Tuple[np.ndarray, np.ndarray]:
+    """``(Y_N, Y_N_bar)`` for one point of plain floats.
+
+    math.sqrt on three floats beats ufunc dispatch on a 3-element array and
+    rounds identically (zero masses give zero).
+    """
+    prefactor_bar_eV = _prefactor_bar_eV(f_L, f_N, f_N_UV, M_N, v)
+    Y_N_bar = [math.sqrt(m * prefactor_bar_eV) for m in m_vals]
+    inv_2k = 0.5 / k
+    return np.array([y * inv_2k for y in Y_N_bar]), np.array(Y_N_bar)